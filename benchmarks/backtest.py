@@ -0,0 +1,62 @@
+"""Backtest timings on a synthetic daily price panel.
+
+Builds random-walk prices for each universe size over the requested
+years. It reports the best wall time of forecast-strategy targets, one
+simulated run with costs and a turnover cap, and a batch of runs
+sweeping top-k and costs. Results are JSON.
+
+Example:
+    python -m benchmarks.backtest --assets 100 1000 --years 10 --every 5
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+import numpy as np
+
+from benchmarks.forecasting import best_time
+from quantgpt.backtest import backtest, forecast_strategy, rebalance_schedule, simulate
+from quantgpt.backtest.engine import TRADING_DAYS
+
+
+def make_prices(n_assets: int, n_obs: int, seed: int = 0) -> np.ndarray:
+    """Geometric random walks with 1% daily volatility and a small drift."""
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.standard_normal((n_assets, n_obs)) * 0.01 + 2e-4, axis=1))
+
+
+def run_benchmark(assets: list[int], years: int, every: int, runs: int, repeat: int) -> dict[str, Any]:
+    """Time targets, a single simulation and a batched sweep per universe size."""
+    n_obs = years * TRADING_DAYS
+    results = []
+    for n in assets:
+        prices = make_prices(n, n_obs)
+        rebalance = rebalance_schedule(n_obs, every=every, start=60)
+        targets = forecast_strategy(prices, rebalance, lookback=60, top=max(1, n // 20))
+        grid = [{"lookback": 60, "top": max(1, n * (i + 1) // (4 * runs))} for i in range(runs)]
+        cases = {
+            "targets": lambda: forecast_strategy(prices, rebalance, lookback=60, top=max(1, n // 20)),
+            "simulate": lambda: simulate(prices, targets, rebalance, cost_bps=5, max_turnover=0.5),
+            f"sweep_{runs}": lambda: backtest(prices, forecast_strategy, rebalance, grid=grid, cost_bps=5),
+        }
+        timings = {name: round(best_time(fn, repeat) * 1000, 1) for name, fn in cases.items()}
+        results.append({"assets": n, "bars": n_obs, "rebalances": int(rebalance.size), "ms": timings})
+    return {"results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT backtest timings")
+    parser.add_argument("--assets", type=int, nargs="+", default=[100, 1000], help="Universe sizes")
+    parser.add_argument("--years", type=int, default=10, help="Years of daily bars")
+    parser.add_argument("--every", type=int, default=5, help="Bars between rebalances")
+    parser.add_argument("--runs", type=int, default=4, help="Parameter sets in the sweep")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.assets, args.years, args.every, args.runs, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Prompt compaction timings and savings on a synthetic news feed.
+
+Builds feeds in which a share of the headlines are rewrites of earlier
+stories (case, punctuation and a few words changed, as wire copies are).
+For each feed size it reports the best wall time of compact_news(), the
+items kept and the duplicates dropped, and the estimated prompt tokens
+before and after. Results are JSON.
+
+Example:
+    python -m benchmarks.compaction --items 50 500 --duplicates 0.5 --budget 1024
+"""
+
+import argparse
+import json
+import random
+import sys
+from typing import Any
+
+from benchmarks.forecasting import best_time
+from quantgpt.agents.compaction import NewsItem, compact_news
+
+_COMPANIES = ["Apple", "Microsoft", "Nvidia", "Tesla", "Amazon", "Alphabet", "Meta", "Netflix", "Intel", "Oracle"]
+_EVENTS = [
+    "reports record quarterly revenue as cloud demand accelerates",
+    "shares slide after regulators open antitrust probe",
+    "announces share buyback and raises dividend",
+    "cuts full-year guidance on weaker consumer spending",
+    "unveils new AI chips for data centers",
+    "beats analyst expectations on strong services growth",
+    "faces supply chain delays in key Asian markets",
+    "names new chief financial officer",
+]
+_REWRITES = [
+    str.upper,
+    lambda s: s.replace(" as ", " while "),
+    lambda s: s + " - sources",
+    lambda s: s.rstrip(".") + ".",
+]
+
+
+def make_feed(n_items: int, duplicates: float, seed: int = 0) -> list[NewsItem]:
+    """n_items headlines, about a duplicates fraction of them rewrites of earlier ones."""
+    rng = random.Random(seed)
+    items: list[NewsItem] = []
+    for i in range(n_items):
+        if items and rng.random() < duplicates:
+            text = rng.choice(_REWRITES)(rng.choice(items).text)
+        else:
+            text = f"{rng.choice(_COMPANIES)} {rng.choice(_EVENTS)} ({rng.randrange(10**6)})"
+        items.append(NewsItem(text, 1.7e9 + 600.0 * i, rng.uniform(-1, 1)))
+    return items
+
+
+def run_benchmark(items: list[int], duplicates: float, budget: int, repeat: int) -> dict[str, Any]:
+    """Time compaction and report its savings for each feed size."""
+    results = []
+    for n in items:
+        feed = make_feed(n, duplicates)
+        stats = compact_news(feed, token_budget=budget).stats
+        seconds = best_time(lambda: compact_news(feed, token_budget=budget), repeat)
+        results.append(
+            {
+                "items": n,
+                "ms": round(seconds * 1000, 3),
+                "kept": stats.items_out,
+                "duplicates": stats.duplicates,
+                "tokens_in": stats.tokens_in,
+                "tokens_out": stats.tokens_out,
+                "tokens_saved": stats.tokens_saved,
+            }
+        )
+    return {"duplicates": duplicates, "budget": budget, "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT prompt compaction timings")
+    parser.add_argument("--items", type=int, nargs="+", default=[50, 500], help="Headlines per feed")
+    parser.add_argument("--duplicates", type=float, default=0.5, help="Share of headlines that rewrite an earlier one")
+    parser.add_argument("--budget", type=int, default=1024, help="News token budget")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.items, args.duplicates, args.budget, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Covariance estimator timings by universe size.
+
+For each universe size, reports the best wall time of:
+
+- each batch estimator over one window
+- one rolling step, as a full recompute and as a RollingCovariance rank-one
+  add/drop update
+- a CovarianceCache hit
+
+Output is JSON.
+
+Example:
+    python -m benchmarks.covariance --assets 100 500 1000 --window 250
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from benchmarks.forecasting import best_time
+from benchmarks.portfolio import make_returns
+from quantgpt.portfolio import CovarianceCache, RollingCovariance, estimate_covariance
+
+
+def run_benchmark(assets: list[int], window: int, repeat: int) -> dict[str, Any]:
+    """Time estimators, rolling updates and cache hits for each universe size."""
+    results = []
+    for n in assets:
+        returns = make_returns(n, n_periods=window + repeat + 1)
+        rolling = RollingCovariance(n, window).update_many(returns[:window])
+        nxt = iter(returns[window:])
+        universe = tuple(range(n))
+        cache = CovarianceCache()
+        estimate_covariance(returns[:window], universe=universe, window_end=window, cache=cache)
+        cases = {
+            "sample": lambda: estimate_covariance(returns[:window]),
+            "ledoit_wolf": lambda: estimate_covariance(returns[:window], "ledoit_wolf"),
+            "constant_correlation": lambda: estimate_covariance(returns[:window], "constant_correlation"),
+            "ewma": lambda: estimate_covariance(returns[:window], "ewma"),
+            "roll_recompute": lambda: estimate_covariance(returns[1 : window + 1]),
+            "roll_rank_one": lambda: rolling.update(next(nxt)).covariance(),
+            "cache_hit": lambda: estimate_covariance(
+                returns[:window], universe=universe, window_end=window, cache=cache
+            ),
+        }
+        timings = {name: round(best_time(fn, repeat) * 1000, 3) for name, fn in cases.items()}
+        results.append({"assets": n, "window": window, "ms": timings})
+    return {"results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT covariance estimator timings")
+    parser.add_argument("--assets", type=int, nargs="+", default=[100, 250, 500, 1000], help="Universe sizes")
+    parser.add_argument("--window", type=int, default=250, help="Observations per window")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.assets, args.window, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Local stand-in for a JSON news API.
+
+`GET /news?q=<term>` returns `{"articles": [...]}` with the records whose
+symbols or topics match the term (all records without q), in the JSONL feed
+schema. Responses carry an ETag and Last-Modified and answer conditional
+requests with 304. Setting `app.state.fail_next` makes that many requests
+fail with `app.state.fail_status` (and `Retry-After` when
+`app.state.retry_after` is set), to exercise client retries.
+
+Run standalone:
+    python -m benchmarks.fake_news --port 8081
+"""
+
+import argparse
+import hashlib
+import json
+from email.utils import formatdate
+from typing import Any
+
+from fastapi import FastAPI, Request, Response
+
+SAMPLE_ARTICLES: list[dict[str, Any]] = [
+    {"timestamp": "2025-01-02T14:30:00Z", "symbols": ["AAPL"], "headline": "Apple beats earnings estimates", "id": "1"},
+    {"timestamp": "2025-01-02T15:00:00Z", "symbols": ["MSFT"], "headline": "Microsoft expands cloud deal", "id": "2"},
+    {"timestamp": "2025-01-03T09:00:00Z", "topics": ["market"], "headline": "Stocks rally on rate hopes", "id": "3"},
+]
+
+
+def _matches(record: dict[str, Any], term: str) -> bool:
+    return term.upper() in record.get("symbols", ()) or term.lower() in record.get("topics", ())
+
+
+def create_fake_news_app(articles: list[dict[str, Any]] | None = None) -> FastAPI:
+    """Create the fake news API app.
+
+    Parameters
+    ----------
+    articles : list[dict[str, Any]] | None
+        Records served (app.state.articles; replace it to change the feed).
+        Defaults to SAMPLE_ARTICLES.
+    """
+    app = FastAPI(title="Fake News API")
+    app.state.articles = list(SAMPLE_ARTICLES if articles is None else articles)
+    app.state.requests = 0
+    app.state.not_modified = 0
+    app.state.fail_next = 0
+    app.state.fail_status = 503
+    app.state.retry_after = None
+    # Only the feed's version matters to clients, so one timestamp will do.
+    app.state.last_modified = formatdate(usegmt=True)
+
+    @app.get("/news")
+    async def news(request: Request, q: str | None = None) -> Response:
+        app.state.requests += 1
+        if app.state.fail_next > 0:
+            app.state.fail_next -= 1
+            headers = {} if app.state.retry_after is None else {"Retry-After": str(app.state.retry_after)}
+            return Response(status_code=app.state.fail_status, headers=headers)
+
+        records = [r for r in app.state.articles if q is None or _matches(r, q)]
+        body = json.dumps({"articles": records}).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        headers = {"ETag": etag, "Last-Modified": app.state.last_modified}
+        if request.headers.get("if-none-match") == etag:
+            app.state.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake news API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run(create_fake_news_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Local stand-in for Ollama's HTTP API.
+
+Implements the endpoints ChatOllama uses (`POST /api/chat`, streaming and
+non-streaming) plus `GET /api/tags` and `GET /api/version`. Each response is
+`tokens` tokens long and each token takes `token_latency` seconds, so tests
+and benchmarks can model generation time without a GPU or model download.
+
+Run standalone:
+    python -m benchmarks.fake_ollama --port 11434 --token-latency 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def create_fake_ollama_app(
+    token_latency: float = 0.0,
+    tokens: int = 16,
+    models: tuple[str, ...] = ("llama3.2", "mistral"),
+) -> FastAPI:
+    """Create the fake Ollama app.
+
+    Parameters
+    ----------
+    token_latency : float
+        Seconds of simulated generation time per token.
+    tokens : int
+        Tokens per completion.
+    models : tuple[str, ...]
+        Model names reported by /api/tags.
+    """
+    app = FastAPI(title="Fake Ollama")
+    app.state.chat_requests = 0
+
+    def _done_message(model: str, started: float, content: str) -> dict[str, Any]:
+        elapsed_ns = int((time.perf_counter() - started) * 1e9)
+        return {
+            "model": model,
+            "created_at": _now(),
+            "message": {"role": "assistant", "content": content},
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": elapsed_ns,
+            "eval_count": tokens,
+            "eval_duration": elapsed_ns,
+            "prompt_eval_count": 0,
+        }
+
+    @app.get("/api/version")
+    async def version() -> dict[str, str]:
+        return {"version": "0.0.0-fake"}
+
+    @app.get("/api/tags")
+    async def tags() -> dict[str, Any]:
+        return {"models": [{"name": m, "model": m, "modified_at": _now(), "size": 0} for m in models]}
+
+    @app.post("/api/chat")
+    async def chat(request: Request) -> Any:
+        body = await request.json()
+        model = body.get("model", models[0])
+        app.state.chat_requests += 1
+        started = time.perf_counter()
+        words = [f"tok{i} " for i in range(tokens)]
+
+        if not body.get("stream", True):
+            await asyncio.sleep(token_latency * tokens)
+            return JSONResponse(_done_message(model, started, "".join(words)))
+
+        async def ndjson() -> AsyncIterator[bytes]:
+            for word in words:
+                if token_latency:
+                    await asyncio.sleep(token_latency)
+                chunk = {
+                    "model": model,
+                    "created_at": _now(),
+                    "message": {"role": "assistant", "content": word},
+                    "done": False,
+                }
+                yield (json.dumps(chunk) + "\n").encode()
+            yield (json.dumps(_done_message(model, started, "")) + "\n").encode()
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Ollama server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--token-latency", type=float, default=0.01, help="Seconds per token")
+    parser.add_argument("--tokens", type=int, default=16, help="Tokens per completion")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run(
+        create_fake_ollama_app(token_latency=args.token_latency, tokens=args.tokens),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Forecasting engine scaling with series count and length.
+
+Forecasts synthetic random-walk panels of every (series, length) size with
+each model and reports the best wall time and series/sec as JSON. For the
+smallest panel it also times a per-series loop over the same engine, which
+shows how much batching across symbols saves.
+
+Example:
+    python -m benchmarks.forecasting --series 100 1000 10000 --length 250 1000
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any
+
+import numpy as np
+
+from quantgpt.forecasting import MODELS, forecast
+
+# Model parameters used in the benchmark (the defaults otherwise).
+PARAMS: dict[str, dict[str, Any]] = {"ar": {"p": 3}, "holt_winters": {"period": 5}}
+
+
+def make_panel(n_series: int, length: int, seed: int = 0) -> np.ndarray:
+    """Return an (n_series, length) panel of random-walk prices."""
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.standard_normal((n_series, length)), axis=1)
+
+
+def best_time(fn, repeat: int) -> float:
+    """Best wall time of fn() over repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(series: list[int], lengths: list[int], steps: int, repeat: int) -> dict[str, Any]:
+    """Time every model on every panel size and return the report."""
+    results = []
+    for length in lengths:
+        for n in series:
+            panel = make_panel(n, length)
+            for model in MODELS:
+                params = PARAMS.get(model, {})
+                seconds = best_time(lambda: forecast(panel, steps, model, **params), repeat)
+                results.append(
+                    {
+                        "model": model,
+                        "series": n,
+                        "length": length,
+                        "ms": round(seconds * 1000, 3),
+                        "series_per_sec": round(n / seconds, 1),
+                    }
+                )
+
+    panel = make_panel(min(series), min(lengths))
+    loop_speedup = {}
+    for model in MODELS:
+        params = PARAMS.get(model, {})
+        batched = best_time(lambda: forecast(panel, steps, model, **params), repeat)
+        looped = best_time(lambda: [forecast(row, steps, model, **params) for row in panel], 1)
+        loop_speedup[model] = round(looped / batched, 1)
+    return {
+        "steps": steps,
+        "results": results,
+        "batch_vs_loop_speedup": {"series": len(panel), "length": panel.shape[1], **loop_speedup},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT forecasting engine scaling")
+    parser.add_argument("--series", type=int, nargs="+", default=[100, 1000, 10_000], help="Series counts")
+    parser.add_argument("--length", type=int, nargs="+", default=[250, 1000], help="Observations per series")
+    parser.add_argument("--steps", type=int, default=10, help="Forecast horizon")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.series, args.length, args.steps, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
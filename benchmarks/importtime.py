@@ -0,0 +1,93 @@
+"""Import-time budgets for CLI cold start and API worker boot.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters,
+takes the best cumulative time over several runs, and checks it against a
+budget. Also checks that entry points do not drag in heavy frameworks they
+do not need (e.g. the CLI must not import LangGraph). Exit code 1 if any
+budget or import rule is violated.
+
+Example:
+    python -m benchmarks.importtime --runs 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Import-time budget for one module."""
+
+    module: str
+    max_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+_HEAVY = ("langgraph", "langchain_core", "langchain_ollama", "vaderSentiment", "httpx")
+
+BUDGETS: tuple[Budget, ...] = (
+    Budget("quantgpt.cli", 25.0, forbidden=_HEAVY),
+    Budget("quantgpt.nlp", 25.0, forbidden=_HEAVY),
+    Budget("quantgpt.tools", 40.0, forbidden=_HEAVY),
+    Budget("quantgpt.agents", 40.0, forbidden=_HEAVY),
+    Budget("quantgpt.api.main", 1000.0, forbidden=("langgraph", "langchain_ollama", "vaderSentiment")),
+)
+
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of module in a fresh interpreter, in ms."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(proc.stderr.splitlines()):
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"No importtime line for {module}")
+
+
+def loaded_modules(module: str, candidates: tuple[str, ...]) -> list[str]:
+    """Which of candidates are in sys.modules after importing module."""
+    code = (
+        "import json, sys\n"
+        f"import {module}\n"
+        f"print(json.dumps(sorted(set(sys.modules) & set({list(candidates)!r}))))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT import-time budgets")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply budgets (slow CI machines)")
+    args = parser.parse_args(argv)
+
+    report = []
+    failed = False
+    for budget in BUDGETS:
+        best = min(import_time_ms(budget.module) for _ in range(args.runs))
+        leaked = loaded_modules(budget.module, budget.forbidden) if budget.forbidden else []
+        ok = best <= budget.max_ms * args.scale and not leaked
+        failed |= not ok
+        report.append(
+            {
+                "module": budget.module,
+                "import_ms": round(best, 2),
+                "budget_ms": budget.max_ms * args.scale,
+                "forbidden_loaded": leaked,
+                "ok": ok,
+            }
+        )
+    print(json.dumps({"results": report}, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
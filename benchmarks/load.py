@@ -0,0 +1,223 @@
+"""End-to-end API load benchmark.
+
+Starts the fake Ollama server and the API (`quantgpt.api.main:app`, i.e.
+`create_app()`) under uvicorn as separate local processes, drives endpoints
+at fixed concurrency levels, and reports req/s, p50/p95/p99 latency and
+error counts as JSON. With --baseline, results are
+compared against a stored run and the exit code is 1 on regression.
+
+Examples:
+    python -m benchmarks.load --output results.json
+    python -m benchmarks.load --baseline benchmarks/baseline.json
+    python -m benchmarks.load --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from benchmarks.server import SubprocessServer, free_port
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One endpoint to drive."""
+
+    method: str
+    path: str
+    body: Callable[[int], dict[str, Any]] | None = None
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "health": Scenario("GET", "/health"),
+    "models": Scenario("GET", "/api/v1/models"),
+    # Distinct queries so single-flight coalescing does not hide LLM cost.
+    "research": Scenario("POST", "/api/v1/research", lambda i: {"query": f"AAPL {i}"}),
+}
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted values (q in [0, 100])."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(q / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    name: str,
+    concurrency: int,
+    requests: int,
+) -> dict[str, Any]:
+    """Send `requests` requests with `concurrency` workers; return summary stats."""
+    scenario = SCENARIOS[name]
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            body = scenario.body(i) if scenario.body else None
+            start = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, scenario.path, json=body)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+
+    # Warm-up: connections, graph, first LLM call.
+    for i in range(min(concurrency, 4)):
+        body = scenario.body(requests + i) if scenario.body else None
+        await client.request(scenario.method, scenario.path, json=body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "endpoint": name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def run_benchmark(
+    endpoints: list[str],
+    levels: list[int],
+    requests: int,
+    token_latency: float,
+    tokens: int,
+    ollama_concurrency: int,
+) -> dict[str, Any]:
+    """Run every (endpoint, concurrency) pair and return the report."""
+    ollama_port, api_port = free_port(), free_port()
+    fake_args = [
+        "-m", "benchmarks.fake_ollama",
+        "--port", str(ollama_port),
+        "--token-latency", str(token_latency),
+        "--tokens", str(tokens),
+    ]
+    api_args = [
+        "-m", "uvicorn", "quantgpt.api.main:app",
+        "--port", str(api_port),
+        "--log-level", "warning",
+        "--no-access-log",
+    ]
+    api_env = {
+        "OLLAMA_BASE_URL": f"http://127.0.0.1:{ollama_port}",
+        "OLLAMA_MAX_CONCURRENCY": str(ollama_concurrency),
+        "LLM_CACHE_MAX_ENTRIES": "0",
+    }
+    with SubprocessServer(fake_args, ollama_port, ready_path="/api/version"):
+        with SubprocessServer(api_args, api_port, env=api_env) as api:
+
+            async def drive() -> list[dict[str, Any]]:
+                limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+                async with httpx.AsyncClient(base_url=api.url, limits=limits, timeout=120) as client:
+                    return [
+                        await run_level(client, name, level, requests)
+                        for name in endpoints
+                        for level in levels
+                    ]
+
+            results = asyncio.run(drive())
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests_per_level": requests,
+            "token_latency": token_latency,
+            "tokens": tokens,
+            "ollama_concurrency": ollama_concurrency,
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2) -> list[str]:
+    """Return regressions of report vs baseline.
+
+    A result regresses if its req/s drops, or its p95 latency rises, by more
+    than `tolerance` (fraction), or if it has errors the baseline did not.
+    Pairs missing from the baseline are skipped.
+    """
+    base = {(r["endpoint"], r["concurrency"]): r for r in baseline.get("results", [])}
+    regressions: list[str] = []
+    for r in report["results"]:
+        b = base.get((r["endpoint"], r["concurrency"]))
+        if b is None:
+            continue
+        label = f"{r['endpoint']}@c={r['concurrency']}"
+        if r["rps"] < b["rps"] * (1 - tolerance):
+            regressions.append(f"{label}: rps {r['rps']} < baseline {b['rps']}")
+        if r["p95_ms"] > b["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {r['p95_ms']}ms > baseline {b['p95_ms']}ms")
+        if r["errors"] > b["errors"]:
+            regressions.append(f"{label}: errors {r['errors']} > baseline {b['errors']}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT API load benchmark")
+    parser.add_argument("--endpoints", nargs="+", choices=sorted(SCENARIOS), default=["health", "models", "research"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per (endpoint, concurrency)")
+    parser.add_argument("--token-latency", type=float, default=0.002, help="Fake Ollama seconds per token")
+    parser.add_argument("--tokens", type=int, default=16, help="Fake Ollama tokens per completion")
+    parser.add_argument("--ollama-concurrency", type=int, default=4, help="OLLAMA_MAX_CONCURRENCY for the app")
+    parser.add_argument("--output", help="Write JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="Compare against this report; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed fractional regression")
+    parser.add_argument("--save-baseline", help="Also write the report here as the new baseline")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        endpoints=args.endpoints,
+        levels=args.concurrency,
+        requests=args.requests,
+        token_latency=args.token_latency,
+        tokens=args.tokens,
+        ollama_concurrency=args.ollama_concurrency,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
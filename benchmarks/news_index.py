@@ -0,0 +1,102 @@
+"""News index build, open and query latency.
+
+Indexes a synthetic corpus (random tickers, event keywords and timestamps),
+then reports build time, index size, time to open the memory-mapped file,
+and p50/p99 query latency over a fixed set of free-form queries as JSON.
+
+Example:
+    python -m benchmarks.news_index --articles 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from benchmarks.load import percentile
+from quantgpt.news import Article, NewsIndex, build_news_index
+
+_MAJORS = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "GOOGL", "META", "JPM", "XOM", "KO"]
+_EVENTS = (
+    "surge slump earnings guidance beat miss rally selloff merger lawsuit "
+    "upgrade downgrade outlook dividend buyback layoffs recall approval"
+).split()
+
+QUERIES = [
+    "AAPL earnings",
+    "what's going on with Apple and Microsoft",
+    "nvidia merger lawsuit",
+    "T17 dividend",
+    "market outlook",
+    "tesla recall downgrade",
+]
+
+
+def synthetic_articles(n: int, seed: int = 0) -> Iterator[Article]:
+    """Yield n articles over ~4 months with 2,000 minor tickers and 10 majors."""
+    rng = random.Random(seed)
+    symbols = _MAJORS + [f"T{i}" for i in range(2000)]
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(n):
+        symbol = rng.choice(symbols)
+        a, b, c = rng.sample(_EVENTS, 3)
+        yield Article(
+            timestamp=base + timedelta(seconds=rng.randrange(10_000_000)),
+            headline=f"{symbol} {a} and {b} as investors weigh {c}",
+            symbols=(symbol,),
+            id=str(i),
+        )
+
+
+def run_benchmark(n_articles: int, repeat: int) -> dict[str, Any]:
+    """Build, open and query an index in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "news.idx")
+        start = time.perf_counter()
+        build_news_index(synthetic_articles(n_articles), path)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = NewsIndex.open(path)
+        open_ms = (time.perf_counter() - start) * 1000
+        try:
+            for query in QUERIES:
+                index.search(query)  # warm pages
+            latencies = []
+            for _ in range(repeat):
+                for query in QUERIES:
+                    start = time.perf_counter()
+                    index.search(query, limit=20)
+                    latencies.append(time.perf_counter() - start)
+        finally:
+            index.close()
+        size = os.path.getsize(path)
+
+    latencies.sort()
+    return {
+        "articles": n_articles,
+        "index_mb": round(size / 1e6, 1),
+        "build_s": round(build_s, 2),
+        "open_ms": round(open_ms, 3),
+        "query_p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "query_p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT news index benchmark")
+    parser.add_argument("--articles", type=int, default=200_000, help="Synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=50, help="Passes over the query set")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.articles, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Mean-variance optimizer timings by universe size.
+
+Builds a synthetic factor-model returns matrix for each universe size and
+reports the best wall time of min-variance, mean-variance, max-Sharpe and
+a 50-point efficient frontier (one batched solve) on one core, as JSON.
+
+Example:
+    python -m benchmarks.portfolio --assets 100 500 1000 --cap 0.05
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+import numpy as np
+
+from benchmarks.forecasting import best_time
+from quantgpt.portfolio import MeanVarianceOptimizer
+
+
+def make_returns(n_assets: int, n_periods: int = 1000, seed: int = 0) -> np.ndarray:
+    """Daily-like returns from 5 factors plus idiosyncratic noise and drift."""
+    rng = np.random.default_rng(seed)
+    factors = rng.standard_normal((n_periods, 5)) @ rng.standard_normal((5, n_assets)) * 0.01
+    drift = rng.uniform(-0.0005, 0.001, n_assets)
+    return factors + rng.standard_normal((n_periods, n_assets)) * 0.02 + drift
+
+
+def run_benchmark(assets: list[int], cap: float, repeat: int) -> dict[str, Any]:
+    """Time each objective for each universe size."""
+    results = []
+    for n in assets:
+        returns = make_returns(n)
+        upper = max(cap, 1.0 / n)
+        opt = MeanVarianceOptimizer.from_returns(returns, upper=upper)
+        cases = {
+            "setup": lambda: MeanVarianceOptimizer.from_returns(returns, upper=upper),
+            "min_variance": opt.min_variance,
+            "mean_variance": lambda: opt.mean_variance(50.0),
+            "max_sharpe": opt.max_sharpe,
+            "frontier_50": lambda: opt.frontier(n_points=50),
+        }
+        timings = {name: round(best_time(fn, repeat) * 1000, 1) for name, fn in cases.items()}
+        results.append({"assets": n, "upper": upper, "ms": timings})
+    return {"results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT portfolio optimizer timings")
+    parser.add_argument("--assets", type=int, nargs="+", default=[100, 250, 500, 1000], help="Universe sizes")
+    parser.add_argument("--cap", type=float, default=0.05, help="Per-asset weight cap")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.assets, args.cap, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Price store timings: ingest, open, zero-copy slices and daily appends.
+
+Builds a store of random prices in a temporary directory and reports:
+
+- bulk ingestion time
+- reader open time
+- the time to take a one-year window of every symbol and of a contiguous
+  50-symbol block
+- the time to sum one window (which reads its pages)
+- the time of a single published daily append
+
+Results are JSON.
+
+Example:
+    python -m benchmarks.price_store --symbols 1000 5000 --years 10
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from benchmarks.forecasting import best_time
+from quantgpt.prices import PriceStore, open_price_store
+
+
+def run_benchmark(symbols: list[int], years: int, repeat: int) -> dict[str, Any]:
+    """Time store operations for each universe size."""
+    n_days = years * 252
+    rng = np.random.default_rng(0)
+    results = []
+    for n in symbols:
+        names = [f"S{i:05d}" for i in range(n)]
+        days = np.datetime64("2000-01-03") + np.arange(n_days)
+        prices = 100 + rng.random((n_days, n))
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            writer = PriceStore.create(Path(tmp) / "prices", names, capacity=n_days)
+            writer.append_many(days, prices)
+            ingest = time.perf_counter() - start
+            reader = open_price_store(writer.path)
+            last_year = (days[-252], days[-1])
+            cases = {
+                "open": lambda: open_price_store(writer.path),
+                "window_all": lambda: reader.window(start=last_year[0], end=last_year[1]),
+                "window_50": lambda: reader.window(symbols=names[:50], start=last_year[0], end=last_year[1]),
+                "read_window_all": lambda: float(reader.window(start=last_year[0], end=last_year[1]).sum()),
+            }
+            timings = {name: round(best_time(fn, repeat) * 1000, 3) for name, fn in cases.items()}
+            day = iter(days[-1] + 1 + np.arange(repeat))
+            timings["append_day"] = round(best_time(lambda: writer.append(next(day), prices[0]), repeat) * 1000, 3)
+            timings["ingest"] = round(ingest * 1000, 1)
+            writer.close()
+        results.append({"symbols": n, "days": n_days, "mb": round(prices.nbytes / 2**20, 1), "ms": timings})
+    return {"results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT price store timings")
+    parser.add_argument("--symbols", type=int, nargs="+", default=[1000, 5000], help="Universe sizes")
+    parser.add_argument("--years", type=int, default=10, help="Years of daily rows")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.symbols, args.years, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
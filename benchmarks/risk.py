@@ -0,0 +1,58 @@
+"""Monte Carlo VaR/CVaR timings by universe size.
+
+For each universe size, builds a factor-model covariance. It reports the
+best wall time of parametric VaR, plus normal and Student-t Monte Carlo
+VaR over the requested paths, chunk size and worker processes. Results
+are JSON, with the estimates so they can be compared.
+
+Example:
+    python -m benchmarks.risk --assets 100 500 --paths 1000000 --workers 4
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+import numpy as np
+
+from benchmarks.forecasting import best_time
+from benchmarks.portfolio import make_returns
+from quantgpt.portfolio import estimate_moments
+from quantgpt.risk import monte_carlo_var, parametric_var
+
+
+def run_benchmark(assets: list[int], paths: int, chunk: int, workers: int, repeat: int) -> dict[str, Any]:
+    """Time each method for each universe size."""
+    results = []
+    for n in assets:
+        mu, cov = estimate_moments(make_returns(n))
+        weights = np.full(n, 1.0 / n)
+        options = dict(confidence=0.99, n_paths=paths, chunk_size=chunk, workers=workers, seed=0)
+        cases = {
+            "parametric": lambda: parametric_var(weights, mu, cov, confidence=0.99),
+            "monte_carlo_normal": lambda: monte_carlo_var(weights, mu, cov, **options),
+            "monte_carlo_t": lambda: monte_carlo_var(weights, mu, cov, distribution="t", **options),
+        }
+        timings, estimates = {}, {}
+        for name, fn in cases.items():
+            timings[name] = round(best_time(fn, repeat) * 1000, 1)
+            estimates[name] = fn()._asdict()
+        results.append({"assets": n, "paths": paths, "ms": timings, "estimates": estimates})
+    return {"workers": workers, "chunk_size": chunk, "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT VaR/CVaR timings")
+    parser.add_argument("--assets", type=int, nargs="+", default=[100, 250, 500], help="Universe sizes")
+    parser.add_argument("--paths", type=int, default=1_000_000, help="Monte Carlo paths")
+    parser.add_argument("--chunk", type=int, default=20_000, help="Paths per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.assets, args.paths, args.chunk, args.workers, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
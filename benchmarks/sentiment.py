@@ -0,0 +1,87 @@
+"""Sentiment scoring throughput: VADER vs the compiled scorer.
+
+Scores a synthetic news corpus (templated headlines with boosters,
+negations, ALL-CAPS emphasis, "but" clauses and punctuation) with each
+backend on one core, bypassing the memo, and reports docs/sec plus the
+largest compound-score difference from VADER as JSON.
+
+Example:
+    python -m benchmarks.sentiment --docs 20000 --repeat 3
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from quantgpt.nlp.sentiment import BACKENDS, _score
+
+_SUBJECTS = ["Apple", "Tesla", "MSFT", "Global markets", "The Fed", "Oil prices", "NVIDIA", "Bond yields"]
+_VERBS = [
+    "surge on strong demand",
+    "slump after weak guidance",
+    "hold steady amid uncertainty",
+    "beat expectations",
+    "miss estimates badly",
+    "rally to record highs",
+    "crash as fears grow",
+    "recover despite concerns",
+]
+_MODIFIERS = ["", "very", "not", "barely", "extremely", "never so", "kind of", "NOT"]
+_TAILS = ["", ", but analysts remain cautious", ", but outlook is great", " as investors cheer", " amid a terrible selloff"]
+_PUNCT = ["", ".", "!", "!!!", "?", "??"]
+
+
+def make_corpus(n: int, seed: int = 0) -> list[str]:
+    """Return n distinct synthetic headlines."""
+    rng = random.Random(seed)
+    docs = []
+    for i in range(n):
+        subject, verb = rng.choice(_SUBJECTS), rng.choice(_VERBS)
+        modifier, tail = rng.choice(_MODIFIERS), rng.choice(_TAILS)
+        words = f"{subject} {modifier} {verb}{tail}".split()
+        if rng.random() < 0.1:
+            k = rng.randrange(len(words))
+            words[k] = words[k].upper()
+        docs.append(f"{' '.join(words)} (story {i}){rng.choice(_PUNCT)}")
+    return docs
+
+
+def throughput(docs: list[str], backend: str, repeat: int) -> float:
+    """Best docs/sec over repeat passes."""
+    _score("warm up", backend)
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in docs:
+            _score(doc, backend)
+        best = max(best, len(docs) / (time.perf_counter() - start))
+    return best
+
+
+def run_benchmark(n_docs: int, repeat: int) -> dict[str, Any]:
+    """Measure every backend on one corpus and return the report."""
+    docs = make_corpus(n_docs)
+    rates = {backend: round(throughput(docs, backend, repeat), 1) for backend in BACKENDS}
+    max_diff = max(abs(_score(d, "fast") - _score(d, "vader")) for d in docs)
+    return {
+        "docs": n_docs,
+        "docs_per_sec": rates,
+        "speedup": round(rates["fast"] / rates["vader"], 2),
+        "max_abs_diff": max_diff,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="QuantGPT sentiment backend throughput")
+    parser.add_argument("--docs", type=int, default=20_000, help="Corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per backend (best is kept)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmark(args.docs, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
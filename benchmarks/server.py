@@ -0,0 +1,131 @@
+"""Run ASGI apps under uvicorn for tests and benchmarks.
+
+BackgroundServer serves an app object on a thread of the current process
+(cheap; used by tests). SubprocessServer runs a command in its own
+interpreter, so load measurements are not skewed by sharing the driver's GIL.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from types import TracebackType
+
+import httpx
+
+import uvicorn
+from starlette.types import ASGIApp
+
+
+class BackgroundServer:
+    """Serve an ASGI app on 127.0.0.1 from a daemon thread.
+
+    Binds an ephemeral port up front so the URL is known before startup.
+    Use as a context manager, or call start() / stop().
+    """
+
+    def __init__(self, app: ASGIApp, port: int = 0, log_level: str = "warning") -> None:
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", port))
+        self.port = self._sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{self.port}"
+        config = uvicorn.Config(app, log_level=log_level, lifespan="on", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [self._sock]}, daemon=True
+        )
+
+    def start(self, timeout: float = 10.0) -> "BackgroundServer":
+        """Start serving; block until uvicorn reports startup."""
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError(f"Server on {self.url} failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask uvicorn to exit and wait for the thread."""
+        self._server.should_exit = True
+        self._thread.join(timeout)
+        self._sock.close()
+
+    def __enter__(self) -> "BackgroundServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+def free_port() -> int:
+    """Return a currently unused local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class SubprocessServer:
+    """Run `python <args>` serving HTTP on a port; wait until `ready_path` answers."""
+
+    def __init__(
+        self,
+        args: Sequence[str],
+        port: int,
+        ready_path: str = "/health",
+        env: dict[str, str] | None = None,
+    ) -> None:
+        self.port = port
+        self.url = f"http://127.0.0.1:{port}"
+        self._args = [sys.executable, *args]
+        self._ready_path = ready_path
+        self._env = {**os.environ, **(env or {})}
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def start(self, timeout: float = 30.0) -> "SubprocessServer":
+        """Spawn the process; block until ready_path returns a response."""
+        self._proc = subprocess.Popen(self._args, env=self._env)
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._proc.poll() is not None:
+                raise RuntimeError(f"{self._args} exited with code {self._proc.returncode}")
+            try:
+                httpx.get(self.url + self._ready_path, timeout=1.0)
+                return self
+            except httpx.HTTPError:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f"Server on {self.url} failed to start") from None
+                time.sleep(0.05)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Terminate the process."""
+        if self._proc is None:
+            return
+        self._proc.terminate()
+        try:
+            self._proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def __enter__(self) -> "SubprocessServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
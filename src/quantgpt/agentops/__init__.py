@@ -0,0 +1,5 @@
+"""Observability for QuantGPT agents and API (metrics)."""
+
+from .metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry, track
+
+__all__ = ["REGISTRY", "Counter", "Gauge", "Histogram", "MetricsRegistry", "track"]
@@ -0,0 +1,306 @@
+"""In-process metrics with Prometheus text exposition.
+
+A small, dependency-free subset of the Prometheus client model: counters,
+gauges and histograms with labels, collected in a MetricsRegistry and
+rendered in text format 0.0.4 for scraping at /metrics. No metrics server
+or client library is required.
+
+Standard metrics for agents, tools and HTTP routes are defined at the
+bottom of this module on the process-wide REGISTRY.
+"""
+
+import bisect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render {name="value",...}; extra is appended verbatim (e.g. le="0.1")."""
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value (Prometheus spells infinity +Inf)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Shared label handling for all metric types."""
+
+    type_name = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Exposition lines: HELP, TYPE, then one line per sample."""
+        ...
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add amount (>= 0) to the series for labels."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for labels (0.0 if never incremented)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        lines += [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (e.g. requests in flight)."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add amount to the series for labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Subtract amount from the series for labels."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the series for labels to value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        """Current value for labels (0.0 if never set)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        lines += [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution of observations (e.g. latency) in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: [per-bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for labels."""
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[idx] += 1
+            self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for labels."""
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(c), self._sums[k]) for k, c in self._counts.items())
+        lines = self._header()
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of named metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different shape")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, help, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, help, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, help, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text format 0.0.4."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def track(
+    latency: Histogram,
+    in_progress: Gauge,
+    errors: Counter,
+    **labels: str,
+) -> Iterator[None]:
+    """Time a block: in-flight gauge up/down, latency observed, errors counted.
+
+    Contains no awaits, so it works in both sync and async code.
+    """
+    in_progress.inc(**labels)
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        errors.inc(**labels)
+        raise
+    finally:
+        latency.observe(time.perf_counter() - start, **labels)
+        in_progress.dec(**labels)
+
+
+REGISTRY = MetricsRegistry()
+
+NODE_LATENCY = REGISTRY.histogram(
+    "agent_node_latency_seconds", "Agent graph node latency.", ["agent", "node"]
+)
+NODE_IN_PROGRESS = REGISTRY.gauge(
+    "agent_node_in_progress", "Agent graph nodes currently executing.", ["agent", "node"]
+)
+NODE_ERRORS = REGISTRY.counter(
+    "agent_node_errors_total", "Agent graph node executions that raised.", ["agent", "node"]
+)
+
+TOOL_LATENCY = REGISTRY.histogram(
+    "agent_tool_latency_seconds", "Agent tool call latency.", ["agent", "tool"]
+)
+TOOL_IN_PROGRESS = REGISTRY.gauge(
+    "agent_tool_in_progress", "Agent tool calls currently executing.", ["agent", "tool"]
+)
+TOOL_ERRORS = REGISTRY.counter(
+    "agent_tool_errors_total", "Agent tool calls that raised.", ["agent", "tool"]
+)
+
+PROMPT_TOKENS = REGISTRY.counter(
+    "agent_prompt_news_tokens_total",
+    "Estimated news tokens in LLM prompts, before (raw) and after (compacted) compaction.",
+    ["agent", "stage"],
+)
+PROMPT_TOKENS_SAVED = REGISTRY.counter(
+    "agent_prompt_tokens_saved_total", "Estimated prompt tokens removed by news compaction.", ["agent"]
+)
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP requests by route and status.", ["method", "route", "status"]
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency, including streamed bodies.", ["method", "route"]
+)
+HTTP_IN_PROGRESS = REGISTRY.gauge(
+    "http_requests_in_progress", "HTTP requests currently being served.", ["method"]
+)
+HTTP_ERRORS = REGISTRY.counter(
+    "http_request_exceptions_total", "HTTP requests that raised an unhandled exception.", ["method", "route"]
+)
+
+
+def track_node(agent: str, node: str) -> AbstractContextManager[None]:
+    """Track one agent graph node execution."""
+    return track(NODE_LATENCY, NODE_IN_PROGRESS, NODE_ERRORS, agent=agent, node=node)
+
+
+def track_tool(agent: str, tool: str) -> AbstractContextManager[None]:
+    """Track one agent tool call."""
+    return track(TOOL_LATENCY, TOOL_IN_PROGRESS, TOOL_ERRORS, agent=agent, tool=tool)
@@ -1,7 +1,32 @@
-"""Agent framework for QuantGPT."""
+"""Agent framework for QuantGPT.
+
+Concrete agents are loaded on first attribute access (PEP 562) so importing
+quantgpt.agents.base (e.g. from quantgpt.tools) does not pull in LangGraph
+and langchain_ollama.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseAgent, BaseTool
-from .math_agent import MathAgent
-from .research_agent import ResearchAgent
 
-__all__ = ["BaseAgent", "BaseTool", "MathAgent", "ResearchAgent"]
+if TYPE_CHECKING:
+    from .math_agent import MathAgent
+    from .registry import AgentRegistry
+    from .research_agent import ResearchAgent
+
+_LAZY = {
+    "AgentRegistry": ".registry",
+    "MathAgent": ".math_agent",
+    "ResearchAgent": ".research_agent",
+}
+
+__all__ = ["AgentRegistry", "BaseAgent", "BaseTool", "MathAgent", "ResearchAgent"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,8 @@ Uses dependency injection: tools are passed to agents, not hardcoded.
 from abc import ABC, abstractmethod
 from typing import Any
 
+from quantgpt.agentops.metrics import track_tool
+
 
 class BaseTool(ABC):
     """Abstract base for agent tools.
@@ -69,7 +71,7 @@ class BaseAgent(ABC):
         return list(self._tools.values())
 
     def _call_tool(self, tool_name: str, **kwargs: Any) -> Any:
-        """Execute a tool by name.
+        """Execute a tool by name, recording latency and errors in tool metrics.
 
         Parameters
         ----------
@@ -90,7 +92,8 @@ class BaseAgent(ABC):
         """
         if tool_name not in self._tools:
             raise KeyError(f"Unknown tool: {tool_name}")
-        return self._tools[tool_name].execute(**kwargs)
+        with track_tool(self.name, tool_name):
+            return self._tools[tool_name].execute(**kwargs)
 
     @abstractmethod
     def run(self, query: str, **kwargs: Any) -> str:
@@ -0,0 +1,84 @@
+"""Concurrency limiting for calls to shared backends (e.g. Ollama).
+
+A single ConcurrencyLimiter can be used as a context manager from worker
+threads (sync path) and as an async context manager from coroutines (async
+path), so both entry points respect the same configured limit.
+"""
+
+import asyncio
+import threading
+import weakref
+from types import TracebackType
+
+
+class ConcurrencyLimiter:
+    """Caps the number of concurrent calls to a backend.
+
+    Sync callers share one threading semaphore. Async callers share one
+    asyncio semaphore per running event loop (asyncio primitives cannot be
+    shared across loops). The sync and async counts are tracked separately.
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        """Initialize limiter.
+
+        Parameters
+        ----------
+        limit : int | None
+            Maximum concurrent calls. None or <= 0 means unlimited.
+        """
+        self._limit = limit if limit and limit > 0 else None
+        self._thread_sem = threading.BoundedSemaphore(self._limit) if self._limit else None
+        self._loop_sems: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int | None:
+        """Configured limit, or None when unlimited."""
+        return self._limit
+
+    def _loop_semaphore(self) -> asyncio.Semaphore | None:
+        """Return the asyncio semaphore for the running loop."""
+        if self._limit is None:
+            return None
+        loop = asyncio.get_running_loop()
+        sem = self._loop_sems.get(loop)
+        if sem is None:
+            with self._lock:
+                sem = self._loop_sems.get(loop)
+                if sem is None:
+                    sem = asyncio.Semaphore(self._limit)
+                    self._loop_sems[loop] = sem
+        return sem
+
+    def __enter__(self) -> "ConcurrencyLimiter":
+        if self._thread_sem is not None:
+            self._thread_sem.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._thread_sem is not None:
+            self._thread_sem.release()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        sem = self._loop_semaphore()
+        if sem is not None:
+            await sem.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        sem = self._loop_semaphore()
+        if sem is not None:
+            sem.release()
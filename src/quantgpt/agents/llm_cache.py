@@ -0,0 +1,273 @@
+"""LLM completion cache.
+
+The summarization prompt is deterministic for a given news set and
+sentiment score, so repeated prompts can skip the LLM entirely. Caches are
+keyed by (model, base_url, prompt hash) and evict by size (LRU) and age (TTL).
+
+Backends:
+- LRUCompletionCache: in-process, fastest, lost on restart.
+- SQLiteCompletionCache: single-file, survives restarts, shareable by workers.
+- TieredCompletionCache: memory in front of disk; disk hits are promoted.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+def make_cache_key(model: str, base_url: str, prompt: str) -> str:
+    """Return the cache key for a completion: model, base_url and prompt SHA-256."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return f"{model}|{base_url}|{digest}"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a completion cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 when there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CompletionCache(ABC):
+    """Abstract base for completion caches."""
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the cached completion for key, or None on miss/expiry."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, age: float = 0.0) -> None:
+        """Store a completion, evicting old entries as needed.
+
+        age is how many seconds the completion has already lived (e.g. in
+        another tier); it counts against the TTL.
+        """
+        ...
+
+    def lookup(self, key: str) -> tuple[str, float] | None:
+        """Return (completion, age in seconds) for key, or None on miss/expiry.
+
+        Backends that do not track creation time report age 0.
+        """
+        value = self.get(key)
+        return None if value is None else (value, 0.0)
+
+    def close(self) -> None:
+        """Release any resources held by the cache."""
+
+
+class LRUCompletionCache(CompletionCache):
+    """In-process LRU cache with optional TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum entries kept; least recently used are evicted first.
+        ttl_seconds : float | None
+            Entry lifetime in seconds. None means entries never expire.
+        clock : Callable[[], float]
+            Time source (injectable for tests).
+        """
+        super().__init__()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> str | None:
+        entry = self.lookup(key)
+        return None if entry is None else entry[0]
+
+    def lookup(self, key: str) -> tuple[str, float] | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self._ttl is not None and now - entry[0] > self._ttl:
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1], now - entry[0]
+
+    def set(self, key: str, value: str, age: float = 0.0) -> None:
+        with self._lock:
+            self._data[key] = (self._clock() - age, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+
+class SQLiteCompletionCache(CompletionCache):
+    """SQLite-file cache with LRU eviction and optional TTL; survives restarts."""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize cache, creating the database file if needed.
+
+        Parameters
+        ----------
+        path : str
+            SQLite database file path.
+        max_entries : int
+            Maximum rows kept; least recently accessed are evicted first.
+        ttl_seconds : float | None
+            Entry lifetime in seconds. None means entries never expire.
+        clock : Callable[[], float]
+            Wall-clock time source (must be comparable across restarts).
+        """
+        super().__init__()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS completions_accessed ON completions (accessed)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def get(self, key: str) -> str | None:
+        entry = self.lookup(key)
+        return None if entry is None else entry[0]
+
+    def lookup(self, key: str) -> tuple[str, float] | None:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._ttl is not None and now - row[1] > self._ttl:
+                self._conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._conn.execute("UPDATE completions SET accessed = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+            return row[0], now - row[1]
+
+    def set(self, key: str, value: str, age: float = 0.0) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now - age, now),
+            )
+            self._conn.execute(
+                "DELETE FROM completions WHERE key IN ("
+                "SELECT key FROM completions ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCompletionCache(CompletionCache):
+    """In-process LRU tier in front of a persistent tier.
+
+    Disk hits are promoted with their age, so they expire from memory when
+    they would have expired on disk.
+    """
+
+    def __init__(self, memory: CompletionCache, disk: CompletionCache) -> None:
+        super().__init__()
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> str | None:
+        entry = self.lookup(key)
+        return None if entry is None else entry[0]
+
+    def lookup(self, key: str) -> tuple[str, float] | None:
+        entry = self.memory.lookup(key)
+        if entry is None:
+            entry = self.disk.lookup(key)
+            if entry is not None:
+                self.memory.set(key, *entry)
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entry
+
+    def set(self, key: str, value: str, age: float = 0.0) -> None:
+        self.memory.set(key, value, age)
+        self.disk.set(key, value, age)
+
+    def close(self) -> None:
+        self.memory.close()
+        self.disk.close()
+
+
+def build_completion_cache(
+    max_entries: int,
+    ttl_seconds: float | None = None,
+    path: str | None = None,
+    disk_max_entries: int = 100_000,
+) -> CompletionCache | None:
+    """Build a cache from config values.
+
+    Parameters
+    ----------
+    max_entries : int
+        In-memory LRU size. 0 disables caching (returns None).
+    ttl_seconds : float | None
+        Entry lifetime for both tiers. None or <= 0 means no expiry.
+    path : str | None
+        SQLite file for the persistent tier. None means memory only.
+    disk_max_entries : int
+        Rows kept in the persistent tier.
+    """
+    if max_entries <= 0:
+        return None
+    ttl = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+    memory = LRUCompletionCache(max_entries=max_entries, ttl_seconds=ttl)
+    if not path:
+        return memory
+    return TieredCompletionCache(memory, SQLiteCompletionCache(path, max_entries=disk_max_entries, ttl_seconds=ttl))
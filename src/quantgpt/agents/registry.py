@@ -0,0 +1,151 @@
+"""Application-scoped registry of research agents and Ollama clients.
+
+Compiling the LangGraph state machine and opening HTTP connections to Ollama
+are one-time costs. The registry keeps one ChatOllama client (with a pooled,
+keep-alive HTTP transport) and one compiled ResearchAgent per
+(base_url, model), so requests reuse them after warm-up. Agents pointing at
+the same Ollama base_url share one ConcurrencyLimiter, and all agents share
+one CompletionCache (its keys include model and base_url) and one NewsSource.
+"""
+
+import threading
+from typing import TYPE_CHECKING
+
+from quantgpt.agents.concurrency import ConcurrencyLimiter
+from quantgpt.agents.llm_cache import CompletionCache
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+    from quantgpt.agents.research_agent import ResearchAgent
+    from quantgpt.news import NewsSource
+
+
+class AgentRegistry:
+    """Caches ResearchAgents and their ChatOllama clients by (base_url, model)."""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_concurrency: int | None = None,
+        cache: CompletionCache | None = None,
+        news_source: "NewsSource | None" = None,
+        news_token_budget: int | None = 1024,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Parameters
+        ----------
+        max_connections : int
+            Upper bound on open HTTP connections per Ollama client.
+        max_keepalive_connections : int
+            Idle connections kept open for reuse per Ollama client.
+        keepalive_expiry : float
+            Seconds an idle connection stays in the pool.
+        max_concurrency : int | None
+            Max in-flight LLM calls per Ollama base_url. None means unlimited.
+        cache : CompletionCache | None
+            Completion cache shared by all agents. Disabled if None.
+        news_source : NewsSource | None
+            News source shared by all agents. None means the built-in mock feed.
+        news_token_budget : int | None
+            Estimated news tokens per summarize prompt. None disables compaction.
+        """
+        self._pool_limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        self._max_concurrency = max_concurrency
+        self.cache = cache
+        self.news_source = news_source
+        self._news_token_budget = news_token_budget
+        self._limiters: dict[str, ConcurrencyLimiter] = {}
+        self._llms: dict[tuple[str, str], "ChatOllama"] = {}
+        self._agents: dict[tuple[str, str], "ResearchAgent"] = {}
+        self._lock = threading.Lock()
+
+    def get_llm(self, base_url: str, model: str) -> "ChatOllama":
+        """Return the shared ChatOllama client for (base_url, model)."""
+        key = (base_url, model)
+        llm = self._llms.get(key)
+        if llm is not None:
+            return llm
+        with self._lock:
+            llm = self._llms.get(key)
+            if llm is None:
+                # Deferred: httpx and langchain_ollama dominate API import time.
+                import httpx
+                from langchain_ollama import ChatOllama
+
+                llm = ChatOllama(
+                    model=model,
+                    base_url=base_url,
+                    client_kwargs={"limits": httpx.Limits(**self._pool_limits)},
+                )
+                self._llms[key] = llm
+        return llm
+
+    def get_limiter(self, base_url: str) -> ConcurrencyLimiter:
+        """Return the shared ConcurrencyLimiter for an Ollama base_url."""
+        with self._lock:
+            limiter = self._limiters.get(base_url)
+            if limiter is None:
+                limiter = ConcurrencyLimiter(self._max_concurrency)
+                self._limiters[base_url] = limiter
+        return limiter
+
+    def get_research_agent(self, base_url: str, model: str) -> "ResearchAgent":
+        """Return the shared ResearchAgent for (base_url, model).
+
+        The agent's graph is compiled once, on first request for the key.
+        """
+        key = (base_url, model)
+        agent = self._agents.get(key)
+        if agent is not None:
+            return agent
+        llm = self.get_llm(base_url, model)
+        limiter = self.get_limiter(base_url)
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                # Deferred: LangGraph is only needed once an agent is built.
+                from quantgpt.agents.research_agent import ResearchAgent
+
+                agent = ResearchAgent(
+                    ollama_base_url=base_url,
+                    ollama_model=model,
+                    llm=llm,
+                    limiter=limiter,
+                    cache=self.cache,
+                    news_source=self.news_source,
+                    news_token_budget=self._news_token_budget,
+                )
+                self._agents[key] = agent
+        return agent
+
+    def close(self) -> None:
+        """Close pooled sync HTTP connections and forget all cached agents.
+
+        The completion cache is left open: it may be shared beyond this registry.
+        """
+        with self._lock:
+            llms = list(self._llms.values())
+            self._llms.clear()
+            self._agents.clear()
+        for llm in llms:
+            client = getattr(llm, "_client", None)
+            if client is not None:
+                client.close()
+
+    async def aclose(self) -> None:
+        """Close pooled sync and async HTTP connections (for app shutdown)."""
+        with self._lock:
+            llms = list(self._llms.values())
+        for llm in llms:
+            async_client = getattr(llm, "_async_client", None)
+            if async_client is not None:
+                await async_client.close()
+        self.close()
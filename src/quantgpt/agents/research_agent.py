@@ -1,28 +1,76 @@
 """Research agent using LangGraph.
 
-3-node workflow: fetch_news -> analyze_sentiment -> llm_summarize.
-Produces investment insight from market news and sentiment.
+Workflow: extract_symbols, then either the single-topic chain
+fetch_news -> analyze_sentiment, or (when the query names tickers) one
+research_symbol branch per symbol, fanned out with LangGraph's Send and run
+concurrently. Either way one llm_summarize call turns the news and
+sentiment into an investment insight, so a multi-symbol query costs the
+slowest branch plus one LLM call. Before that call the news is compacted
+(near-duplicates dropped, ranked by recency and |sentiment|, cut to a
+token budget; see quantgpt.agents.compaction).
+Every node has a sync and an async variant, so the compiled graph serves
+both run() (invoke) and arun() (ainvoke) without a thread hop. astream()
+yields node results and LLM tokens as they are produced. arun_batch()
+dedupes queries and fans out only the LLM stage under a concurrency limit.
 """
 
-from typing import TypedDict
+import asyncio
+import functools
+import operator
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Hashable, Sequence
+from typing import TYPE_CHECKING, Annotated, Any, NamedTuple, TypedDict
 
-from langchain_ollama import ChatOllama
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
 
+from quantgpt.agentops.metrics import PROMPT_TOKENS, PROMPT_TOKENS_SAVED, track_node
+from quantgpt.agents.compaction import CompactionStats, NewsItem, compact_news
+from quantgpt.agents.concurrency import ConcurrencyLimiter
+from quantgpt.agents.llm_cache import CompletionCache, make_cache_key
+from quantgpt.agents.singleflight import SingleFlight
 from quantgpt.exceptions import OllamaUnavailableError
+from quantgpt.news import Article, NewsSource
+from quantgpt.news.index import DEFAULT_ALIASES, KNOWN_SYMBOLS, extract_symbols
 from quantgpt.tools.fetch_news import FetchMarketNewsTool
 from quantgpt.tools.sentiment import SentimentTool
 
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+
+class SymbolReport(NamedTuple):
+    """News and sentiment gathered by one research_symbol branch."""
+
+    symbol: str
+    news: str
+    sentiment_score: float
+    articles: tuple[Article, ...] = ()
+
 
 class ResearchState(TypedDict, total=False):
-    """State schema for ResearchAgent graph."""
+    """State schema for ResearchAgent graph.
+
+    symbol is set only in the per-symbol branch inputs; reports collects the
+    branch results (concatenated by the reducer, in any completion order).
+    """
 
     query: str
+    symbols: list[str]
+    symbol: str
+    reports: Annotated[list[SymbolReport], operator.add]
     news: str
+    articles: list[Article]
     sentiment_score: float
+    compaction: CompactionStats
     insight: str
 
 
+def normalize_query(query: str) -> str:
+    """Normalize a query for deduplication: collapse whitespace, lowercase."""
+    return " ".join(query.split()).lower()
+
+
 class ResearchAgent:
     """Research agent with LangGraph: fetch news, analyze sentiment, LLM summarize."""
 
@@ -30,6 +78,13 @@ class ResearchAgent:
         self,
         ollama_base_url: str = "http://localhost:11434",
         ollama_model: str = "llama3.2",
+        llm: "ChatOllama | None" = None,
+        limiter: ConcurrencyLimiter | None = None,
+        cache: CompletionCache | None = None,
+        news_source: NewsSource | None = None,
+        max_symbols: int = 10,
+        news_token_budget: int | None = 1024,
+        symbols: Collection[str] | None = None,
     ) -> None:
         """Initialize ResearchAgent.
 
@@ -39,34 +94,170 @@ class ResearchAgent:
             Ollama API base URL.
         ollama_model : str
             Ollama model name (e.g. llama3.2, mistral).
+        llm : ChatOllama | None
+            Pre-built chat model to reuse across calls (e.g. one with a pooled
+            HTTP client from AgentRegistry). Created on first use if None.
+        limiter : ConcurrencyLimiter | None
+            Caps concurrent LLM calls to Ollama. Unlimited if None.
+        cache : CompletionCache | None
+            Completion cache consulted before calling the LLM. Disabled if None.
+        news_source : NewsSource | None
+            Where fetch_news reads articles. Defaults to the built-in mock feed.
+        max_symbols : int
+            Most symbols researched per query (one parallel branch each);
+            extra tickers are ignored.
+        news_token_budget : int | None
+            Estimated tokens of news per prompt (split evenly between the
+            symbols of a fanned-out query). News is deduplicated, ranked and
+            cut to fit before the LLM call. None disables compaction.
+        symbols : Collection[str] | None
+            Tickers recognized as bare words in queries (e.g. "ibm"). None
+            means KNOWN_SYMBOLS, the tickers of the company aliases; other
+            symbols then need a cashtag ("$IBM").
         """
         self._ollama_base_url = ollama_base_url
         self._ollama_model = ollama_model
-        self._fetch_news = FetchMarketNewsTool()
+        self._llm = llm
+        self._limiter = limiter or ConcurrencyLimiter()
+        self._cache = cache
+        self._inflight = SingleFlight()
+        self._fetch_news = FetchMarketNewsTool(source=news_source)
         self._sentiment = SentimentTool()
+        self._max_symbols = max(max_symbols, 1)
+        self._news_token_budget = news_token_budget
+        self._is_symbol = (KNOWN_SYMBOLS if symbols is None else frozenset(s.upper() for s in symbols)).__contains__
         self._graph = self._build_graph()
 
+    @property
+    def name(self) -> str:
+        """Agent identifier (used as a metrics label)."""
+        return "research_agent"
+
+    def _node(
+        self,
+        node: str,
+        func: Callable[..., dict[str, Any]],
+        afunc: Callable[..., Awaitable[dict[str, Any]]],
+    ) -> RunnableLambda:
+        """Combine a node's sync/async variants, each tracked in node metrics."""
+
+        @functools.wraps(func)
+        def sync(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            with track_node(self.name, node):
+                return func(*args, **kwargs)
+
+        @functools.wraps(afunc)
+        async def async_(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            with track_node(self.name, node):
+                return await afunc(*args, **kwargs)
+
+        return RunnableLambda(sync, afunc=async_)
+
     def _build_graph(self):
         """Build and compile the LangGraph state machine."""
         graph = StateGraph(ResearchState)
 
-        graph.add_node("fetch_news", self._fetch_news_node)
-        graph.add_node("analyze_sentiment", self._analyze_sentiment_node)
-        graph.add_node("llm_summarize", self._llm_summarize_node)
+        graph.add_node(
+            "extract_symbols",
+            self._node("extract_symbols", self._extract_symbols_node, self._aextract_symbols_node),
+        )
+        graph.add_node(
+            "research_symbol",
+            self._node("research_symbol", self._research_symbol_node, self._aresearch_symbol_node),
+        )
+        graph.add_node(
+            "fetch_news",
+            self._node("fetch_news", self._fetch_news_node, self._afetch_news_node),
+        )
+        graph.add_node(
+            "analyze_sentiment",
+            self._node("analyze_sentiment", self._analyze_sentiment_node, self._aanalyze_sentiment_node),
+        )
+        graph.add_node(
+            "llm_summarize",
+            self._node("llm_summarize", self._llm_summarize_node, self._allm_summarize_node),
+        )
 
-        graph.add_edge(START, "fetch_news")
+        graph.add_edge(START, "extract_symbols")
+        graph.add_conditional_edges("extract_symbols", self._route, ["research_symbol", "fetch_news"])
+        graph.add_edge("research_symbol", "llm_summarize")
         graph.add_edge("fetch_news", "analyze_sentiment")
         graph.add_edge("analyze_sentiment", "llm_summarize")
         graph.add_edge("llm_summarize", END)
 
         return graph.compile()
 
-    def _fetch_news_node(self, state: ResearchState) -> dict[str, str]:
+    def _get_llm(self) -> "ChatOllama":
+        """Return the chat model, creating it once on first use."""
+        if self._llm is None:
+            # Deferred: langchain_ollama dominates import time.
+            from langchain_ollama import ChatOllama
+
+            self._llm = ChatOllama(
+                model=self._ollama_model,
+                base_url=self._ollama_base_url,
+            )
+        return self._llm
+
+    def _symbols(self, query: str) -> list[str]:
+        """Symbols to research for query (at most max_symbols)."""
+        return extract_symbols(query, DEFAULT_ALIASES, self._is_symbol)[: self._max_symbols]
+
+    def _route_key(self, query: str) -> Hashable:
+        """Key of the work query routes to: its symbols, else its normalized topic.
+
+        Queries naming the same symbols (in order) share one fan-out, since
+        the branches and the prompt depend only on the symbols.
+        """
+        symbols = self._symbols(query)
+        return ("symbols", *symbols) if symbols else ("topic", normalize_query(query))
+
+    def _extract_symbols_node(self, state: ResearchState) -> dict[str, list[str]]:
+        """Node 0: Find the tickers the query names (none means a topic query)."""
+        return {"symbols": self._symbols(state.get("query", "") or "")}
+
+    async def _aextract_symbols_node(self, state: ResearchState) -> dict[str, list[str]]:
+        """Async node 0. Pure string work, so it runs inline."""
+        return self._extract_symbols_node(state)
+
+    @staticmethod
+    def _route(state: ResearchState) -> list[Send] | str:
+        """Fan out one research_symbol branch per symbol, or take the topic chain."""
+        symbols = state.get("symbols") or []
+        if not symbols:
+            return "fetch_news"
+        query = state.get("query", "")
+        return [Send("research_symbol", {"query": query, "symbol": symbol}) for symbol in symbols]
+
+    def _research_symbol_node(self, state: ResearchState) -> dict[str, list[SymbolReport]]:
+        """Branch node: fetch news and score sentiment for one symbol."""
+        symbol = state["symbol"]
+        articles = self._fetch_news.fetch(symbol=symbol)
+        news = self._fetch_news.render(articles)
+        score = self._sentiment.execute(text=news)
+        return {"reports": [SymbolReport(symbol, news, score, tuple(articles))]}
+
+    async def _aresearch_symbol_node(self, state: ResearchState) -> dict[str, list[SymbolReport]]:
+        """Async branch node; branches of one query await their news reads concurrently."""
+        symbol = state["symbol"]
+        articles = await self._fetch_news.afetch(symbol=symbol)
+        news = self._fetch_news.render(articles)
+        score = self._sentiment.execute(text=news)
+        return {"reports": [SymbolReport(symbol, news, score, tuple(articles))]}
+
+    def _fetch_news_node(self, state: ResearchState) -> dict[str, Any]:
         """Node 1: Fetch market news for the query."""
         query = state.get("query", "") or "market"
         topic = query.strip() or "market"
-        news = self._fetch_news.execute(symbol=None, topic=topic)
-        return {"news": news}
+        articles = self._fetch_news.fetch(symbol=None, topic=topic)
+        return {"news": self._fetch_news.render(articles), "articles": articles}
+
+    async def _afetch_news_node(self, state: ResearchState) -> dict[str, Any]:
+        """Async node 1. Reads the news source without blocking the event loop."""
+        query = state.get("query", "") or "market"
+        topic = query.strip() or "market"
+        articles = await self._fetch_news.afetch(symbol=None, topic=topic)
+        return {"news": self._fetch_news.render(articles), "articles": articles}
 
     def _analyze_sentiment_node(self, state: ResearchState) -> dict[str, float]:
         """Node 2: Analyze sentiment of fetched news."""
@@ -74,28 +265,127 @@ class ResearchAgent:
         score = self._sentiment.execute(text=news)
         return {"sentiment_score": score}
 
-    def _llm_summarize_node(self, state: ResearchState) -> dict[str, str]:
-        """Node 3: LLM summarizes news and sentiment into investment insight."""
+    async def _aanalyze_sentiment_node(self, state: ResearchState) -> dict[str, float]:
+        """Async node 2. VADER scoring is short CPU work, so it runs inline."""
+        return self._analyze_sentiment_node(state)
+
+    @staticmethod
+    def _build_prompt(state: ResearchState) -> str:
+        """Build the summarization prompt from news and sentiment (per symbol, if fanned out)."""
+        reports = state.get("reports")
+        if reports:
+            order = {symbol: i for i, symbol in enumerate(state.get("symbols") or ())}
+            sections = "\n\n".join(
+                f"{r.symbol} (sentiment {r.sentiment_score:.2f}):\n{r.news}"
+                for r in sorted(reports, key=lambda r: order.get(r.symbol, len(order)))
+            )
+            return (
+                "Given this market news and sentiment score per symbol (range -1 to 1):\n\n"
+                f"{sections}\n\n"
+                "Provide a brief investment insight covering each symbol (2-3 sentences). Be concise."
+            )
         news = state.get("news", "")
         sentiment = state.get("sentiment_score", 0.0)
-        prompt = (
+        return (
             f"Given this market news and sentiment score ({sentiment:.2f}, range -1 to 1):\n\n"
             f"News:\n{news}\n\n"
             "Provide a brief investment insight (2-3 sentences). Be concise."
         )
+
+    def _compact(self, news: str, articles: Sequence[Article], budget: int) -> tuple[str, CompactionStats]:
+        """Compact one news block; items are scored one by one for the ranking."""
+        if articles:
+            lines = self._fetch_news.render_lines(list(articles))
+            times = [article.timestamp.timestamp() for article in articles]
+        else:
+            lines = [line for line in news.splitlines() if line.strip()]
+            times = [0.0] * len(lines)
+        scores = self._sentiment.execute(items=lines)["scores"] if lines else []
+        compacted = compact_news(map(NewsItem, lines, times, scores), token_budget=budget)
+        return "\n".join(compacted.lines), compacted.stats
+
+    def _prepare_prompt(self, state: ResearchState) -> tuple[str, CompactionStats | None]:
+        """Compact the news in state (if enabled) and build the prompt.
+
+        Stats are summed over symbols and recorded in the prompt token metrics.
+        """
+        if self._news_token_budget is None:
+            return self._build_prompt(state), None
+        reports = state.get("reports")
+        if reports:
+            budget = max(self._news_token_budget // len(reports), 1)
+            compacted = [self._compact(r.news, r.articles, budget) for r in reports]
+            state = {**state, "reports": [r._replace(news=news) for r, (news, _) in zip(reports, compacted)]}
+            stats = CompactionStats(*map(sum, zip(*(s for _, s in compacted))))
+        else:
+            news, stats = self._compact(state.get("news", ""), state.get("articles") or (), self._news_token_budget)
+            state = {**state, "news": news}
+        PROMPT_TOKENS.inc(stats.tokens_in, agent=self.name, stage="raw")
+        PROMPT_TOKENS.inc(stats.tokens_out, agent=self.name, stage="compacted")
+        PROMPT_TOKENS_SAVED.inc(stats.tokens_saved, agent=self.name)
+        return self._build_prompt(state), stats
+
+    def _cache_get(self, prompt: str) -> str | None:
+        """Return a cached insight for prompt, if caching is enabled."""
+        if self._cache is None:
+            return None
+        return self._cache.get(make_cache_key(self._ollama_model, self._ollama_base_url, prompt))
+
+    def _cache_set(self, prompt: str, insight: str) -> None:
+        """Store an insight for prompt, if caching is enabled."""
+        if self._cache is not None:
+            self._cache.set(make_cache_key(self._ollama_model, self._ollama_base_url, prompt), insight)
+
+    def _llm_summarize_node(self, state: ResearchState) -> dict[str, Any]:
+        """Node 3: LLM summarizes news and sentiment into investment insight."""
+        prompt, stats = self._prepare_prompt(state)
+        update: dict[str, Any] = {} if stats is None else {"compaction": stats}
+        cached = self._cache_get(prompt)
+        if cached is not None:
+            return {**update, "insight": cached}
         try:
-            llm = ChatOllama(
-                model=self._ollama_model,
-                base_url=self._ollama_base_url,
-            )
-            response = llm.invoke(prompt)
+            with self._limiter:
+                response = self._get_llm().invoke(prompt)
             insight = response.content if hasattr(response, "content") else str(response)
         except Exception as e:
             raise OllamaUnavailableError(
                 "Ollama not available. Start with: ollama serve. Then: ollama pull llama3.2",
                 cause=e,
             ) from e
-        return {"insight": insight}
+        self._cache_set(prompt, insight)
+        return {**update, "insight": insight}
+
+    async def _allm_summarize_node(
+        self, state: ResearchState, config: RunnableConfig | None = None
+    ) -> dict[str, Any]:
+        """Async node 3: streams ChatOllama.astream under the concurrency limit.
+
+        Tokens surface through the graph's "messages" stream mode (see astream());
+        the node itself returns the joined insight. Cache hits emit no tokens.
+        News compaction (line scoring, MinHash) runs in a worker thread so
+        other requests keep running on the event loop.
+        """
+        if self._news_token_budget is None:
+            prompt, stats = self._prepare_prompt(state)
+        else:
+            prompt, stats = await asyncio.to_thread(self._prepare_prompt, state)
+        update: dict[str, Any] = {} if stats is None else {"compaction": stats}
+        cached = self._cache_get(prompt)
+        if cached is not None:
+            return {**update, "insight": cached}
+        try:
+            parts: list[str] = []
+            async with self._limiter:
+                async for chunk in self._get_llm().astream(prompt, config=config):
+                    parts.append(chunk.content if hasattr(chunk, "content") else str(chunk))
+            insight = "".join(parts)
+        except Exception as e:
+            raise OllamaUnavailableError(
+                "Ollama not available. Start with: ollama serve. Then: ollama pull llama3.2",
+                cause=e,
+            ) from e
+        self._cache_set(prompt, insight)
+        return {**update, "insight": insight}
 
     def run(self, query: str, **kwargs: object) -> str:
         """Execute the research agent for the given query.
@@ -115,3 +405,135 @@ class ResearchAgent:
         initial: ResearchState = {"query": query}
         final = self._graph.invoke(initial)
         return final.get("insight", "")
+
+    async def arun(self, query: str, **kwargs: object) -> str:
+        """Async counterpart of run(); awaits the graph without blocking a thread.
+
+        Concurrent calls routed to the same work (same symbols, or the same
+        normalized topic) share one graph execution (single-flight); all of
+        them get its result or exception.
+
+        Parameters
+        ----------
+        query : str
+            User query (symbol, topic, or research question).
+        **kwargs : object
+            Ignored for future extensibility.
+
+        Returns
+        -------
+        str
+            Investment insight from the agent.
+        """
+        return await self._inflight.do(self._route_key(query), lambda: self._ainvoke(query))
+
+    async def _ainvoke(self, query: str) -> str:
+        """Run the graph once for query and return the insight."""
+        initial: ResearchState = {"query": query}
+        final = await self._graph.ainvoke(initial)
+        return final.get("insight", "")
+
+    async def astream(self, query: str, **kwargs: object) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Stream research progress for the given query.
+
+        Parameters
+        ----------
+        query : str
+            User query (symbol, topic, or research question).
+        **kwargs : object
+            Ignored for future extensibility.
+
+        Yields
+        ------
+        tuple[str, dict[str, Any]]
+            (event, data) pairs, in order: ("news", {"news"}) and
+            ("sentiment", {"sentiment_score"}) as those nodes finish, then
+            ("token", {"text"}) per LLM chunk, then ("insight", {"insight"}).
+            For a multi-symbol query each branch yields its own "news" and
+            "sentiment" pair, with a "symbol" key, as it finishes.
+        """
+        initial: ResearchState = {"query": query}
+        async for mode, payload in self._graph.astream(initial, stream_mode=["updates", "messages"]):
+            if mode == "messages":
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") == "llm_summarize" and chunk.content:
+                    yield "token", {"text": chunk.content}
+                continue
+            for node, update in payload.items():
+                if node == "fetch_news":
+                    yield "news", {"news": update.get("news", "")}
+                elif node == "analyze_sentiment":
+                    yield "sentiment", {"sentiment_score": update.get("sentiment_score", 0.0)}
+                elif node == "research_symbol":
+                    for report in update.get("reports", ()):
+                        yield "news", {"symbol": report.symbol, "news": report.news}
+                        yield "sentiment", {"symbol": report.symbol, "sentiment_score": report.sentiment_score}
+                elif node == "llm_summarize":
+                    yield "insight", {"insight": update.get("insight", "")}
+
+    async def arun_batch(
+        self,
+        queries: Sequence[str],
+        max_concurrency: int | None = None,
+    ) -> list[str | Exception]:
+        """Research many queries at once.
+
+        Queries routed to the same work (same symbols, or the same
+        normalized topic) are researched once. The cheap fetch_news and
+        analyze_sentiment stages run for every unique query up front,
+        concurrently (per symbol for multi-symbol queries); llm_summarize
+        calls are then scheduled. Both stages keep at most max_concurrency
+        queries in flight (on top of the agent's own limiter for LLM calls).
+
+        Parameters
+        ----------
+        queries : Sequence[str]
+            User queries, in request order.
+        max_concurrency : int | None
+            Max queries prepared, and max summarize calls, in flight at once
+            for this batch. None means unlimited.
+
+        Returns
+        -------
+        list[str | Exception]
+            Insight or the raised exception for each query, in input order.
+        """
+        keys = [self._route_key(query) for query in queries]
+        unique: dict[Hashable, str] = {}
+        for key, query in zip(keys, queries):
+            unique.setdefault(key, query)
+        limiter = ConcurrencyLimiter(max_concurrency)
+
+        async def research_symbol(state: ResearchState) -> dict[str, list[SymbolReport]]:
+            with track_node(self.name, "research_symbol"):
+                return await self._aresearch_symbol_node(state)
+
+        async def prepare(query: str) -> ResearchState | Exception:
+            try:
+                async with limiter:
+                    state: ResearchState = {"query": query, "symbols": self._symbols(query)}
+                    if state["symbols"]:
+                        branches = [research_symbol({"query": query, "symbol": s}) for s in state["symbols"]]
+                        reports = await asyncio.gather(*branches)
+                        state["reports"] = [r for update in reports for r in update["reports"]]
+                        return state
+                    with track_node(self.name, "fetch_news"):
+                        state.update(await self._afetch_news_node(state))
+                    with track_node(self.name, "analyze_sentiment"):
+                        state.update(self._analyze_sentiment_node(state))
+                    return state
+            except Exception as e:
+                return e
+
+        async def summarize(prepared: ResearchState | Exception) -> str:
+            if isinstance(prepared, Exception):
+                raise prepared
+            async with limiter:
+                with track_node(self.name, "llm_summarize"):
+                    update = await self._allm_summarize_node(prepared)
+            return update["insight"]
+
+        prepared = await asyncio.gather(*(prepare(q) for q in unique.values()))
+        results = await asyncio.gather(*(summarize(p) for p in prepared), return_exceptions=True)
+        by_key = dict(zip(unique, results))
+        return [by_key[key] for key in keys]
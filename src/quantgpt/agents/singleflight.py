@@ -0,0 +1,70 @@
+"""Single-flight coalescing of concurrent async calls.
+
+When many callers ask for the same key at once, only the first (the leader)
+starts the work; the rest await the leader's task and receive the same
+result or exception. The work runs as its own task and waiters are shielded,
+so one cancelled waiter (e.g. a disconnected client) does not cancel the
+shared call for everyone else.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call per key among concurrent callers."""
+
+    def __init__(self) -> None:
+        self._calls: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Task[Any]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _loop_calls(self) -> dict[Hashable, asyncio.Task[Any]]:
+        """Return the in-flight task map for the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._calls.get(loop)
+            if calls is None:
+                calls = {}
+                self._calls[loop] = calls
+        return calls
+
+    def in_flight(self) -> int:
+        """Number of distinct keys currently executing on the running loop."""
+        return len(self._loop_calls())
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() once per key among concurrent callers and share its outcome.
+
+        Parameters
+        ----------
+        key : Hashable
+            Coalescing key; callers with equal keys share one execution.
+        fn : Callable[[], Awaitable[T]]
+            Zero-argument coroutine factory, called only by the leader.
+
+        Returns
+        -------
+        T
+            The shared result. If fn() raises, every waiter gets the exception.
+        """
+        calls = self._loop_calls()
+        task = calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            calls[key] = task
+
+            def _done(t: asyncio.Task[Any]) -> None:
+                if calls.get(key) is t:
+                    del calls[key]
+                if not t.cancelled():
+                    t.exception()  # mark retrieved even if every waiter went away
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
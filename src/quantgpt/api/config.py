@@ -36,3 +36,88 @@ def get_ollama_base_url() -> str:
 def get_ollama_model() -> str:
     """Return Ollama model name. Reads from OLLAMA_MODEL env."""
     return os.environ.get("OLLAMA_MODEL", "llama3.2")
+
+
+def get_ollama_max_connections() -> int:
+    """Return max pooled HTTP connections per Ollama client. Reads from OLLAMA_MAX_CONNECTIONS env."""
+    return int(os.environ.get("OLLAMA_MAX_CONNECTIONS", "100"))
+
+
+def get_ollama_keepalive_connections() -> int:
+    """Return idle keep-alive connections per Ollama client. Reads from OLLAMA_KEEPALIVE_CONNECTIONS env."""
+    return int(os.environ.get("OLLAMA_KEEPALIVE_CONNECTIONS", "20"))
+
+
+def get_ollama_max_concurrency() -> int:
+    """Return max in-flight LLM calls per Ollama server (0 = unlimited). Reads from OLLAMA_MAX_CONCURRENCY env."""
+    return int(os.environ.get("OLLAMA_MAX_CONCURRENCY", "4"))
+
+
+def get_research_batch_concurrency() -> int:
+    """Return max concurrent LLM calls per batch request (0 = unlimited). Reads from RESEARCH_BATCH_CONCURRENCY env."""
+    return int(os.environ.get("RESEARCH_BATCH_CONCURRENCY", "8"))
+
+
+def get_news_token_budget() -> int:
+    """Return estimated news tokens per research prompt (0 = no compaction). Reads from NEWS_TOKEN_BUDGET env."""
+    return int(os.environ.get("NEWS_TOKEN_BUDGET", "1024"))
+
+
+def get_llm_cache_max_entries() -> int:
+    """Return in-memory LLM completion cache size (0 = disabled). Reads from LLM_CACHE_MAX_ENTRIES env."""
+    return int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "1024"))
+
+
+def get_llm_cache_ttl_seconds() -> float:
+    """Return LLM completion cache TTL in seconds (0 = no expiry). Reads from LLM_CACHE_TTL_SECONDS env."""
+    return float(os.environ.get("LLM_CACHE_TTL_SECONDS", "3600"))
+
+
+def get_llm_cache_path() -> str | None:
+    """Return SQLite file for the persistent LLM cache tier, if any. Reads from LLM_CACHE_PATH env."""
+    return os.environ.get("LLM_CACHE_PATH") or None
+
+
+def get_llm_cache_disk_max_entries() -> int:
+    """Return row limit of the persistent LLM cache tier. Reads from LLM_CACHE_DISK_MAX_ENTRIES env."""
+    return int(os.environ.get("LLM_CACHE_DISK_MAX_ENTRIES", "100000"))
+
+
+def get_sentiment_cache_max_entries() -> int:
+    """Return memoized sentiment score limit (0 = disabled). Reads from SENTIMENT_CACHE_MAX_ENTRIES env."""
+    return int(os.environ.get("SENTIMENT_CACHE_MAX_ENTRIES", "65536"))
+
+
+def get_sentiment_cache_max_bytes() -> int:
+    """Return memoized sentiment memory budget in bytes. Reads from SENTIMENT_CACHE_MAX_BYTES env."""
+    return int(os.environ.get("SENTIMENT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+
+def get_news_path() -> str | None:
+    """Return local JSONL news feed (.jsonl, .gz, .bz2, .xz), if any. Reads from NEWS_PATH env."""
+    return os.environ.get("NEWS_PATH") or None
+
+
+def get_news_index_path() -> str | None:
+    """Return news index file built by build_news_index, if any. Reads from NEWS_INDEX_PATH env."""
+    return os.environ.get("NEWS_INDEX_PATH") or None
+
+
+def get_news_url() -> str | None:
+    """Return HTTP news API root serving GET /news?q=<term>, if any. Reads from NEWS_URL env."""
+    return os.environ.get("NEWS_URL") or None
+
+
+def get_news_api_key() -> str | None:
+    """Return API key sent as X-Api-Key to the HTTP news API, if any. Reads from NEWS_API_KEY env."""
+    return os.environ.get("NEWS_API_KEY") or None
+
+
+def get_news_rate_limit() -> float:
+    """Return max HTTP news requests per second (0 = unlimited). Reads from NEWS_RATE_LIMIT env."""
+    return float(os.environ.get("NEWS_RATE_LIMIT", "5"))
+
+
+def get_news_cache_ttl_seconds() -> float:
+    """Return seconds HTTP news responses are reused before revalidation. Reads from NEWS_CACHE_TTL_SECONDS env."""
+    return float(os.environ.get("NEWS_CACHE_TTL_SECONDS", "60"))
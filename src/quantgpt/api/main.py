@@ -4,13 +4,86 @@ Uses create_app() for testability and dependency injection.
 OpenAPI docs at /docs, spec at /openapi.json.
 """
 
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from quantgpt.api.routes import health, models, research
+from quantgpt.agents.registry import AgentRegistry
+from quantgpt.agents.llm_cache import build_completion_cache
+from quantgpt.api.config import (
+    get_llm_cache_disk_max_entries,
+    get_llm_cache_max_entries,
+    get_llm_cache_path,
+    get_llm_cache_ttl_seconds,
+    get_news_api_key,
+    get_news_cache_ttl_seconds,
+    get_news_index_path,
+    get_news_path,
+    get_news_rate_limit,
+    get_news_token_budget,
+    get_news_url,
+    get_ollama_base_url,
+    get_ollama_keepalive_connections,
+    get_ollama_max_concurrency,
+    get_ollama_max_connections,
+    get_ollama_model,
+    get_sentiment_cache_max_bytes,
+    get_sentiment_cache_max_entries,
+)
+from quantgpt.api.middleware import MetricsMiddleware
+from quantgpt.api.routes import health, metrics, models, research
+from quantgpt.news import JSONLNewsSource, NewsSource
+from quantgpt.nlp import configure_sentiment_cache
 
 __version__ = "0.1.0"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the sentiment memo and warm up the default ResearchAgent on startup; close clients, caches and data sources on shutdown."""
+    # Process-wide: done when the server starts, not whenever an app is built.
+    configure_sentiment_cache(
+        max_entries=get_sentiment_cache_max_entries(),
+        max_bytes=get_sentiment_cache_max_bytes(),
+    )
+    registry: AgentRegistry = app.state.agent_registry
+    registry.get_research_agent(get_ollama_base_url(), get_ollama_model())
+    yield
+    await registry.aclose()
+    if registry.cache is not None:
+        registry.cache.close()
+    if registry.news_source is not None:
+        registry.news_source.close()
+    # Only loaded (and so only worth closing) when an HTTP provider was used.
+    http = sys.modules.get("quantgpt.news.http")
+    if http is not None:
+        http.close_http_client()
+
+
+def _build_news_source() -> NewsSource | None:
+    """News index if configured, else an HTTP API, else a JSONL feed, else None (mock feed)."""
+    index_path = get_news_index_path()
+    if index_path:
+        from quantgpt.news.index import NewsIndex
+
+        return NewsIndex.open(index_path)
+    news_url = get_news_url()
+    if news_url:
+        from quantgpt.news.http import JSONHTTPNewsSource
+
+        api_key = get_news_api_key()
+        return JSONHTTPNewsSource(
+            news_url,
+            rate=get_news_rate_limit(),
+            cache_ttl=get_news_cache_ttl_seconds(),
+            headers={"X-Api-Key": api_key} if api_key else None,
+        )
+    news_path = get_news_path()
+    return JSONLNewsSource(news_path) if news_path else None
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(
@@ -20,9 +93,25 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
+    )
+    app.state.agent_registry = AgentRegistry(
+        max_connections=get_ollama_max_connections(),
+        max_keepalive_connections=get_ollama_keepalive_connections(),
+        max_concurrency=get_ollama_max_concurrency(),
+        cache=build_completion_cache(
+            max_entries=get_llm_cache_max_entries(),
+            ttl_seconds=get_llm_cache_ttl_seconds(),
+            path=get_llm_cache_path(),
+            disk_max_entries=get_llm_cache_disk_max_entries(),
+        ),
+        news_source=_build_news_source(),
+        news_token_budget=get_news_token_budget() or None,
     )
+    app.add_middleware(MetricsMiddleware)
 
     app.include_router(health.router)
+    app.include_router(metrics.router)
     app.include_router(models.router)
     app.include_router(research.router)
 
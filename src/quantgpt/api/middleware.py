@@ -0,0 +1,65 @@
+"""API middleware.
+
+MetricsMiddleware is pure ASGI (not BaseHTTPMiddleware) so streamed
+responses are timed until their last byte and are not buffered.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from quantgpt.agentops.metrics import HTTP_ERRORS, HTTP_IN_PROGRESS, HTTP_LATENCY, HTTP_REQUESTS
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the matched route path template (e.g. /api/v1/research).
+
+    The router records the matched route in the scope, so this is only
+    meaningful after the app has handled the request. Templates rather than
+    raw paths keep label cardinality bounded.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Records per-route request counts, latency and exceptions, and requests in flight.
+
+    The in-flight gauge is labelled by method only: the route is not known
+    until the router has run. Per-stage in-flight counts come from the agent
+    node gauges.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        raised = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            raised = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            route = _route_template(scope)
+            HTTP_IN_PROGRESS.dec(method=method)
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status))
+            if raised:
+                HTTP_ERRORS.inc(method=method, route=route)
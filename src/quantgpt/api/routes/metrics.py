@@ -0,0 +1,16 @@
+"""Prometheus metrics route."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from quantgpt.agentops.metrics import REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Process metrics in Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type=_CONTENT_TYPE)
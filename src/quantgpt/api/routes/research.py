@@ -1,34 +1,137 @@
 """Research routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from quantgpt.agents import ResearchAgent
-from quantgpt.api.config import get_ollama_base_url, get_ollama_model
-from quantgpt.api.schemas.research import ResearchRequest, ResearchResponse
-from quantgpt.exceptions import OllamaUnavailableError
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from quantgpt.agents.registry import AgentRegistry
+from quantgpt.api.config import (
+    get_ollama_base_url,
+    get_ollama_model,
+    get_research_batch_concurrency,
+)
+from quantgpt.api.schemas.research import (
+    BatchResearchItem,
+    BatchResearchRequest,
+    BatchResearchResponse,
+    ResearchRequest,
+    ResearchResponse,
+)
+from quantgpt.exceptions import NewsProviderError, OllamaUnavailableError
+
+if TYPE_CHECKING:
+    # String annotations below keep LangGraph out of API import time.
+    from quantgpt.agents.research_agent import ResearchAgent
 
 router = APIRouter(prefix="/api/v1", tags=["research"])
+logger = logging.getLogger(__name__)
 
+_OLLAMA_UNAVAILABLE_DETAIL = "Ollama is not available. Start with: ollama serve. Then: ollama pull llama3.2"
+_NEWS_UNAVAILABLE_DETAIL = "The news provider is not available. Try again later."
+_RESEARCH_FAILED_DETAIL = "Research failed"
 
-def get_research_agent() -> ResearchAgent:
-    """Dependency: create ResearchAgent with config."""
-    return ResearchAgent(
-        ollama_base_url=get_ollama_base_url(),
-        ollama_model=get_ollama_model(),
-    )
+
+def get_agent_registry(request: Request) -> AgentRegistry:
+    """Dependency: app-scoped registry of agents and pooled Ollama clients."""
+    return request.app.state.agent_registry
+
+
+def get_research_agent(
+    registry: AgentRegistry = Depends(get_agent_registry),
+) -> "ResearchAgent":
+    """Dependency: shared ResearchAgent for the configured Ollama URL and model."""
+    return registry.get_research_agent(get_ollama_base_url(), get_ollama_model())
 
 
 @router.post("/research", response_model=ResearchResponse)
-def run_research(
+async def run_research(
     body: ResearchRequest,
-    agent: ResearchAgent = Depends(get_research_agent),
+    agent: "ResearchAgent" = Depends(get_research_agent),
 ) -> ResearchResponse:
     """Run research agent on the given query. Returns investment insight."""
     try:
-        insight = agent.run(body.query)
+        insight = await agent.arun(body.query)
     except OllamaUnavailableError as e:
         raise HTTPException(
             status_code=503,
-            detail="Ollama is not available. Start with: ollama serve. Then: ollama pull llama3.2",
+            detail=_OLLAMA_UNAVAILABLE_DETAIL,
         ) from e
+    except NewsProviderError as e:
+        logger.warning("News provider failed: %s", e)
+        raise HTTPException(status_code=503, detail=_NEWS_UNAVAILABLE_DETAIL) from e
     return ResearchResponse(insight=insight)
+
+
+def _batch_item(query: str, result: str | Exception) -> BatchResearchItem:
+    """Convert one arun_batch result into a response item."""
+    if isinstance(result, OllamaUnavailableError):
+        return BatchResearchItem(query=query, error=_OLLAMA_UNAVAILABLE_DETAIL)
+    if isinstance(result, NewsProviderError):
+        logger.warning("News provider failed for %r: %s", query, result)
+        return BatchResearchItem(query=query, error=_NEWS_UNAVAILABLE_DETAIL)
+    if isinstance(result, Exception):
+        # Exception text can carry internal URLs and paths; keep it in the server log.
+        logger.error("Batch research failed for %r", query, exc_info=result)
+        return BatchResearchItem(query=query, error=_RESEARCH_FAILED_DETAIL)
+    return BatchResearchItem(query=query, insight=result)
+
+
+@router.post("/research/batch", response_model=BatchResearchResponse)
+async def run_research_batch(
+    body: BatchResearchRequest,
+    agent: "ResearchAgent" = Depends(get_research_agent),
+) -> BatchResearchResponse:
+    """Run research for many queries. Returns per-query insights or errors.
+
+    Duplicate queries are researched once; LLM calls are bounded by
+    RESEARCH_BATCH_CONCURRENCY.
+    """
+    results = await agent.arun_batch(
+        body.queries,
+        max_concurrency=get_research_batch_concurrency(),
+    )
+    return BatchResearchResponse(
+        results=[_batch_item(q, r) for q, r in zip(body.queries, results)]
+    )
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post(
+    "/research/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Server-sent events"}},
+)
+async def stream_research(
+    body: ResearchRequest,
+    agent: "ResearchAgent" = Depends(get_research_agent),
+) -> StreamingResponse:
+    """Stream research as server-sent events.
+
+    Emits `news` and `sentiment` as soon as those nodes finish, `token` for each
+    LLM chunk, then `insight` with the full text. Emits `error` if Ollama or the
+    news provider fails mid-stream (the 200 status has already been sent by then).
+    """
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event, data in agent.astream(body.query):
+                yield _sse(event, data)
+        except OllamaUnavailableError:
+            yield _sse("error", {"detail": _OLLAMA_UNAVAILABLE_DETAIL})
+        except NewsProviderError as e:
+            logger.warning("News provider failed: %s", e)
+            yield _sse("error", {"detail": _NEWS_UNAVAILABLE_DETAIL})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,9 +2,18 @@
 
 from .health import HealthResponse
 from .models import ModelInfoSchema, ModelsResponse
-from .research import ResearchRequest, ResearchResponse
+from .research import (
+    BatchResearchItem,
+    BatchResearchRequest,
+    BatchResearchResponse,
+    ResearchRequest,
+    ResearchResponse,
+)
 
 __all__ = [
+    "BatchResearchItem",
+    "BatchResearchRequest",
+    "BatchResearchResponse",
     "HealthResponse",
     "ModelInfoSchema",
     "ModelsResponse",
@@ -13,3 +13,28 @@ class ResearchResponse(BaseModel):
     """Response for POST /api/v1/research."""
 
     insight: str = Field(..., description="Investment insight from the research agent")
+
+
+class BatchResearchRequest(BaseModel):
+    """Request for POST /api/v1/research/batch."""
+
+    queries: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Research queries; identical queries (ignoring case/whitespace) are run once",
+    )
+
+
+class BatchResearchItem(BaseModel):
+    """Result for one query in a batch."""
+
+    query: str = Field(..., description="Query as submitted")
+    insight: str | None = Field(None, description="Investment insight, if the query succeeded")
+    error: str | None = Field(None, description="Error message, if the query failed")
+
+
+class BatchResearchResponse(BaseModel):
+    """Response for POST /api/v1/research/batch."""
+
+    results: list[BatchResearchItem] = Field(..., description="Per-query results, in request order")
@@ -0,0 +1,16 @@
+"""Vectorized backtesting of forecaster and optimizer strategies."""
+from .engine import BacktestMetrics, BacktestResult, backtest, metrics, rebalance_schedule, simulate
+from .strategies import equal_weight, forecast_strategy, long_only, optimizer_strategy
+
+__all__ = [
+    "BacktestMetrics",
+    "BacktestResult",
+    "backtest",
+    "equal_weight",
+    "forecast_strategy",
+    "long_only",
+    "metrics",
+    "optimizer_strategy",
+    "rebalance_schedule",
+    "simulate",
+]
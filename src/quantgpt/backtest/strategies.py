@@ -0,0 +1,152 @@
+"""Built-in strategies: price panel and rebalance bars to target weights.
+
+Every strategy has the signature strategy(prices, rebalance, **params)
+and returns weights of shape (n_rebalances, n_assets). Row k uses only
+prices up to and including bar rebalance[k].
+"""
+
+from collections.abc import Hashable, Iterable, Sequence
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..forecasting.engine import AR_BLOCK_FLOATS, as_panel, forecast
+from ..portfolio import optimize
+
+
+def _history(rebalance: Any, lookback: int) -> np.ndarray:
+    bars = np.asarray(rebalance, dtype=np.intp)
+    if bars.size and bars[0] < lookback:
+        raise ValueError(f"First rebalance bar {bars[0]} leaves less than lookback={lookback} bars of history")
+    return bars
+
+
+def long_only(scores: np.ndarray, top: int | None = None) -> np.ndarray:
+    """Turn scores (n_rebalances, n_assets) into long-only weights.
+
+    Only positive scores get weight. With top, the top assets (at most
+    top of them) are equal weighted; otherwise weights are proportional
+    to the score. A row with no positive score stays in cash.
+    """
+    positive = np.where(scores > 0, scores, 0.0)
+    if top is not None:
+        if top < 1:
+            raise ValueError("top must be at least 1")
+        if top < scores.shape[1]:
+            cutoff = -np.partition(-scores, top - 1, axis=1)[:, top - 1 : top]
+            positive = np.where(scores >= cutoff, positive, 0.0)
+        chosen = positive > 0
+        count = chosen.sum(axis=1, keepdims=True)
+        return np.divide(chosen, count, out=np.zeros_like(positive), where=count > 0)
+    total = positive.sum(axis=1, keepdims=True)
+    return np.divide(positive, total, out=np.zeros_like(positive), where=total > 0)
+
+
+def equal_weight(prices: Any, rebalance: Any) -> np.ndarray:
+    """Equal weights across all assets at every rebalance."""
+    n_assets = as_panel(prices).shape[0]
+    return np.full((len(rebalance), n_assets), 1.0 / n_assets)
+
+
+def forecast_strategy(
+    prices: Any,
+    rebalance: Any,
+    model: str = "drift",
+    lookback: int = 60,
+    steps: int = 5,
+    top: int | None = None,
+    **params: Any,
+) -> np.ndarray:
+    """Hold assets whose forecast price steps ahead is above today's.
+
+    The lookback-bar windows ending at every rebalance bar become one
+    panel, forecast in a single forecasting.engine call. Large schedules
+    are split into blocks of about AR_BLOCK_FLOATS values. Weights come from
+    long_only() applied to the forecast return.
+
+    Parameters
+    ----------
+    prices : array_like
+        Prices (n_assets, n_obs).
+    rebalance : array_like
+        Rebalance bars, each at least lookback - 1.
+    model : str
+        Forecasting model (see forecasting.MODELS).
+    lookback : int
+        Bars of history per forecast.
+    steps : int
+        Forecast horizon in bars.
+    top : int | None
+        Hold at most this many assets, equal weighted.
+    **params : Any
+        Model parameters.
+
+    Returns
+    -------
+    np.ndarray
+        Target weights (n_rebalances, n_assets).
+    """
+    panel = as_panel(prices, min_obs=lookback)
+    bars = _history(rebalance, lookback - 1)
+    n_assets = panel.shape[0]
+    windows = sliding_window_view(panel, lookback, axis=1)  # window j ends at bar j + lookback - 1
+    scores = np.empty((bars.size, n_assets))
+    block = max(1, AR_BLOCK_FLOATS // (n_assets * lookback))
+    for lo in range(0, bars.size, block):
+        chunk = bars[lo : lo + block]
+        history = windows[:, chunk - (lookback - 1)].transpose(1, 0, 2).reshape(-1, lookback)
+        expected = forecast(history, steps=steps, model=model, **params).mean[:, -1] / history[:, -1] - 1
+        scores[lo : lo + chunk.size] = expected.reshape(chunk.size, n_assets)
+    return long_only(scores, top)
+
+
+def optimizer_strategy(
+    prices: Any,
+    rebalance: Any,
+    objective: str = "min_variance",
+    lookback: int = 120,
+    universe: Iterable[Hashable] | None = None,
+    dates: Sequence[Hashable] | None = None,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Re-optimize on the trailing lookback returns at every rebalance.
+
+    Parameters
+    ----------
+    prices : array_like
+        Prices (n_assets, n_obs).
+    rebalance : array_like
+        Rebalance bars, each at least lookback.
+    objective : str
+        portfolio.optimize objective.
+    lookback : int
+        Returns per estimation window.
+    universe : Iterable[Hashable] | None
+        Asset ids in row order of prices.
+    dates : Sequence[Hashable] | None
+        One label per bar. With universe, each window's covariance is
+        cached under window_end dates[bar], so grid points that differ only
+        in other options share it.
+    **kwargs : Any
+        portfolio.optimize options (estimator, upper, risk_aversion, cache, ...).
+
+    Returns
+    -------
+    np.ndarray
+        Target weights (n_rebalances, n_assets).
+    """
+    panel = as_panel(prices, min_obs=lookback + 1)
+    bars = _history(rebalance, lookback)
+    returns = (panel[:, 1:] / panel[:, :-1] - 1).T  # row t - 1 is the return into bar t
+    if universe is not None and dates is not None:
+        universe = tuple(universe)
+        windows = [{"universe": universe, "window_end": dates[bar]} for bar in bars]
+    else:
+        windows = [{}] * len(bars)
+    return np.stack(
+        [
+            optimize(returns[bar - lookback : bar], objective=objective, **window, **kwargs).weights
+            for bar, window in zip(bars, windows)
+        ]
+    )
@@ -0,0 +1,366 @@
+"""Streaming batch jobs behind `quantgpt sentiment` and `quantgpt forecast`.
+
+Records stream in from JSONL or CSV files (or stdin) and are grouped into
+chunks. Each chunk goes to a process pool: raw JSONL lines, or parsed CSV
+rows. Workers parse, score and serialize, so the main process only moves
+text. At most max_in_flight chunks are pending at once, so memory stays
+flat however long the input is. Results are written to stdout in input
+order, as each chunk's turn comes. Progress and throughput go to stderr.
+
+JSONL output is the input line with the result fields appended; the
+record is not re-encoded. A record that cannot be processed (bad JSON,
+missing field, unparsable prices) is still written, in its position,
+with an "error" field, and the job goes on.
+"""
+
+import csv
+import gzip
+import inspect
+import io
+import json
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Any
+
+FORMATS = ("jsonl", "csv")
+_NUMBER_SEP = re.compile(r"[\s,;]+")
+
+
+def _open(path: str) -> IO[str]:
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def read_items(paths: Iterable[str], fmt: str = "jsonl") -> Iterator[str | dict[str, str]]:
+    """Yield non-blank JSONL lines, or CSV rows as dicts, from each path ("-" is stdin)."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {FORMATS}")
+    for path in paths:
+        with _open(path) as stream:
+            if fmt == "csv":
+                yield from csv.DictReader(stream)
+            else:
+                yield from (line for line in stream if not line.isspace())
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Consecutive lists of up to size items."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def run_ordered(
+    fn: Callable[[list[Any]], Any],
+    chunks: Iterable[list[Any]],
+    executor: Executor | None = None,
+    max_in_flight: int = 4,
+) -> Iterator[Any]:
+    """Apply fn to each chunk, yielding results in input order.
+
+    With an executor, at most max_in_flight chunks are submitted and not
+    yet yielded; reading input stops until the oldest one finishes.
+    Without one, chunks run in this process.
+    """
+    if executor is None:
+        yield from map(fn, chunks)
+        return
+    pending: deque[Future] = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(fn, chunk))
+        if len(pending) >= max(max_in_flight, 1):
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def parse_prices(value: Any) -> list[float]:
+    """A list of numbers, or a string of numbers separated by spaces, commas or semicolons."""
+    if isinstance(value, str):
+        value = [v for v in _NUMBER_SEP.split(value.strip()) if v]
+    if not isinstance(value, list) or not value:
+        raise ValueError("expected a non-empty list of prices")
+    return [float(v) for v in value]
+
+
+class BatchJob(ABC):
+    """One chunk's work: parse, compute, serialize (pickled to workers).
+
+    Subclasses set result_fields and implement extract() and compute().
+    """
+
+    result_fields: tuple[str, ...] = ()
+
+    def __init__(self, field: str, fmt: str = "jsonl") -> None:
+        self.field = field
+        self.fmt = fmt
+
+    @abstractmethod
+    def extract(self, record: dict[str, Any]) -> Any:
+        """The input to compute for one record; raise KeyError, TypeError or ValueError to reject it."""
+        ...
+
+    @abstractmethod
+    def compute(self, inputs: list[Any]) -> list[dict[str, Any]]:
+        """Result fields (or {"error": ...}) for each input, in order."""
+        ...
+
+    def __call__(self, items: list[Any]) -> tuple[list[Any], int]:
+        """Process a chunk; return output lines (JSONL) or rows (CSV) and the error count."""
+        records: list[dict[str, Any] | None] = []
+        results: list[dict[str, Any]] = []
+        inputs, slots = [], []
+        for item in items:
+            record, result = None, {}
+            try:
+                record = json.loads(item) if self.fmt == "jsonl" else item
+                if not isinstance(record, dict):
+                    record = None
+                    raise TypeError("expected a JSON object")
+                inputs.append(self.extract(record))
+                slots.append(len(results))
+            except json.JSONDecodeError as e:
+                result = {"error": f"invalid JSON: {e.msg}"}
+            except (KeyError, TypeError, ValueError) as e:
+                result = {"error": f"{type(e).__name__}: {e}"}
+            records.append(record)
+            results.append(result)
+        for slot, result in zip(slots, self.compute(inputs) if inputs else []):
+            results[slot] = result
+        errors = sum("error" in r for r in results)
+        if self.fmt == "csv":
+            return [{**(rec or {}), **res} for rec, res in zip(records, results)], errors
+        return [_jsonl(item, rec, res) for item, rec, res in zip(items, records, results)], errors
+
+
+def _jsonl(line: str, record: dict[str, Any] | None, result: dict[str, Any]) -> str:
+    """Append result fields to the input line, re-encoding only when it cannot be spliced."""
+    if not record:
+        return json.dumps(result, separators=(",", ":")) + "\n"
+    if any(key in record for key in result):
+        return json.dumps({**record, **result}, separators=(",", ":")) + "\n"
+    body = line.rstrip()
+    return f"{body[:-1].rstrip()},{json.dumps(result, separators=(',', ':'))[1:]}\n"
+
+
+class SentimentJob(BatchJob):
+    """Add "sentiment": the compound score of the text field."""
+
+    result_fields = ("sentiment", "error")
+
+    def __init__(self, field: str = "text", fmt: str = "jsonl", backend: str = "vader") -> None:
+        super().__init__(field, fmt)
+        self.backend = backend
+
+    def extract(self, record: dict[str, Any]) -> str:
+        text = record[self.field]
+        if not isinstance(text, str):
+            raise TypeError(f"{self.field!r} must be a string")
+        return text
+
+    def compute(self, inputs: list[str]) -> list[dict[str, Any]]:
+        from .nlp import analyze_sentiment_batch
+
+        scores = analyze_sentiment_batch(inputs, workers=1, chunk_size=len(inputs), backend=self.backend)
+        return [{"sentiment": score} for score in scores]
+
+
+class ForecastJob(BatchJob):
+    """Add "forecast", "lower" and "upper": the forecast of the price series in the field."""
+
+    result_fields = ("forecast", "lower", "upper", "error")
+
+    def __init__(
+        self,
+        field: str = "prices",
+        fmt: str = "jsonl",
+        steps: int = 1,
+        model: str = "naive",
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(field, fmt)
+        self.steps = steps
+        self.model = model
+        self.params = params or {}
+
+    def extract(self, record: dict[str, Any]) -> list[float]:
+        return parse_prices(record[self.field])
+
+    def compute(self, inputs: list[list[float]]) -> list[dict[str, Any]]:
+        """One engine call per distinct series length in the chunk."""
+        import numpy as np
+
+        from .forecasting import forecast
+
+        out: list[dict[str, Any]] = [{}] * len(inputs)
+        by_length: dict[int, list[int]] = {}
+        for i, series in enumerate(inputs):
+            by_length.setdefault(len(series), []).append(i)
+        for idx in by_length.values():
+            try:
+                fc = forecast(np.array([inputs[i] for i in idx]), steps=self.steps, model=self.model, **self.params)
+            except ValueError as e:
+                if len(idx) == 1:
+                    out[idx[0]] = {"error": f"ValueError: {e}"}
+                    continue
+                # Isolate the bad series (e.g. NaN prices) instead of failing the group.
+                for i in idx:
+                    out[i] = self.compute([inputs[i]])[0]
+                continue
+            mean, lower, upper = fc.mean.tolist(), fc.lower.tolist(), fc.upper.tolist()
+            for row, i in enumerate(idx):
+                out[i] = {"forecast": mean[row], "lower": lower[row], "upper": upper[row]}
+        return out
+
+
+class Progress:
+    """Rate-limited progress lines (records, records/s) on a stream, usually stderr."""
+
+    def __init__(self, stream: IO[str] | None, label: str, interval: float = 2.0) -> None:
+        self.stream = stream
+        self.label = label
+        self.interval = interval
+        self.count = 0
+        self.errors = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def advance(self, n: int, errors: int = 0) -> None:
+        self.count += n
+        self.errors += errors
+        now = time.perf_counter()
+        if self.stream is not None and now - self._last >= self.interval:
+            self._last = now
+            self._report(now, "")
+
+    def _report(self, now: float, prefix: str) -> None:
+        elapsed = max(now - self.start, 1e-9)
+        errors = f", {self.errors} errors" if self.errors else ""
+        print(
+            f"{prefix}{self.label}: {self.count} records in {elapsed:.1f}s ({self.count / elapsed:,.0f}/s{errors})",
+            file=self.stream,
+            flush=True,
+        )
+
+    def finish(self) -> None:
+        if self.stream is not None:
+            self._report(time.perf_counter(), "done ")
+
+
+def _csv_cell(value: Any) -> Any:
+    return " ".join(map(str, value)) if isinstance(value, list) else value
+
+
+def run_job(
+    job: BatchJob,
+    paths: Iterable[str],
+    out: IO[str],
+    workers: int = 1,
+    chunk_size: int = 1024,
+    max_in_flight: int | None = None,
+    progress: IO[str] | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: Sequence[Any] = (),
+) -> Progress:
+    """Stream every input record through job and write the results to out in input order.
+
+    Parameters
+    ----------
+    job : BatchJob
+        Work per chunk; must be picklable when workers > 1.
+    paths : Iterable[str]
+        Input files; "-" is stdin.
+    out : IO[str]
+        Output text stream.
+    workers : int
+        Worker processes; 1 runs chunks in this process.
+    chunk_size : int
+        Records per task.
+    max_in_flight : int | None
+        Chunks submitted but not yet written (default 2 x workers).
+    progress : IO[str] | None
+        Stream for progress lines, or None for silence.
+    initializer, initargs
+        Worker process initializer, e.g. to load models once.
+
+    Returns
+    -------
+    Progress
+        Final record and error counts.
+    """
+    tracker = Progress(progress, type(job).__name__.removesuffix("Job").lower())
+    writer: csv.DictWriter | None = None
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=tuple(initargs))
+    try:
+        chunks = chunked(read_items(paths, job.fmt), chunk_size)
+        for outputs, errors in run_ordered(job, chunks, executor, max_in_flight or 2 * workers):
+            if job.fmt == "jsonl":
+                out.write("".join(outputs))
+            else:
+                if writer is None:
+                    # Header: the first record's columns, then every result column.
+                    fields = list(dict.fromkeys([*outputs[0], *job.result_fields]))
+                    writer = csv.DictWriter(out, fields, extrasaction="ignore", lineterminator="\n")
+                    writer.writeheader()
+                writer.writerows({k: _csv_cell(v) for k, v in row.items()} for row in outputs)
+            tracker.advance(len(outputs), errors)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    tracker.finish()
+    return tracker
+
+
+def run_sentiment(
+    paths: Iterable[str],
+    out: IO[str],
+    fmt: str = "jsonl",
+    field: str = "text",
+    backend: str = "vader",
+    **options: Any,
+) -> Progress:
+    """Score the text field of every record, adding a "sentiment" field (options as in run_job)."""
+    from .nlp.sentiment import check_backend, init_worker
+
+    check_backend(backend)
+    job = SentimentJob(field, fmt, backend)
+    return run_job(job, paths, out, initializer=init_worker, initargs=(backend,), **options)
+
+
+def run_forecast(
+    paths: Iterable[str],
+    out: IO[str],
+    fmt: str = "jsonl",
+    field: str = "prices",
+    steps: int = 1,
+    model: str = "naive",
+    params: dict[str, Any] | None = None,
+    **options: Any,
+) -> Progress:
+    """Forecast the price series of every record, adding "forecast", "lower" and "upper" (options as in run_job).
+
+    Unknown models, steps below 1 and params the model does not take raise
+    ValueError before any input is read.
+    """
+    from .forecasting.engine import MODELS
+
+    if model not in MODELS:
+        raise ValueError(f"Unknown forecasting model {model!r}; expected one of {tuple(MODELS)}")
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    try:
+        inspect.signature(MODELS[model]).bind(None, steps, **(params or {}))
+    except TypeError as e:
+        raise ValueError(f"Invalid params for model {model!r}: {e}") from None
+    return run_job(ForecastJob(field, fmt, steps, model, params), paths, out, **options)
@@ -1,24 +1,105 @@
-"""Command line interface for QuantGPT."""
+"""Command line interface for QuantGPT.
+
+Feature modules are imported inside the branch that needs them, so a
+--forecast run does not load the sentiment lexicon (and vice versa).
+
+`quantgpt sentiment` and `quantgpt forecast` are streaming batch jobs:
+they read JSONL or CSV records from files or stdin and write each record
+with its result to stdout, in input order (see quantgpt.batch).
+"""
 import argparse
-from .nlp import analyze_sentiment
-from .forecasting import PriceForecaster
-from .portfolio import optimize_portfolio
+import json
+import os
+import sys
+
+
+def _json_object(text: str) -> dict:
+    """argparse type: a JSON object, e.g. '{"p": 2}'."""
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"invalid JSON: {e.msg}") from None
+    if not isinstance(value, dict):
+        raise argparse.ArgumentTypeError("must be a JSON object")
+    return value
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="QuantGPT CLI")
+def _batch_options(parser: argparse.ArgumentParser, field: str, chunk_size: int) -> None:
+    parser.add_argument("inputs", nargs="*", default=["-"], help="Input files (.gz allowed); '-' or none for stdin")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="Input and output format")
+    parser.add_argument("--field", default=field, help=f"Record field to read (default: {field})")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (1 runs in-process)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=chunk_size, help="Records per worker task")
+    parser.add_argument("--max-in-flight", type=int, help="Chunks queued or running at once (default: 2 x workers)")
+    parser.add_argument("--quiet", action="store_true", help="No progress on stderr")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="quantgpt", description="QuantGPT CLI")
     parser.add_argument("--sentiment", help="Text to analyze")
     parser.add_argument("--forecast", nargs="*", type=float, help="Prices for forecasting")
-    args = parser.parse_args()
+    commands = parser.add_subparsers(dest="command", metavar="{sentiment,forecast}")
+
+    sentiment = commands.add_parser("sentiment", help="Score the text of every input record")
+    _batch_options(sentiment, "text", 1024)
+    sentiment.add_argument("--backend", choices=("vader", "fast"), default="vader", help="Sentiment scorer")
+
+    forecast = commands.add_parser("forecast", help="Forecast the price series of every input record")
+    _batch_options(forecast, "prices", 4096)
+    forecast.add_argument("--model", default="naive", help="Forecasting model (naive, drift, ewma, ar, holt_winters)")
+    forecast.add_argument("--steps", type=int, default=1, help="Forecast horizon")
+    forecast.add_argument("--params", type=_json_object, default={}, help='Model parameters as JSON, e.g. \'{"p": 2}\'')
+    return parser
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    from . import batch
+
+    common = dict(
+        fmt=args.format,
+        field=args.field,
+        workers=max(args.workers, 1),
+        chunk_size=max(args.chunk_size, 1),
+        max_in_flight=args.max_in_flight,
+        progress=None if args.quiet else sys.stderr,
+    )
+    try:
+        if args.command == "sentiment":
+            batch.run_sentiment(args.inputs, sys.stdout, backend=args.backend, **common)
+        else:
+            batch.run_forecast(
+                args.inputs, sys.stdout, steps=args.steps, model=args.model, params=args.params, **common
+            )
+    except (OSError, TypeError, ValueError) as e:
+        # TypeError: e.g. a model parameter of the wrong type, raised in a worker.
+        print(f"quantgpt {args.command}: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command:
+        return _run_batch(args)
 
     if args.sentiment:
+        from .nlp import analyze_sentiment
+
         score = analyze_sentiment(args.sentiment)
         print(f"Sentiment score: {score}")
 
     if args.forecast:
+        from .forecasting import PriceForecaster
+
         model = PriceForecaster(args.forecast)
         print(model.forecast())
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
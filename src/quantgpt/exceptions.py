@@ -7,3 +7,11 @@ class OllamaUnavailableError(Exception):
     def __init__(self, message: str, cause: Exception | None = None) -> None:
         self.cause = cause
         super().__init__(message)
+
+
+class NewsProviderError(Exception):
+    """Raised when a remote news provider fails after all retries."""
+
+    def __init__(self, message: str, cause: Exception | None = None) -> None:
+        self.cause = cause
+        super().__init__(message)
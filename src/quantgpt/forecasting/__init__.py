@@ -1,4 +1,16 @@
 """Forecasting models for QuantGPT."""
+from .engine import MODELS, Forecast, forecast
 from .models import PriceForecaster
+from .online import OnlineAR, OnlineEWMA, OnlineForecaster, OnlineHolt, load_state
 
-__all__ = ["PriceForecaster"]
+__all__ = [
+    "MODELS",
+    "Forecast",
+    "OnlineAR",
+    "OnlineEWMA",
+    "OnlineForecaster",
+    "OnlineHolt",
+    "PriceForecaster",
+    "forecast",
+    "load_state",
+]
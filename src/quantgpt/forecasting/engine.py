@@ -0,0 +1,436 @@
+"""Vectorized forecasting engine.
+
+Every model fits and forecasts a whole panel at once. The panel is a 2-D
+array of shape (n_series, n_obs), one row per symbol with the oldest
+observation first. Work is vectorized across series. Recursive smoothers
+loop over time, doing one array operation per step for all series, and
+AR(p) fits solve all the least-squares problems in one batched call.
+
+Prediction intervals assume Gaussian one-step errors. Their width grows
+with the horizon, following each model's error-propagation formula.
+"""
+
+from collections.abc import Callable
+from statistics import NormalDist
+from typing import Any, NamedTuple
+
+import numpy as np
+
+# Smoothing weights tried per series when ewma() is not given alpha.
+ALPHA_GRID = np.linspace(0.05, 0.95, 19)
+
+# Design-matrix floats built at once by fit_ar (32 MiB).
+AR_BLOCK_FLOATS = 1 << 22
+
+
+class Forecast(NamedTuple):
+    """Point forecasts and prediction interval bounds, each (n_series, steps)."""
+
+    mean: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+
+def as_panel(y: Any, min_obs: int = 1) -> np.ndarray:
+    """Return y as a C-contiguous float64 array of shape (n_series, n_obs).
+
+    A 1-D input is treated as a single series.
+
+    Raises
+    ------
+    ValueError
+        If y is not 1-D or 2-D, has fewer than min_obs observations, or
+        contains non-finite values.
+    """
+    panel = np.ascontiguousarray(y, dtype=np.float64)
+    if panel.ndim == 1:
+        panel = panel[np.newaxis, :]
+    if panel.ndim != 2:
+        raise ValueError(f"Expected a 1-D or 2-D array, got {panel.ndim}-D")
+    if panel.shape[1] < min_obs:
+        raise ValueError(f"Need at least {min_obs} observations per series, got {panel.shape[1]}")
+    if not np.isfinite(panel).all():
+        raise ValueError("Price data contains NaN or infinite values")
+    return panel
+
+
+def _z(level: float) -> float:
+    if not 0 < level < 1:
+        raise ValueError("level must be in (0, 1)")
+    return NormalDist().inv_cdf(0.5 + level / 2)
+
+
+def prediction_interval(mean: np.ndarray, sigma2: np.ndarray, var_factor: np.ndarray, level: float) -> Forecast:
+    """Build a Forecast from per-series error variance and per-horizon multipliers.
+
+    Shared with the incremental forecasters in forecasting.online. var_factor is (steps,) or (n_series, steps); the h-step variance is
+    sigma2 * var_factor[h - 1].
+    """
+    half = _z(level) * np.sqrt(sigma2[:, np.newaxis] * var_factor)
+    return Forecast(mean, mean - half, mean + half)
+
+
+def _mse(errors: np.ndarray, dof: int) -> np.ndarray:
+    """Per-series mean squared error over the last axis with dof parameters removed."""
+    n = errors.shape[-1] - dof
+    if n <= 0:
+        return np.zeros(errors.shape[:-1])
+    return np.einsum("...t,...t->...", errors, errors) / n
+
+
+def _by_time(panel: np.ndarray) -> np.ndarray:
+    """Transpose to (n_obs, n_series) so each time step is one contiguous row."""
+    return np.ascontiguousarray(panel.T)
+
+
+def naive(y: Any, steps: int = 1, level: float = 0.95) -> Forecast:
+    """Random walk: repeat the last value.
+
+    Parameters
+    ----------
+    y : array_like
+        Panel (n_series, n_obs) or a single series.
+    steps : int
+        Forecast horizon.
+    level : float
+        Prediction interval coverage.
+
+    Returns
+    -------
+    Forecast
+        h-step variance is h times the variance of one-step changes.
+    """
+    panel = as_panel(y)
+    mean = np.repeat(panel[:, -1:], steps, axis=1)
+    sigma2 = _mse(np.diff(panel, axis=1), 0)
+    return prediction_interval(mean, sigma2, np.arange(1, steps + 1, dtype=np.float64), level)
+
+
+def drift(y: Any, steps: int = 1, level: float = 0.95) -> Forecast:
+    """Random walk with drift: extend the line through the first and last values.
+
+    Parameters
+    ----------
+    y : array_like
+        Panel (n_series, n_obs) or a single series, at least 2 observations.
+    steps : int
+        Forecast horizon.
+    level : float
+        Prediction interval coverage.
+
+    Returns
+    -------
+    Forecast
+        Intervals include the uncertainty of the estimated drift.
+    """
+    panel = as_panel(y, min_obs=2)
+    t = panel.shape[1]
+    slope = (panel[:, -1] - panel[:, 0]) / (t - 1)
+    h = np.arange(1, steps + 1, dtype=np.float64)
+    mean = panel[:, -1:] + slope[:, np.newaxis] * h
+    sigma2 = _mse(np.diff(panel, axis=1) - slope[:, np.newaxis], 1)
+    return prediction_interval(mean, sigma2, h * (1 + h / (t - 1)), level)
+
+
+def _ses_errors(panel: np.ndarray, alphas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Run simple exponential smoothing for every (alpha, series) pair.
+
+    alphas broadcasts against (n_series,). Returns the final levels and the
+    sum of squared one-step errors.
+    """
+    steps = _by_time(panel)
+    level = np.broadcast_to(steps[0], np.broadcast_shapes(alphas.shape, panel.shape[:1])).copy()
+    sse = np.zeros_like(level)
+    err = np.empty_like(level)
+    for row in steps[1:]:
+        np.subtract(row, level, out=err)
+        sse += err * err
+        err *= alphas
+        level += err
+    return level, sse
+
+
+def ewma(y: Any, steps: int = 1, level: float = 0.95, alpha: float | None = None) -> Forecast:
+    """Simple exponential smoothing (EWMA level, flat forecast).
+
+    Parameters
+    ----------
+    y : array_like
+        Panel (n_series, n_obs) or a single series.
+    steps : int
+        Forecast horizon.
+    level : float
+        Prediction interval coverage.
+    alpha : float | None
+        Smoothing weight in (0, 1]. None picks, per series, the value on
+        ALPHA_GRID with the smallest one-step squared error. All grid values
+        are fitted in one pass.
+
+    Returns
+    -------
+    Forecast
+        h-step variance is sigma2 * (1 + (h - 1) * alpha**2).
+    """
+    panel = as_panel(y)
+    n, t = panel.shape
+    if alpha is None:
+        final, sse = _ses_errors(panel, ALPHA_GRID[:, np.newaxis])
+        best = np.argmin(sse, axis=0)
+        cols = np.arange(n)
+        alphas, final, sse = ALPHA_GRID[best], final[best, cols], sse[best, cols]
+    else:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        alphas = np.full(n, alpha)
+        final, sse = _ses_errors(panel, alphas)
+    mean = np.repeat(final[:, np.newaxis], steps, axis=1)
+    sigma2 = sse / (t - 1) if t > 1 else np.zeros(n)
+    h = np.arange(steps, dtype=np.float64)
+    return prediction_interval(mean, sigma2, 1 + h * alphas[:, np.newaxis] ** 2, level)
+
+
+def fit_ar(x: np.ndarray, p: int, ridge: float = 1e-8) -> tuple[np.ndarray, np.ndarray]:
+    """Fit AR(p) with intercept to every row of x by batched least squares.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Panel (n_series, n_obs) with n_obs > p + 1.
+    p : int
+        Lag order.
+    ridge : float
+        Relative diagonal loading of the normal equations, so that flat
+        series still have a solution.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Coefficients (n_series, p + 1), intercept first and then lags 1..p,
+        and the residual variance per series.
+    """
+    n, t = x.shape
+    coef = np.empty((n, p + 1))
+    sigma2 = np.empty(n)
+    block = max(1, AR_BLOCK_FLOATS // ((t - p) * (p + 1)))
+    for lo in range(0, n, block):
+        coef[lo : lo + block], sigma2[lo : lo + block] = _fit_ar_block(x[lo : lo + block], p, ridge)
+    return coef, sigma2
+
+
+def _fit_ar_block(x: np.ndarray, p: int, ridge: float) -> tuple[np.ndarray, np.ndarray]:
+    n, t = x.shape
+    # Strided view, no copy: windows[:, i, j] = x[:, i + j].
+    windows = np.lib.stride_tricks.sliding_window_view(x, p + 1, axis=1)
+    target = windows[:, :, p]
+    design = np.empty((n, t - p, p + 1))
+    design[:, :, 0] = 1.0
+    design[:, :, 1:] = windows[:, :, p - 1 :: -1]
+    design_t = design.transpose(0, 2, 1)
+    gram = design_t @ design
+    gram += ridge * np.trace(gram, axis1=1, axis2=2)[:, None, None] * np.eye(p + 1)
+    rhs = design_t @ target[:, :, np.newaxis]
+    coef = np.linalg.solve(gram, rhs)[:, :, 0]
+    resid = target - (design @ coef[:, :, np.newaxis])[:, :, 0]
+    return coef, _mse(resid, p + 1)
+
+
+def _psi_weights(phi: np.ndarray, steps: int) -> np.ndarray:
+    """MA(inf) weights psi_0..psi_{steps-1} of AR coefficients phi (n_series, p)."""
+    n, p = phi.shape
+    psi = np.zeros((n, steps))
+    psi[:, 0] = 1.0
+    for j in range(1, steps):
+        k = min(j, p)
+        psi[:, j] = np.einsum("ni,ni->n", phi[:, :k], psi[:, j - 1 :: -1][:, :k])
+    return psi
+
+
+def ar_forecast(
+    coef: np.ndarray,
+    sigma2: np.ndarray,
+    history: np.ndarray,
+    steps: int = 1,
+    level: float = 0.95,
+    last: np.ndarray | None = None,
+) -> Forecast:
+    """Forecast fitted AR(p) models from their last p values.
+
+    Shared by ar() and forecasting.online.OnlineAR.
+
+    Parameters
+    ----------
+    coef : np.ndarray
+        (n_series, p + 1): intercept, then lag coefficients.
+    sigma2 : np.ndarray
+        One-step error variance per series.
+    history : np.ndarray
+        (n_series, p): last p modelled values, most recent first.
+    steps : int
+        Forecast horizon.
+    level : float
+        Prediction interval coverage.
+    last : np.ndarray | None
+        Last level per series when the model is of one-step changes; the
+        forecast is integrated back onto it. None if the model is of levels.
+
+    Returns
+    -------
+    Forecast
+        Intervals come from the model's MA(inf) weights.
+    """
+    intercept, phi = coef[:, 0], coef[:, 1:]
+    history = history.copy()
+    path = np.empty((coef.shape[0], steps))
+    for h in range(steps):
+        nxt = intercept + np.einsum("ni,ni->n", phi, history)
+        path[:, h] = nxt
+        history = np.roll(history, 1, axis=1)
+        history[:, 0] = nxt
+
+    psi = _psi_weights(phi, steps)
+    if last is not None:
+        path = last[:, np.newaxis] + np.cumsum(path, axis=1)
+        psi = np.cumsum(psi, axis=1)
+    return prediction_interval(path, sigma2, np.cumsum(psi * psi, axis=1), level)
+
+
+def ar(y: Any, steps: int = 1, level: float = 0.95, p: int = 1, difference: bool = True) -> Forecast:
+    """Autoregressive model of order p, fitted by batched least squares.
+
+    Parameters
+    ----------
+    y : array_like
+        Panel (n_series, n_obs) or a single series, with more than p + 2
+        observations.
+    steps : int
+        Forecast horizon.
+    level : float
+        Prediction interval coverage.
+    p : int
+        Number of lags.
+    difference : bool
+        Fit the AR model to one-step changes and integrate the forecast
+        back to levels, i.e. ARIMA(p, 1, 0). Prices are rarely stationary,
+        so this is the default.
+
+    Returns
+    -------
+    Forecast
+        Intervals come from the model's MA(inf) weights.
+    """
+    if p < 1:
+        raise ValueError("p must be at least 1")
+    panel = as_panel(y, min_obs=p + 2 + int(difference))
+    x = np.diff(panel, axis=1) if difference else panel
+    coef, sigma2 = fit_ar(x, p)
+    # The last p values, most recent first.
+    return ar_forecast(coef, sigma2, x[:, : -p - 1 : -1], steps, level, panel[:, -1] if difference else None)
+
+
+def holt_winters(
+    y: Any,
+    steps: int = 1,
+    level: float = 0.95,
+    period: int | None = None,
+    alpha: float = 0.3,
+    beta: float = 0.1,
+    gamma: float = 0.1,
+) -> Forecast:
+    """Additive Holt-Winters: level, trend and (optionally) seasonal components.
+
+    Parameters
+    ----------
+    y : array_like
+        Panel (n_series, n_obs) or a single series. Needs 2 observations,
+        or 2 * period with a season.
+    steps : int
+        Forecast horizon.
+    level : float
+        Prediction interval coverage.
+    period : int | None
+        Season length in observations (e.g. 5 for weekdays). None or 1
+        fits Holt's linear trend without seasonality.
+    alpha, beta, gamma : float
+        Smoothing weights for level, trend and season, each in [0, 1].
+
+    Returns
+    -------
+    Forecast
+        Intervals use the ETS(A,A,A) variance formula.
+    """
+    m = period if period and period > 1 else 0
+    panel = as_panel(y, min_obs=max(2, 2 * m))
+    n, t = panel.shape
+    rows = _by_time(panel)
+    if m:
+        first = rows[:m].mean(axis=0)
+        lvl = first
+        trend = (rows[m : 2 * m].mean(axis=0) - first) / m
+        # season[k] is the seasonal offset of time steps congruent to k mod m.
+        season = rows[:m] - first
+        start = m
+    else:
+        lvl = rows[0].copy()
+        trend = rows[1] - rows[0]
+        season = np.zeros((1, n))
+        start = 1
+    gamma = gamma if m else 0.0
+
+    sse = np.zeros(n)
+    for i in range(start, t):
+        s = season[i % m] if m else 0.0
+        err = rows[i] - (lvl + trend + s)
+        sse += err * err
+        lvl = lvl + trend + alpha * err
+        trend += alpha * beta * err
+        if m:
+            s += gamma * err
+
+    h = np.arange(1, steps + 1)
+    mean = lvl[:, np.newaxis] + trend[:, np.newaxis] * h
+    if m:
+        mean += season[(t + h - 1) % m].T
+    sigma2 = sse / max(t - start, 1)
+    j = np.arange(steps, dtype=np.float64)
+    c = alpha * (1 + j * beta) + (gamma * ((j % m == 0) & (j > 0)) if m else 0.0)
+    c[0] = 0.0
+    return prediction_interval(mean, sigma2, 1 + np.cumsum(c * c), level)
+
+
+MODELS: dict[str, Callable[..., Forecast]] = {
+    "naive": naive,
+    "drift": drift,
+    "ewma": ewma,
+    "ar": ar,
+    "holt_winters": holt_winters,
+}
+
+
+def forecast(y: Any, steps: int = 1, model: str = "naive", level: float = 0.95, **params: Any) -> Forecast:
+    """Forecast every series in a panel with one model.
+
+    Parameters
+    ----------
+    y : array_like
+        Panel (n_series, n_obs), oldest observation first, or a single series.
+    steps : int
+        Forecast horizon.
+    model : str
+        One of MODELS: "naive", "drift", "ewma", "ar", "holt_winters".
+    level : float
+        Prediction interval coverage, e.g. 0.95.
+    **params : Any
+        Model parameters (alpha, p, period, ...).
+
+    Returns
+    -------
+    Forecast
+        mean, lower and upper arrays of shape (n_series, steps).
+    """
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    try:
+        fn = MODELS[model]
+    except KeyError:
+        raise ValueError(f"Unknown forecasting model {model!r}; expected one of {tuple(MODELS)}") from None
+    return fn(y, steps, level, **params)
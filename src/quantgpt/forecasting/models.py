@@ -1,15 +1,31 @@
 """Forecasting models."""
-from typing import Sequence
+from typing import Any, Sequence
+
+from .engine import forecast
 
 
 class PriceForecaster:
-    """Placeholder forecasting model."""
+    """Forecasts a single price series; a thin facade over engine.forecast.
+
+    Use engine.forecast directly to forecast many symbols in one call.
+    """
 
-    def __init__(self, prices: Sequence[float]):
+    def __init__(self, prices: Sequence[float], model: str = "naive", level: float = 0.95, **params: Any):
         self.prices = list(prices)
+        self.model = model
+        self.level = level
+        self.params = params
 
-    def forecast(self, steps: int = 1) -> Sequence[float]:
-        """Return a naive forecast using the last observed price."""
+    def _run(self, steps: int):
         if not self.prices:
             raise ValueError("No price data provided")
-        return [self.prices[-1]] * steps
+        return forecast(self.prices, steps, self.model, self.level, **self.params)
+
+    def forecast(self, steps: int = 1) -> Sequence[float]:
+        """Return point forecasts (by default the last observed price, repeated)."""
+        return self._run(steps).mean[0].tolist()
+
+    def forecast_interval(self, steps: int = 1) -> tuple[list[float], list[float]]:
+        """Return lower and upper prediction interval bounds at the configured level."""
+        result = self._run(steps)
+        return result.lower[0].tolist(), result.upper[0].tolist()
@@ -0,0 +1,326 @@
+"""Incremental forecaster state.
+
+Each state object holds the running sufficient statistics of one model
+for a panel of series: EWMA level, Holt level and trend, or the AR(p)
+normal equations. update() absorbs one new observation per series in
+constant time, and forecast() is available after every tick, with no
+refit over history. After the same observations, the forecasts match
+engine.forecast on the full history (up to rounding).
+
+States serialize with to_bytes() and are restored with load_state(). The
+format is MAGIC, a 4-byte little-endian header length, a JSON header
+(kind, parameters, count, array shapes), then the raw float64 arrays. A
+checkpoint is a few hundred bytes per series, however long the history.
+"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar
+
+import numpy as np
+
+from .engine import Forecast, ar_forecast, as_panel, prediction_interval
+
+MAGIC = b"QGFSTATE"
+_HEADER_LEN = struct.Struct("<I")
+
+
+class OnlineForecaster(ABC):
+    """Base for incremental forecasters over a fixed set of series."""
+
+    __slots__ = ("count",)
+
+    kind: ClassVar[str]
+    # Constructor parameters and float64 state arrays, in serialization order.
+    _params: ClassVar[tuple[str, ...]]
+    _arrays: ClassVar[tuple[str, ...]]
+
+    @property
+    def n_series(self) -> int:
+        return len(getattr(self, self._arrays[0]))
+
+    def _coerce(self, value: Any) -> np.ndarray:
+        x = np.asarray(value, dtype=np.float64)
+        x = np.broadcast_to(x, (self.n_series,)) if x.ndim == 0 else x
+        if x.shape != (self.n_series,):
+            raise ValueError(f"Expected {self.n_series} observations, got shape {x.shape}")
+        if not np.isfinite(x).all():
+            raise ValueError("Price data contains NaN or infinite values")
+        return x
+
+    def update(self, value: Any) -> "OnlineForecaster":
+        """Absorb one observation per series (a scalar for a single series).
+
+        Returns
+        -------
+        OnlineForecaster
+            self, so calls can be chained.
+        """
+        self._step(self._coerce(value))
+        self.count += 1
+        return self
+
+    def update_many(self, block: Any) -> "OnlineForecaster":
+        """Absorb a block of observations, shape (n_series, k) or (k,) for one series."""
+        panel = as_panel(block, min_obs=0)
+        if panel.shape[0] != self.n_series:
+            raise ValueError(f"Expected {self.n_series} series, got {panel.shape[0]}")
+        for column in np.ascontiguousarray(panel.T):
+            self._step(column)
+            self.count += 1
+        return self
+
+    @abstractmethod
+    def _step(self, x: np.ndarray) -> None:
+        """Absorb one validated observation vector (count not yet incremented)."""
+        ...
+
+    @abstractmethod
+    def forecast(self, steps: int = 1, level: float = 0.95) -> Forecast:
+        """Forecast every series from the current state.
+
+        Parameters
+        ----------
+        steps : int
+            Forecast horizon.
+        level : float
+            Prediction interval coverage.
+
+        Returns
+        -------
+        Forecast
+            mean, lower and upper arrays of shape (n_series, steps).
+        """
+        ...
+
+    def _require(self, n: int) -> None:
+        if self.count < n:
+            raise ValueError(f"{type(self).__name__} needs at least {n} observations, has {self.count}")
+
+    def to_bytes(self) -> bytes:
+        """Serialize parameters, count and state arrays."""
+        arrays = [np.ascontiguousarray(getattr(self, name), dtype="<f8") for name in self._arrays]
+        header = json.dumps(
+            {
+                "kind": self.kind,
+                "params": {name: getattr(self, name) for name in self._params},
+                "count": self.count,
+                "shapes": [a.shape for a in arrays],
+            }
+        ).encode()
+        return b"".join([MAGIC, _HEADER_LEN.pack(len(header)), header, *(a.tobytes() for a in arrays)])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "OnlineForecaster":
+        """Restore a state written by to_bytes (of this class or, via load_state, any)."""
+        state = load_state(data)
+        if not isinstance(state, cls):
+            raise ValueError(f"Serialized state is {state.kind!r}, not {cls.kind!r}")
+        return state
+
+
+class OnlineEWMA(OnlineForecaster):
+    """Simple exponential smoothing with a fixed alpha."""
+
+    __slots__ = ("alpha", "level", "sse")
+    kind = "ewma"
+    _params = ("alpha",)
+    _arrays = ("level", "sse")
+
+    def __init__(self, alpha: float = 0.3, n_series: int = 1) -> None:
+        """Initialize state.
+
+        Parameters
+        ----------
+        alpha : float
+            Smoothing weight in (0, 1].
+        n_series : int
+            Series tracked side by side.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.level = np.zeros(n_series)
+        self.sse = np.zeros(n_series)
+        self.count = 0
+
+    def _step(self, x: np.ndarray) -> None:
+        if self.count == 0:
+            self.level[:] = x
+            return
+        err = x - self.level
+        self.sse += err * err
+        self.level += self.alpha * err
+
+    def forecast(self, steps: int = 1, level: float = 0.95) -> Forecast:
+        self._require(1)
+        mean = np.repeat(self.level[:, np.newaxis], steps, axis=1)
+        sigma2 = self.sse / (self.count - 1) if self.count > 1 else np.zeros(self.n_series)
+        h = np.arange(steps, dtype=np.float64)
+        return prediction_interval(mean, sigma2, 1 + h * self.alpha**2, level)
+
+
+class OnlineHolt(OnlineForecaster):
+    """Holt's linear trend (additive Holt-Winters without a season)."""
+
+    __slots__ = ("alpha", "beta", "level", "trend", "sse")
+    kind = "holt"
+    _params = ("alpha", "beta")
+    _arrays = ("level", "trend", "sse")
+
+    def __init__(self, alpha: float = 0.3, beta: float = 0.1, n_series: int = 1) -> None:
+        """Initialize state.
+
+        Parameters
+        ----------
+        alpha, beta : float
+            Smoothing weights for level and trend, each in [0, 1].
+        n_series : int
+            Series tracked side by side.
+        """
+        if not 0 <= alpha <= 1 or not 0 <= beta <= 1:
+            raise ValueError("alpha and beta must be in [0, 1]")
+        self.alpha = alpha
+        self.beta = beta
+        self.level = np.zeros(n_series)
+        self.trend = np.zeros(n_series)
+        self.sse = np.zeros(n_series)
+        self.count = 0
+
+    def _step(self, x: np.ndarray) -> None:
+        if self.count == 0:
+            self.level[:] = x
+            return
+        if self.count == 1:
+            # The first change seeds the trend, as in engine.holt_winters.
+            self.trend[:] = x - self.level
+            self.level[:] = x
+            return
+        err = x - (self.level + self.trend)
+        self.sse += err * err
+        self.level += self.trend + self.alpha * err
+        self.trend += self.alpha * self.beta * err
+
+    def forecast(self, steps: int = 1, level: float = 0.95) -> Forecast:
+        self._require(1)
+        h = np.arange(1, steps + 1)
+        mean = self.level[:, np.newaxis] + self.trend[:, np.newaxis] * h
+        sigma2 = self.sse / max(self.count - 1, 1)
+        c = self.alpha * (1 + np.arange(steps) * self.beta)
+        c[0] = 0.0
+        return prediction_interval(mean, sigma2, 1 + np.cumsum(c * c), level)
+
+
+class OnlineAR(OnlineForecaster):
+    """AR(p) with intercept, refit from running normal equations on demand."""
+
+    __slots__ = ("p", "difference", "ridge", "gram", "rhs", "yy", "rows", "lags", "last")
+    kind = "ar"
+    _params = ("p", "difference", "ridge")
+    _arrays = ("yy", "rows", "last", "lags", "gram", "rhs")
+
+    def __init__(self, p: int = 1, difference: bool = True, ridge: float = 1e-8, n_series: int = 1) -> None:
+        """Initialize state.
+
+        Parameters
+        ----------
+        p : int
+            Number of lags.
+        difference : bool
+            Model one-step changes and integrate forecasts back to levels,
+            as in engine.ar.
+        ridge : float
+            Relative diagonal loading of the normal equations.
+        n_series : int
+            Series tracked side by side.
+        """
+        if p < 1:
+            raise ValueError("p must be at least 1")
+        self.p = p
+        self.difference = difference
+        self.ridge = ridge
+        # Sums over regression rows of [1, lags] outer products, [1, lags] * target, target ** 2.
+        self.gram = np.zeros((n_series, p + 1, p + 1))
+        self.rhs = np.zeros((n_series, p + 1))
+        self.yy = np.zeros(n_series)
+        self.rows = np.zeros(n_series)
+        # Last p modelled values, most recent first, and the last raw observation.
+        self.lags = np.zeros((n_series, p))
+        self.last = np.zeros(n_series)
+        self.count = 0
+
+    def _step(self, y: np.ndarray) -> None:
+        if self.difference:
+            x = y - self.last
+            self.last[:] = y
+            if self.count == 0:
+                return
+            seen = self.count - 1
+        else:
+            x = y
+            self.last[:] = y
+            seen = self.count
+        if seen >= self.p:
+            row = np.empty((len(x), self.p + 1))
+            row[:, 0] = 1.0
+            row[:, 1:] = self.lags
+            self.gram += row[:, :, np.newaxis] * row[:, np.newaxis, :]
+            self.rhs += row * x[:, np.newaxis]
+            self.yy += x * x
+            self.rows += 1
+        self.lags[:, 1:] = self.lags[:, :-1]
+        self.lags[:, 0] = x
+
+    def coefficients(self) -> tuple[np.ndarray, np.ndarray]:
+        """Solve the normal equations: (coef (n_series, p + 1), residual variance)."""
+        if not self.rows.any():
+            raise ValueError(f"OnlineAR needs at least {self.p + 1 + int(self.difference)} observations")
+        p = self.p
+        gram = self.gram + self.ridge * np.trace(self.gram, axis1=1, axis2=2)[:, None, None] * np.eye(p + 1)
+        coef = np.linalg.solve(gram, self.rhs[:, :, np.newaxis])[:, :, 0]
+        # sum(resid**2) = y'y - 2 b'X'y + b'X'X b, from the unloaded Gram matrix.
+        sse = self.yy - 2 * np.einsum("ni,ni->n", coef, self.rhs) + np.einsum("ni,nij,nj->n", coef, self.gram, coef)
+        dof = self.rows - (p + 1)
+        sigma2 = np.where(dof > 0, np.maximum(sse, 0.0) / np.maximum(dof, 1), 0.0)
+        return coef, sigma2
+
+    def forecast(self, steps: int = 1, level: float = 0.95) -> Forecast:
+        coef, sigma2 = self.coefficients()
+        return ar_forecast(coef, sigma2, self.lags, steps, level, self.last if self.difference else None)
+
+
+STATES: dict[str, type[OnlineForecaster]] = {cls.kind: cls for cls in (OnlineEWMA, OnlineHolt, OnlineAR)}
+
+
+def load_state(data: bytes) -> OnlineForecaster:
+    """Restore any state written by OnlineForecaster.to_bytes.
+
+    Raises
+    ------
+    ValueError
+        If data is not a serialized forecaster state.
+    """
+    view = memoryview(data)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a serialized forecaster state")
+    offset = len(MAGIC) + _HEADER_LEN.size
+    (header_len,) = _HEADER_LEN.unpack_from(view, len(MAGIC))
+    header = json.loads(bytes(view[offset : offset + header_len]))
+    offset += header_len
+    try:
+        cls = STATES[header["kind"]]
+    except KeyError:
+        raise ValueError(f"Unknown forecaster state kind {header['kind']!r}") from None
+
+    state = cls.__new__(cls)
+    for name, value in header["params"].items():
+        setattr(state, name, value)
+    state.count = header["count"]
+    for name, shape in zip(cls._arrays, header["shapes"]):
+        size = int(np.prod(shape)) * 8
+        if offset + size > len(view):
+            raise ValueError("Truncated forecaster state")
+        setattr(state, name, np.frombuffer(view[offset : offset + size], dtype="<f8").reshape(shape).copy())
+        offset += size
+    return state
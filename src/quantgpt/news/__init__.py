@@ -0,0 +1,61 @@
+"""News sources for QuantGPT.
+
+The news index (and its regex/mmap machinery) and the HTTP providers are
+loaded on first attribute access (PEP 562), so tools that only stream
+articles import quickly.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .base import (
+    Article,
+    NewsSource,
+    aselect_within_budget,
+    atake_within_budget,
+    render_article,
+    select_within_budget,
+    take_within_budget,
+)
+from .jsonl import JSONLNewsSource
+from .memory import InMemoryNewsSource, mock_news_source
+
+if TYPE_CHECKING:
+    from .http import HTTPNewsSource, JSONHTTPNewsSource, TokenBucket
+    from .index import NewsIndex, NewsIndexBuilder, build_news_index
+
+_LAZY = {
+    "HTTPNewsSource": ".http",
+    "JSONHTTPNewsSource": ".http",
+    "TokenBucket": ".http",
+    "NewsIndex": ".index",
+    "NewsIndexBuilder": ".index",
+    "build_news_index": ".index",
+}
+
+__all__ = [
+    "Article",
+    "HTTPNewsSource",
+    "InMemoryNewsSource",
+    "JSONHTTPNewsSource",
+    "JSONLNewsSource",
+    "NewsIndex",
+    "NewsIndexBuilder",
+    "NewsSource",
+    "TokenBucket",
+    "aselect_within_budget",
+    "atake_within_budget",
+    "build_news_index",
+    "mock_news_source",
+    "render_article",
+    "select_within_budget",
+    "take_within_budget",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,189 @@
+"""News source interface.
+
+A NewsSource yields Article records lazily, as a plain or async iterator,
+so consumers can stop early and memory stays flat however many articles a
+symbol has. take_within_budget() caps what a consumer pulls by item count
+and rendered bytes; select_within_budget() applies the same caps but keeps
+the articles (e.g. for ranking by timestamp).
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import NamedTuple
+
+
+class Article(NamedTuple):
+    """One news item (a tuple: cheap to build and hold when streaming feeds)."""
+
+    timestamp: datetime
+    headline: str
+    body: str = ""
+    symbols: tuple[str, ...] = ()
+    topics: tuple[str, ...] = ()
+    id: str = ""
+    source: str = ""
+
+    def matches(self, term: str) -> bool:
+        """True if term names one of the article's symbols or topics (case-insensitive)."""
+        return term.upper() in self.symbols or term.lower() in self.topics
+
+
+class NewsSource(ABC):
+    """Abstract base for news providers."""
+
+    # Articles pulled per worker-thread hop by the default aiter_articles().
+    async_batch_size = 64
+    # True when every lookup is a metered network request, so callers should
+    # not spend extra lookups on fallback terms.
+    remote = False
+
+    @abstractmethod
+    def iter_articles(self, term: str | None = None) -> Iterator[Article]:
+        """Yield articles matching term (a symbol or topic); all articles if None.
+
+        Implementations must be lazy: nothing beyond what the caller consumes
+        should be read or held in memory.
+        """
+        ...
+
+    async def aiter_articles(self, term: str | None = None) -> AsyncIterator[Article]:
+        """Async variant of iter_articles.
+
+        The default pulls batches from iter_articles() in a worker thread,
+        so blocking reads (files, decompression) never stall the event loop.
+        """
+        import asyncio  # deferred: costly at import, only needed by async callers
+
+        it = self.iter_articles(term)
+        try:
+            while True:
+                batch = await asyncio.to_thread(list, islice(it, self.async_batch_size))
+                if not batch:
+                    return
+                for article in batch:
+                    yield article
+        finally:
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+
+    def close(self) -> None:
+        """Release any resources held by the source."""
+
+
+def render_article(article: Article, include_body: bool = False) -> str:
+    """Render an article as one line of prompt text."""
+    if include_body and article.body:
+        return f"{article.headline} — {article.body}"
+    return article.headline
+
+
+class _Budget:
+    """Accumulates articles and their rendered lines until an item or byte limit is hit."""
+
+    def __init__(self, max_items: int | None, max_bytes: int | None, include_body: bool) -> None:
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.include_body = include_body
+        self.lines: list[str] = []
+        self.articles: list[Article] = []
+        self.used = 0
+
+    def offer(self, article: Article) -> bool:
+        """Add the article if it fits; False means stop consuming."""
+        if self.max_items is not None and len(self.lines) >= self.max_items:
+            return False
+        line = render_article(article, self.include_body)
+        size = len(line.encode("utf-8")) + (1 if self.lines else 0)
+        if self.max_bytes is not None and self.used + size > self.max_bytes:
+            return False
+        self.lines.append(line)
+        self.articles.append(article)
+        self.used += size
+        return True
+
+
+def take_within_budget(
+    articles: Iterable[Article],
+    max_items: int | None = None,
+    max_bytes: int | None = None,
+    include_body: bool = False,
+) -> list[str]:
+    """Render articles until an item or byte budget is reached.
+
+    Parameters
+    ----------
+    articles : Iterable[Article]
+        Article stream; consumed only as far as the budget allows, then
+        closed if it is a generator (releasing any open file).
+    max_items : int | None
+        Maximum lines returned. None means no item limit.
+    max_bytes : int | None
+        Maximum UTF-8 bytes across returned lines (newlines included). A line
+        that would exceed it is dropped and consumption stops. None means no
+        byte limit.
+    include_body : bool
+        Append each article's body to its headline.
+
+    Returns
+    -------
+    list[str]
+        Rendered lines, in stream order.
+    """
+    return _fill(_Budget(max_items, max_bytes, include_body), articles).lines
+
+
+def select_within_budget(
+    articles: Iterable[Article],
+    max_items: int | None = None,
+    max_bytes: int | None = None,
+    include_body: bool = False,
+) -> list[Article]:
+    """Like take_within_budget, but return the articles instead of their lines."""
+    return _fill(_Budget(max_items, max_bytes, include_body), articles).articles
+
+
+def _fill(budget: _Budget, articles: Iterable[Article]) -> _Budget:
+    try:
+        for article in articles:
+            if not budget.offer(article):
+                break
+    finally:
+        close = getattr(articles, "close", None)
+        if close is not None:
+            close()
+    return budget
+
+
+async def atake_within_budget(
+    articles: AsyncIterator[Article],
+    max_items: int | None = None,
+    max_bytes: int | None = None,
+    include_body: bool = False,
+) -> list[str]:
+    """Async variant of take_within_budget; closes the stream when done."""
+    return (await _afill(_Budget(max_items, max_bytes, include_body), articles)).lines
+
+
+async def aselect_within_budget(
+    articles: AsyncIterator[Article],
+    max_items: int | None = None,
+    max_bytes: int | None = None,
+    include_body: bool = False,
+) -> list[Article]:
+    """Async variant of select_within_budget; closes the stream when done."""
+    return (await _afill(_Budget(max_items, max_bytes, include_body), articles)).articles
+
+
+async def _afill(budget: _Budget, articles: AsyncIterator[Article]) -> _Budget:
+    try:
+        async for article in articles:
+            if not budget.offer(article):
+                break
+    finally:
+        aclose = getattr(articles, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return budget
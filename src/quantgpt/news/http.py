@@ -0,0 +1,428 @@
+"""HTTP-backed news providers.
+
+Remote APIs (NewsAPI, Finnhub, Alpha Vantage, ...) are metered and slow
+compared with local feeds, so every HTTP provider goes through the same
+plumbing:
+
+- One process-wide httpx client, so all providers share a keep-alive
+  connection pool instead of opening a TLS connection per research request.
+- A token bucket per provider, shared by all its instances, so the request
+  rate stays under the provider's quota however many agents are running.
+- Retries on transport errors and 429/5xx with jittered exponential backoff,
+  honouring Retry-After.
+- A short-TTL response cache. Expired entries keep their ETag/Last-Modified
+  validators and are revalidated with a conditional request, so unchanged
+  data costs a 304 rather than a body transfer and a full quota unit.
+
+httpx is imported on first request, not at import time.
+"""
+
+import random
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import urlencode
+
+from quantgpt.exceptions import NewsProviderError
+
+from .base import Article, NewsSource
+from .jsonl import article_from_record
+
+if TYPE_CHECKING:
+    import httpx
+
+# Statuses worth retrying: rate limited, or a transient server-side failure.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests/second in bursts of `capacity`."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize bucket.
+
+        Parameters
+        ----------
+        rate : float
+            Tokens added per second. Must be positive.
+        capacity : float | None
+            Maximum tokens held (burst size). None means max(1, rate).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it.
+
+        Tokens may go negative, so concurrent callers queue up in order
+        rather than all waking at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the seconds waited."""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def rate_limiter(provider: str, rate: float, capacity: float | None = None) -> TokenBucket:
+    """Return the process-wide token bucket for provider, creating it on first use.
+
+    The first caller's rate and capacity win; later instances of the same
+    provider share that budget.
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(provider)
+        if bucket is None:
+            bucket = _buckets[provider] = TokenBucket(rate, capacity)
+        return bucket
+
+
+_client: "httpx.Client | None" = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> "httpx.Client":
+    """Return the pooled HTTP client shared by all news providers."""
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            import httpx
+
+            _client = httpx.Client(
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return _client
+
+
+def close_http_client() -> None:
+    """Close the shared client's connections. A later request opens a new one."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+class CachedResponse(NamedTuple):
+    """Decoded response body with its freshness deadline and validators."""
+
+    expires: float
+    payload: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """Thread-safe LRU of decoded responses with a freshness TTL.
+
+    Expired entries are kept until evicted, so their validators can be sent
+    with the next request for the same URL.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 1024) -> None:
+        """Initialize cache.
+
+        Parameters
+        ----------
+        ttl_seconds : float
+            How long a response is served without contacting the provider.
+            0 revalidates on every request.
+        max_entries : int
+            Maximum responses kept; least recently used are evicted first.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the entry for key, fresh or not, or None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, payload: Any, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Store a response, fresh for ttl_seconds from now."""
+        if self.max_entries <= 0:
+            return
+        entry = CachedResponse(time.monotonic() + self.ttl_seconds, payload, etag, last_modified)
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class HTTPNewsStats(NamedTuple):
+    """Request counters of an HTTP news source."""
+
+    requests: int
+    cache_hits: int
+    not_modified: int
+    retries: int
+    stale_served: int
+
+
+def _retry_after(response: "httpx.Response") -> float | None:
+    """Seconds from a numeric Retry-After header, if present."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+class HTTPNewsSource(NewsSource):
+    """Base for news providers behind an HTTP JSON API.
+
+    Subclasses implement request() (path and query parameters for a term)
+    and parse() (articles from a decoded body); fetching, rate limiting,
+    retries and caching are shared. Async iteration uses the default
+    worker-thread path, so the event loop never waits on the network.
+    """
+
+    provider = "http"
+    remote = True
+
+    def __init__(
+        self,
+        base_url: str,
+        rate: float = 5.0,
+        burst: float | None = None,
+        cache_ttl: float = 60.0,
+        cache_max_entries: int = 1024,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        headers: Mapping[str, str] | None = None,
+        client: "httpx.Client | None" = None,
+        provider: str | None = None,
+    ) -> None:
+        """Initialize source.
+
+        Parameters
+        ----------
+        base_url : str
+            Provider API root, e.g. "https://newsapi.org/v2".
+        rate : float
+            Requests per second allowed for this provider (all instances
+            combined). 0 disables rate limiting.
+        burst : float | None
+            Requests allowed back to back. None means max(1, rate).
+        cache_ttl : float
+            Seconds a response is reused without contacting the provider.
+        cache_max_entries : int
+            Responses kept for reuse and revalidation. 0 disables the cache.
+        max_retries : int
+            Extra attempts after a transport error or retryable status.
+        backoff : float
+            Base delay in seconds; attempt n waits up to backoff * 2**(n-1).
+        max_backoff : float
+            Upper bound on any single delay, including Retry-After.
+        headers : Mapping[str, str] | None
+            Sent with every request (e.g. API key headers).
+        client : httpx.Client | None
+            Client to use. None uses the shared pool from get_http_client().
+        provider : str | None
+            Rate-limit and error-message name. Defaults to the class's provider.
+        """
+        self.base_url = base_url.rstrip("/")
+        if provider is not None:
+            self.provider = provider
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.headers = dict(headers or {})
+        self._client = client
+        self._bucket = rate_limiter(self.provider, rate, burst) if rate > 0 else None
+        self._cache = ResponseCache(cache_ttl, cache_max_entries)
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(HTTPNewsStats._fields, 0)
+
+    @abstractmethod
+    def request(self, term: str | None) -> tuple[str, dict[str, str]]:
+        """Return the URL path and query parameters that fetch news for term."""
+        ...
+
+    @abstractmethod
+    def parse(self, payload: Any) -> Iterable[Article]:
+        """Return the articles in a decoded response body."""
+        ...
+
+    def iter_articles(self, term: str | None = None) -> Iterator[Article]:
+        path, params = self.request(term)
+        yield from self.parse(self.fetch(path, params))
+
+    def stats(self) -> HTTPNewsStats:
+        """Snapshot of request counters."""
+        with self._lock:
+            return HTTPNewsStats(**self._counts)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def fetch(self, path: str, params: Mapping[str, str] | None = None) -> Any:
+        """GET base_url + path and return the decoded JSON body.
+
+        Fresh cached bodies are returned without a request; expired ones are
+        revalidated with If-None-Match / If-Modified-Since. If the provider
+        still fails after all retries, an expired body is served when one is
+        cached.
+
+        Raises
+        ------
+        NewsProviderError
+            If the request fails and nothing is cached for it.
+        """
+        params = dict(params or {})
+        key = path + "?" + urlencode(sorted(params.items()))
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires > time.monotonic():
+            self._count("cache_hits")
+            return entry.payload
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = self._send(path, params, headers)
+            if response.status_code == 304 and entry is not None:
+                self._count("not_modified")
+                self._cache.set(key, entry.payload, entry.etag, entry.last_modified)
+                return entry.payload
+            payload = response.json()
+        except (NewsProviderError, ValueError) as e:
+            if entry is None:
+                if isinstance(e, NewsProviderError):
+                    raise
+                raise NewsProviderError(f"{self.provider}: invalid JSON from {path}", e) from e
+            self._count("stale_served")
+            return entry.payload
+        self._cache.set(key, payload, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return payload
+
+    def _send(self, path: str, params: dict[str, str], headers: dict[str, str]) -> "httpx.Response":
+        """GET with rate limiting and retries; return the first non-retryable response."""
+        import httpx
+
+        client = self._client if self._client is not None else get_http_client()
+        url = self.base_url + path
+        cause: Exception | None = None
+        delay = 0.0
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count("retries")
+                time.sleep(delay)
+            if self._bucket is not None:
+                self._bucket.acquire()
+            self._count("requests")
+            # Full jitter spreads retries from concurrent callers apart.
+            delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+            try:
+                response = client.get(url, params=params, headers={**self.headers, **headers})
+            except httpx.TransportError as e:
+                cause = e
+                continue
+            if response.status_code in RETRY_STATUSES:
+                cause = httpx.HTTPStatusError(f"HTTP {response.status_code}", request=response.request, response=response)
+                retry_after = _retry_after(response)
+                if retry_after is not None:
+                    delay = min(self.max_backoff, max(delay, retry_after))
+                continue
+            if response.status_code >= 400 and response.status_code != 304:
+                raise NewsProviderError(f"{self.provider}: HTTP {response.status_code} from {path}")
+            return response
+        raise NewsProviderError(
+            f"{self.provider}: {path} failed after {self.max_retries + 1} attempts: {cause}", cause
+        )
+
+    def close(self) -> None:
+        """Close the client if one was passed in; the shared pool stays open."""
+        if self._client is not None:
+            self._client.close()
+
+
+class JSONHTTPNewsSource(HTTPNewsSource):
+    """Provider for JSON endpoints returning records in the JSONL feed schema.
+
+    GETs base_url + path with the term as a query parameter and reads
+    records (see article_from_record) from a top-level list or from the
+    records_key field of an object. Invalid records are skipped.
+    """
+
+    provider = "json"
+
+    def __init__(
+        self,
+        base_url: str,
+        path: str = "/news",
+        term_param: str = "q",
+        records_key: str = "articles",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize source.
+
+        Parameters
+        ----------
+        base_url : str
+            Provider API root.
+        path : str
+            Endpoint path under base_url.
+        term_param : str
+            Query parameter carrying the symbol or topic; omitted when None.
+        records_key : str
+            Field holding the record list when the body is an object.
+        **kwargs : Any
+            Passed to HTTPNewsSource (rate, cache_ttl, headers, ...).
+        """
+        super().__init__(base_url, **kwargs)
+        self.path = path
+        self.term_param = term_param
+        self.records_key = records_key
+
+    def request(self, term: str | None) -> tuple[str, dict[str, str]]:
+        return self.path, ({self.term_param: term} if term else {})
+
+    def parse(self, payload: Any) -> Iterator[Article]:
+        if isinstance(payload, dict):
+            payload = payload.get(self.records_key)
+        records = payload if isinstance(payload, list) else []
+        for i, record in enumerate(records):
+            try:
+                yield article_from_record(record, f"{self.provider}:{i}", self.provider)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
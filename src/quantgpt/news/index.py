@@ -0,0 +1,512 @@
+"""Inverted news index with memory-mapped storage.
+
+Maps tickers, company aliases and headline keywords to article IDs and
+ranks matches by term overlap plus recency. Free-form queries resolve to
+every symbol they mention ("Apple and Microsoft" -> AAPL, MSFT).
+
+The index is one file of flat sections (stdlib array layouts) behind a
+small JSON header. NewsIndex.open() maps it with mmap and views sections in
+place with memoryview.cast, so opening costs the same for ten articles or
+ten million, and only the pages a query touches are read:
+
+- timestamps (d) and article starts/lengths (Q/I), by doc ID; doc IDs are
+  assigned in timestamp order, so larger IDs are newer
+- sorted term table: offsets (Q) into a UTF-8 blob, looked up by bisection
+- posting lists (I): ascending doc IDs per term, with offsets (Q)
+- article records as JSON, decoded only for returned hits
+
+Symbols are stored upper-case and keywords lower-case, so they never collide.
+"""
+
+import bisect
+import heapq
+import io
+import json
+import mmap
+import os
+import re
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import IO, Any, BinaryIO
+
+from .base import Article, NewsSource
+from .jsonl import article_from_record
+
+MAGIC = b"QGNIDX01"
+_FORMAT_VERSION = 1
+
+# Common company names -> ticker. Extend per deployment via the aliases argument.
+DEFAULT_ALIASES: dict[str, str] = {
+    "apple": "AAPL",
+    "iphone": "AAPL",
+    "microsoft": "MSFT",
+    "azure": "MSFT",
+    "alphabet": "GOOGL",
+    "google": "GOOGL",
+    "amazon": "AMZN",
+    "meta": "META",
+    "facebook": "META",
+    "nvidia": "NVDA",
+    "tesla": "TSLA",
+    "netflix": "NFLX",
+    "intel": "INTC",
+    "amd": "AMD",
+    "oracle": "ORCL",
+    "salesforce": "CRM",
+    "adobe": "ADBE",
+    "jpmorgan": "JPM",
+    "goldman sachs": "GS",
+    "berkshire": "BRK.B",
+    "walmart": "WMT",
+    "exxon": "XOM",
+    "chevron": "CVX",
+    "boeing": "BA",
+    "disney": "DIS",
+    "coca cola": "KO",
+    "pfizer": "PFE",
+    "visa": "V",
+    "mastercard": "MA",
+}
+
+STOPWORDS = frozenset(
+    """
+    a about after all also am an and any are as at be been before but by can could did do does
+    for from had has have he her his how i if in into is it its just me more most my new no not
+    now of on or our out over say says she so some than that the their them then there these they
+    this to up us was we were what whats when where which while who why will with would you your
+    going go get news latest today week update updates stock stocks share shares
+    """.split()
+)
+
+# Tickers extract_symbols() recognizes as bare words by default: those of
+# DEFAULT_ALIASES. Any other symbol needs a cashtag ("$IBM") or a caller
+# supplied is_symbol (NewsIndex uses its own term table).
+KNOWN_SYMBOLS = frozenset(DEFAULT_ALIASES.values())
+
+_WORD = re.compile(r"\$?[A-Za-z0-9][A-Za-z0-9.&-]*[A-Za-z0-9]|\$?[A-Za-z0-9]")
+
+SYMBOL_WEIGHT = 2.0
+KEYWORD_WEIGHT = 1.0
+
+
+def _words(text: str) -> list[str]:
+    """Tokens of text, case preserved; "$" ticker prefixes are kept."""
+    return _WORD.findall(text)
+
+
+def _alias_symbols(lower_words: list[str], aliases: Mapping[str, str]) -> set[str]:
+    """Symbols named by one- or two-word aliases among lower_words."""
+    found = {aliases[w] for w in lower_words if w in aliases}
+    found.update(aliases[p] for p in map(" ".join, zip(lower_words, lower_words[1:])) if p in aliases)
+    return found
+
+
+def extract_symbols(
+    query: str,
+    aliases: Mapping[str, str] = DEFAULT_ALIASES,
+    is_symbol: Callable[[str], bool] = KNOWN_SYMBOLS.__contains__,
+) -> list[str]:
+    """Every symbol a free-form query mentions, in order of appearance.
+
+    Matching ignores case, so a query and its lower-cased copy yield the
+    same symbols. Two-word aliases ("goldman sachs") take precedence over
+    one-word ones ("Apple") and consume both words. Cashtags ("$nvda") name
+    any symbol. Other words count as tickers when is_symbol(word.upper())
+    holds and they have two letters or more and are not common English
+    words, so "aapl vs MSFT" yields both while "US markets are OK" and "on"
+    yield nothing.
+    """
+    words = _words(query)
+    lower = [w.lower().lstrip("$") for w in words]
+    found: dict[str, None] = {}
+    skip = False
+    for i, (word, low) in enumerate(zip(words, lower)):
+        if skip:
+            skip = False
+            continue
+        pair = f"{low} {lower[i + 1]}" if i + 1 < len(lower) else ""
+        if pair in aliases:
+            found[aliases[pair]] = None
+            skip = True
+        elif low in aliases:
+            found[aliases[low]] = None
+        elif word.startswith("$") and low.replace(".", "").isalpha():
+            found[low.upper()] = None
+        elif len(low) > 1 and low not in STOPWORDS and is_symbol(low.upper()):
+            found[low.upper()] = None
+    return list(found)
+
+
+def article_terms(article: Article, aliases: Mapping[str, str] = DEFAULT_ALIASES) -> set[str]:
+    """Index terms for an article: symbols (upper), aliased symbols, topics and headline keywords."""
+    lower = [w.lower().lstrip("$") for w in _words(article.headline)]
+    terms = {s.upper() for s in article.symbols}
+    terms.update(_alias_symbols(lower, aliases))
+    terms.update(t.lower() for t in article.topics)
+    terms.update(w for w in lower if len(w) > 1 and w not in STOPWORDS)
+    return terms
+
+
+def _record(article: Article) -> bytes:
+    return json.dumps(
+        {
+            "timestamp": article.timestamp.timestamp(),
+            "headline": article.headline,
+            "body": article.body,
+            "symbols": list(article.symbols),
+            "topics": list(article.topics),
+            "id": article.id,
+            "source": article.source,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class NewsIndexBuilder:
+    """Accumulates articles and writes a NewsIndex file.
+
+    Article records are spooled to a temporary file as they are added, so
+    only postings and per-document numbers are held in memory.
+    """
+
+    def __init__(self, aliases: Mapping[str, str] = DEFAULT_ALIASES) -> None:
+        import tempfile
+
+        self._aliases = dict(aliases)
+        self._postings: dict[str, array] = {}
+        self._timestamps = array("d")
+        self._starts = array("Q")
+        self._lengths = array("I")
+        self._spool: IO[bytes] = tempfile.TemporaryFile()
+        self._spooled = 0
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def add(self, article: Article) -> None:
+        """Add one article."""
+        doc = len(self._timestamps)
+        data = _record(article)
+        self._spool.write(data)
+        self._starts.append(self._spooled)
+        self._lengths.append(len(data))
+        self._spooled += len(data)
+        self._timestamps.append(article.timestamp.timestamp())
+        for term in article_terms(article, self._aliases):
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = array("I")
+            postings.append(doc)
+
+    def add_all(self, articles: Iterable[Article]) -> None:
+        """Add every article from an iterable (e.g. NewsSource.iter_articles())."""
+        for article in articles:
+            self.add(article)
+
+    def write(self, target: str | os.PathLike[str] | BinaryIO) -> None:
+        """Write the index to a path or binary file object."""
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, "wb") as f:
+                self._write(f)
+        else:
+            self._write(target)
+
+    def _write(self, out: BinaryIO) -> None:
+        n = len(self._timestamps)
+        # Renumber docs so IDs ascend with time (stable for equal timestamps).
+        order = sorted(range(n), key=self._timestamps.__getitem__)
+        new_id = array("I", bytes(4 * n))
+        for new, old in enumerate(order):
+            new_id[old] = new
+
+        terms = sorted(self._postings, key=lambda t: t.encode("utf-8"))
+        blob = bytearray()
+        term_offsets = array("Q", [0])
+        posting_offsets = array("Q", [0])
+        postings = array("I")
+        for term in terms:
+            blob += term.encode("utf-8")
+            term_offsets.append(len(blob))
+            postings.extend(sorted(new_id[d] for d in self._postings[term]))
+            posting_offsets.append(len(postings))
+
+        sections: list[tuple[str, Any]] = [
+            ("timestamps", array("d", (self._timestamps[i] for i in order))),
+            ("article_starts", array("Q", (self._starts[i] for i in order))),
+            ("article_lengths", array("I", (self._lengths[i] for i in order))),
+            ("term_offsets", term_offsets),
+            ("term_blob", bytes(blob)),
+            ("posting_offsets", posting_offsets),
+            ("postings", postings),
+            ("articles", None),
+        ]
+        sizes = [
+            self._spooled if data is None else len(data) * getattr(data, "itemsize", 1) for _, data in sections
+        ]
+
+        header: dict[str, Any] = {
+            "version": _FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "docs": n,
+            "terms": len(terms),
+            "newest": max(self._timestamps) if n else 0.0,
+            "aliases": self._aliases,
+            "sections": {},
+        }
+        # Section offsets depend on the header length, which depends on the
+        # offsets' digits; repeat until the length stops changing.
+        header_bytes = b""
+        while True:
+            offset = _align(len(MAGIC) + 8 + len(header_bytes))
+            for (name, _), size in zip(sections, sizes):
+                header["sections"][name] = [offset, size]
+                offset = _align(offset + size)
+            encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+            done = len(encoded) == len(header_bytes)
+            header_bytes = encoded
+            if done:
+                break
+
+        out.write(MAGIC)
+        out.write(len(header_bytes).to_bytes(8, "little"))
+        out.write(header_bytes)
+        written = len(MAGIC) + 8 + len(header_bytes)
+        for (name, data), size in zip(sections, sizes):
+            start = header["sections"][name][0]
+            out.write(b"\0" * (start - written))
+            if data is None:
+                self._spool.seek(0)
+                while chunk := self._spool.read(1 << 20):
+                    out.write(chunk)
+            else:
+                out.write(data.tobytes() if isinstance(data, array) else data)
+            written = start + size
+
+    def close(self) -> None:
+        """Discard the spooled article records."""
+        self._spool.close()
+
+
+def _contains(docs: memoryview, doc: int) -> bool:
+    """Binary search an ascending posting list."""
+    i = bisect.bisect_left(docs, doc)
+    return i < len(docs) and docs[i] == doc
+
+
+def _align(offset: int, to: int = 8) -> int:
+    return (offset + to - 1) // to * to
+
+
+class NewsIndex(NewsSource):
+    """Read-only inverted news index over a memory-mapped file or buffer."""
+
+    def __init__(
+        self,
+        buffer: Any,
+        recency_half_life_hours: float = 24.0,
+        max_postings_per_term: int = 2048,
+    ) -> None:
+        """Wrap an index buffer (bytes or mmap). Use NewsIndex.open() for files.
+
+        Parameters
+        ----------
+        buffer : Any
+            Object supporting the buffer protocol holding a written index.
+        recency_half_life_hours : float
+            Age at which an article's recency bonus halves (relative to the
+            newest article in the index).
+        max_postings_per_term : int
+            Posting lists up to this length are scanned in full. Longer ones
+            (very common terms) are only probed: existing candidates are
+            checked by binary search, and their newest `limit` docs join the
+            candidates. Docs matching only common terms and older than those
+            are never scored, which bounds query time.
+        """
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a QuantGPT news index")
+        header_len = int.from_bytes(view[len(MAGIC) : len(MAGIC) + 8], "little")
+        header = json.loads(bytes(view[len(MAGIC) + 8 : len(MAGIC) + 8 + header_len]))
+        if header["version"] != _FORMAT_VERSION or header["byteorder"] != sys.byteorder:
+            raise ValueError("Unsupported news index version or byte order")
+        self._view = view
+        self._newest: float = header["newest"]
+        self.aliases: dict[str, str] = header["aliases"]
+        self.half_life_seconds = recency_half_life_hours * 3600
+        self.max_postings_per_term = max_postings_per_term
+
+        def section(name: str, code: str | None = None) -> memoryview:
+            start, size = header["sections"][name]
+            part = view[start : start + size]
+            return part.cast(code) if code else part
+
+        self._timestamps = section("timestamps", "d")
+        self._starts = section("article_starts", "Q")
+        self._lengths = section("article_lengths", "I")
+        self._term_offsets = section("term_offsets", "Q")
+        self._term_blob = section("term_blob")
+        self._posting_offsets = section("posting_offsets", "Q")
+        self._postings = section("postings", "I")
+        self._articles = section("articles")
+        self._n_terms: int = header["terms"]
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str], **kwargs: Any) -> "NewsIndex":
+        """Memory-map an index file; kwargs are passed to the constructor."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, **kwargs)
+
+    @classmethod
+    def from_articles(
+        cls,
+        articles: Iterable[Article],
+        aliases: Mapping[str, str] = DEFAULT_ALIASES,
+        **kwargs: Any,
+    ) -> "NewsIndex":
+        """Build an in-memory index (tests, small corpora)."""
+        builder = NewsIndexBuilder(aliases)
+        try:
+            builder.add_all(articles)
+            out = io.BytesIO()
+            builder.write(out)
+        finally:
+            builder.close()
+        return cls(out.getvalue(), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def close(self) -> None:
+        """Release the views and unmap the file, if any."""
+        for name in (
+            "_timestamps", "_starts", "_lengths", "_term_offsets", "_term_blob",
+            "_posting_offsets", "_postings", "_articles", "_view",
+        ):
+            getattr(self, name).release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "NewsIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _term(self, i: int) -> bytes:
+        return bytes(self._term_blob[self._term_offsets[i] : self._term_offsets[i + 1]])
+
+    def _find(self, term: str) -> int:
+        """Index of term in the sorted term table, or -1."""
+        key = term.encode("utf-8")
+        lo, hi = 0, self._n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._n_terms and self._term(lo) == key else -1
+
+    def postings(self, term: str) -> memoryview:
+        """Doc IDs (ascending, i.e. oldest first) for an exact index term."""
+        i = self._find(term)
+        if i < 0:
+            return self._postings[:0]
+        return self._postings[self._posting_offsets[i] : self._posting_offsets[i + 1]]
+
+    def resolve_symbols(self, query: str) -> list[str]:
+        """Every symbol a free-form query mentions, in order of appearance.
+
+        Rules as in extract_symbols(); bare tickers count when the index has
+        that symbol, so "on" is never ON Semiconductor.
+        """
+        return extract_symbols(query, self.aliases, lambda symbol: self._find(symbol) >= 0)
+
+    def query_terms(self, query: str) -> dict[str, float]:
+        """Weighted index terms for a query: resolved symbols and keywords."""
+        terms = dict.fromkeys(self.resolve_symbols(query), SYMBOL_WEIGHT)
+        for word in _words(query):
+            low = word.lower().lstrip("$")
+            if len(low) > 1 and low not in STOPWORDS and low not in self.aliases and low.upper() not in terms:
+                terms.setdefault(low, KEYWORD_WEIGHT)
+        return terms
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[int, float]]:
+        """Rank documents for a free-form query.
+
+        Parameters
+        ----------
+        query : str
+            Free-form text, a ticker, or a topic.
+        limit : int
+            Maximum hits returned.
+
+        Returns
+        -------
+        list[tuple[int, float]]
+            (doc ID, score) pairs, best first. Score is the summed weight of
+            matched query terms (symbols 2, keywords 1) plus a recency bonus
+            in (0, 1] that halves every recency half-life.
+        """
+        lists = sorted(
+            ((self.postings(term), weight) for term, weight in self.query_terms(query).items()),
+            key=lambda item: len(item[0]),
+        )
+        scores: dict[int, float] = {}
+        probed: list[tuple[memoryview, float]] = []
+        for docs, weight in lists:
+            if len(docs) <= self.max_postings_per_term:
+                for doc in docs.tolist():
+                    scores[doc] = scores.get(doc, 0.0) + weight
+                continue
+            for doc in scores:
+                if _contains(docs, doc):
+                    scores[doc] += weight
+            for doc in docs[-limit:].tolist():
+                if doc not in scores:
+                    scores[doc] = weight + sum(w for d, w in probed if _contains(d, doc))
+            probed.append((docs, weight))
+        if not scores:
+            return []
+        ts, newest, half_life = self._timestamps, self._newest, self.half_life_seconds
+        ranked = ((doc, s + 0.5 ** ((newest - ts[doc]) / half_life)) for doc, s in scores.items())
+        return heapq.nlargest(limit, ranked, key=lambda hit: (hit[1], hit[0]))
+
+    def article(self, doc: int) -> Article:
+        """Decode one article by doc ID."""
+        start = self._starts[doc]
+        record = json.loads(bytes(self._articles[start : start + self._lengths[doc]]))
+        return article_from_record(record)
+
+    def iter_articles(self, term: str | None = None, limit: int = 100) -> Iterator[Article]:
+        """Yield the best-ranked articles for term (any free-form query); newest first if None."""
+        if term is None:
+            for doc in range(len(self) - 1, -1, -1):
+                yield self.article(doc)
+            return
+        for doc, _ in self.search(term, limit):
+            yield self.article(doc)
+
+
+def build_news_index(
+    articles: Iterable[Article],
+    path: str | os.PathLike[str],
+    aliases: Mapping[str, str] = DEFAULT_ALIASES,
+) -> int:
+    """Index articles (e.g. JSONLNewsSource(...).iter_articles()) into path.
+
+    Returns
+    -------
+    int
+        Number of articles indexed.
+    """
+    builder = NewsIndexBuilder(aliases)
+    try:
+        builder.add_all(articles)
+        builder.write(path)
+        return len(builder)
+    finally:
+        builder.close()
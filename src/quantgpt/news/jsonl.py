@@ -0,0 +1,101 @@
+"""Streaming news from local JSONL files.
+
+One JSON object per line::
+
+    {"timestamp": "2025-01-02T14:30:00Z", "symbols": ["AAPL"],
+     "headline": "...", "body": "...", "topics": ["earnings"], "id": "..."}
+
+"timestamp" may be ISO 8601 or epoch seconds; "title"/"summary" are
+accepted for "headline"/"body", and "symbol" for a single symbol. Files
+ending in .gz, .bz2 or .xz are decompressed on the fly. Lines are read and
+parsed one at a time, so file size does not affect memory use; lines that
+cannot mention the search term are skipped before JSON parsing.
+"""
+
+import importlib
+import json
+import os
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import IO, Any
+
+from .base import Article, NewsSource
+
+# Suffix -> decompression module, imported on first use.
+_COMPRESSION = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse ISO 8601 text or epoch seconds into an aware UTC datetime."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def article_from_record(record: dict[str, Any], default_id: str = "", source: str = "") -> Article:
+    """Build an Article from one decoded JSONL record.
+
+    Raises
+    ------
+    KeyError
+        If the record has no timestamp or headline/title.
+    ValueError
+        If the timestamp cannot be parsed.
+    """
+    symbols = record.get("symbols")
+    if symbols is None:
+        symbols = [record["symbol"]] if record.get("symbol") else []
+    return Article(
+        timestamp=parse_timestamp(record["timestamp"]),
+        headline=record.get("headline") or record["title"],
+        body=record.get("body") or record.get("summary") or "",
+        symbols=tuple(s.upper() for s in symbols),
+        topics=tuple(t.lower() for t in record.get("topics", ())),
+        id=str(record.get("id") or default_id),
+        source=record.get("source") or source,
+    )
+
+
+class JSONLNewsSource(NewsSource):
+    """Streams articles from a JSONL file, optionally gzip/bz2/xz compressed."""
+
+    def __init__(self, path: str | os.PathLike[str], skip_invalid: bool = True) -> None:
+        """Initialize source.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            JSONL file; the suffix picks the decompressor.
+        skip_invalid : bool
+            Skip (and count in .invalid_lines) malformed lines instead of raising.
+        """
+        self.path = os.fspath(path)
+        self.skip_invalid = skip_invalid
+        self.invalid_lines = 0
+
+    def _open(self) -> IO[str]:
+        module = _COMPRESSION.get(os.path.splitext(self.path)[1].lower())
+        if module is None:
+            return open(self.path, encoding="utf-8")
+        return importlib.import_module(module).open(self.path, "rt", encoding="utf-8")
+
+    def iter_articles(self, term: str | None = None) -> Iterator[Article]:
+        needle = term.lower() if term else None
+        name = os.path.basename(self.path)
+        with self._open() as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                # Cheap reject: a matching record must contain the term somewhere.
+                if needle is not None and needle not in line.lower():
+                    continue
+                try:
+                    article = article_from_record(json.loads(line), f"{name}:{lineno}", name)
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    if not self.skip_invalid:
+                        raise ValueError(f"{self.path}:{lineno}: invalid news record") from e
+                    self.invalid_lines += 1
+                    continue
+                if term is None or article.matches(term):
+                    yield article
@@ -0,0 +1,63 @@
+"""In-memory news source and the built-in mock feed."""
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime, timezone
+
+from .base import Article, NewsSource
+
+# Mock news data for Phase 3
+_MOCK_NEWS: dict[str, list[str]] = {
+    "aapl": [
+        "Apple Inc. reports strong Q4 earnings, beats analyst expectations.",
+        "iPhone 16 sales exceed projections in key markets.",
+        "Apple announces new AI features for upcoming devices.",
+    ],
+    "msft": [
+        "Microsoft Azure expands cloud services in Asia-Pacific.",
+        "Microsoft and OpenAI deepen partnership for AI development.",
+        "Windows 11 adoption continues to grow.",
+    ],
+    "market": [
+        "Fed signals potential rate cuts in 2025.",
+        "Global markets show mixed signals amid economic data.",
+        "Tech sector leads gains as broader market consolidates.",
+    ],
+}
+
+_MOCK_TIMESTAMP = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+class InMemoryNewsSource(NewsSource):
+    """Serves articles from a list held in memory (tests, fixtures, mocks)."""
+
+    def __init__(self, articles: Iterable[Article]) -> None:
+        self._articles = list(articles)
+
+    def iter_articles(self, term: str | None = None) -> Iterator[Article]:
+        for article in self._articles:
+            if term is None or article.matches(term):
+                yield article
+
+    async def aiter_articles(self, term: str | None = None) -> AsyncIterator[Article]:
+        # Nothing blocks, so skip the worker-thread hop of the default.
+        for article in self.iter_articles(term):
+            yield article
+
+
+def mock_news_source() -> InMemoryNewsSource:
+    """Return the built-in mock feed: a few headlines for AAPL, MSFT and the market."""
+    articles = []
+    for key, headlines in _MOCK_NEWS.items():
+        symbols, topics = ((), (key,)) if key == "market" else ((key.upper(),), ())
+        for i, headline in enumerate(headlines):
+            articles.append(
+                Article(
+                    timestamp=_MOCK_TIMESTAMP,
+                    headline=headline,
+                    symbols=symbols,
+                    topics=topics,
+                    id=f"mock-{key}-{i}",
+                    source="mock",
+                )
+            )
+    return InMemoryNewsSource(articles)
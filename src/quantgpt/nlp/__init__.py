@@ -1,4 +1,30 @@
 """NLP utilities for QuantGPT."""
-from .sentiment import analyze_sentiment
+from .fast_sentiment import FastSentimentScorer
+from .sentiment import (
+    BACKENDS,
+    SentimentBackend,
+    analyze_sentiment,
+    analyze_sentiment_batch,
+    check_backend,
+    init_worker,
+)
+from .sentiment_cache import (
+    SentimentCache,
+    SentimentCacheStats,
+    configure_sentiment_cache,
+    get_sentiment_cache,
+)
 
-__all__ = ["analyze_sentiment"]
+__all__ = [
+    "BACKENDS",
+    "FastSentimentScorer",
+    "SentimentBackend",
+    "SentimentCache",
+    "SentimentCacheStats",
+    "analyze_sentiment",
+    "analyze_sentiment_batch",
+    "check_backend",
+    "configure_sentiment_cache",
+    "get_sentiment_cache",
+    "init_worker",
+]
@@ -0,0 +1,206 @@
+"""Compiled VADER-compatible sentiment scorer.
+
+Reimplements VADER's compound score for high-volume news scoring. The
+rules are VADER's (lexicon valence, boosters/dampeners, negation windows,
+ALL-CAPS emphasis, "least", "but", special idioms, punctuation emphasis),
+but the work per document is reorganized:
+
+- The lexicon, booster, negation and idiom tables are built once into flat
+  dicts/frozensets, and single-character emoji become one str.translate table.
+- Each text is tokenized and lowercased in a single pass; VADER re-lowercases
+  the whole token list for every sentiment-bearing word.
+- Only the compound score is computed (VADER also derives pos/neu/neg).
+- Texts without sentiment-bearing words return before any rule runs.
+
+Scores match VADER's compound score on the reference corpus in the tests.
+"""
+
+import math
+import string
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+_PUNCT = string.punctuation
+
+
+def _but_check(positions: list[int], values: list[float], bi: int) -> None:
+    """Damp sentiments before "but" and amplify those after, in place.
+
+    values holds the sentiments of the words at positions (all other words
+    score 0 and are unaffected). Mirrors VADER exactly, including its lookup
+    by value: each sentiment is rescaled at the first position holding an
+    equal value.
+    """
+    for v in values:
+        k = values.index(v)
+        if positions[k] < bi:
+            values[k] = v * 0.5
+        elif positions[k] > bi:
+            values[k] = v * 1.5
+
+
+class FastSentimentScorer:
+    """VADER compound scoring over precompiled tables."""
+
+    def __init__(self, analyzer: "SentimentIntensityAnalyzer | None" = None) -> None:
+        """Compile lookup tables from VADER's lexicon and rule constants.
+
+        Parameters
+        ----------
+        analyzer : SentimentIntensityAnalyzer | None
+            Source of the lexicon and emoji tables. None loads VADER's defaults.
+        """
+        import vaderSentiment.vaderSentiment as vader
+
+        if analyzer is None:
+            analyzer = vader.SentimentIntensityAnalyzer()
+        self._lexicon: dict[str, float] = dict(analyzer.lexicon)
+        self._boosters: dict[str, float] = dict(vader.BOOSTER_DICT)
+        self._negations = frozenset(vader.NEGATE)
+        self._special = dict(vader.SPECIAL_CASES)
+        # Adjacent word pairs of multi-word idioms and boosters; a text with
+        # none of them cannot trigger the idiom rule.
+        self._idiom_pairs = frozenset(
+            pair
+            for phrase in (*self._special, *self._boosters)
+            for pair in zip(phrase.split(), phrase.split()[1:])
+        )
+        self._c_incr = vader.C_INCR
+        self._n_scalar = vader.N_SCALAR
+        # VADER only replaces emoji it sees one character at a time; a leading
+        # space is always added, which is harmless since tokens are split on
+        # whitespace and punctuation counts are unaffected.
+        self._emoji = str.maketrans({k: " " + v for k, v in analyzer.emojis.items() if len(k) == 1})
+
+    @staticmethod
+    def _tokens(text: str) -> list[str]:
+        """Split on whitespace, stripping edge punctuation unless <= 2 chars remain."""
+        return [t if len(s := t.strip(_PUNCT)) <= 2 else s for t in text.split()]
+
+    def _negated(self, word: str) -> bool:
+        return word in self._negations or "n't" in word
+
+    def compound(self, text: str) -> float:
+        """Return VADER's compound score for text, rounded to 4 places.
+
+        Parameters
+        ----------
+        text : str
+            Input text.
+
+        Returns
+        -------
+        float
+            Compound score in [-1, 1].
+        """
+        if not text.isascii():
+            text = text.translate(self._emoji)
+        words = self._tokens(text)
+        lower = [w.lower() for w in words]
+        lexicon = self._lexicon
+        boosters = self._boosters
+        n = len(lower)
+        positions = [
+            i
+            for i, w in enumerate(lower)
+            if w in lexicon and w not in boosters and not (w == "kind" and i < n - 1 and lower[i + 1] == "of")
+        ]
+        if not positions:
+            return 0.0
+
+        upper = sum(map(str.isupper, words))
+        cap_diff = 0 < n - upper < n
+        idioms = not self._idiom_pairs.isdisjoint(zip(lower, lower[1:]))
+        values = [self._valence(words, lower, i, cap_diff, idioms) for i in positions]
+        if "but" in lower:
+            _but_check(positions, values, lower.index("but"))
+
+        # Words outside positions score 0, so summing values alone is exact.
+        total = sum(values)
+        if total:
+            ep = min(text.count("!"), 4) * 0.292
+            qm = text.count("?")
+            qm_amp = 0.0 if qm <= 1 else qm * 0.18 if qm <= 3 else 0.96
+            total += ep + qm_amp if total > 0 else -(ep + qm_amp)
+        compound = total / math.sqrt(total * total + 15)
+        return round(max(-1.0, min(1.0, compound)), 4)
+
+    def _valence(self, words: list[str], lower: list[str], i: int, cap_diff: bool, idioms: bool) -> float:
+        """Valence of lexicon word i after VADER's contextual rules."""
+        lexicon = self._lexicon
+        n_scalar = self._n_scalar
+        c_incr = self._c_incr
+        item = lower[i]
+        valence = lexicon[item]
+        if item == "no" and i != len(lower) - 1 and lower[i + 1] in lexicon:
+            valence = 0.0
+        if (
+            (i > 0 and lower[i - 1] == "no")
+            or (i > 1 and lower[i - 2] == "no")
+            or (i > 2 and lower[i - 3] == "no" and lower[i - 1] in ("or", "nor"))
+        ):
+            valence = lexicon[item] * n_scalar
+        if cap_diff and words[i].isupper():
+            valence = valence + c_incr if valence > 0 else valence - c_incr
+
+        for start_i in range(3):
+            j = i - start_i - 1
+            if j < 0 or lower[j] in lexicon:
+                continue
+            scalar = self._boosters.get(lower[j], 0.0)
+            if scalar:
+                if valence < 0:
+                    scalar = -scalar
+                if cap_diff and words[j].isupper():
+                    scalar = scalar + c_incr if valence > 0 else scalar - c_incr
+                scalar *= (1.0, 0.95, 0.9)[start_i]
+            valence += scalar
+            valence = self._negation(valence, lower, start_i, i)
+            if start_i == 2 and idioms:
+                valence = self._idioms(valence, lower, i)
+
+        if i > 0 and lower[i - 1] == "least" and not (i > 1 and lower[i - 2] in ("at", "very")):
+            valence *= n_scalar
+        return valence
+
+    def _negation(self, valence: float, lower: list[str], start_i: int, i: int) -> float:
+        if start_i == 0:
+            if self._negated(lower[i - 1]):
+                valence *= self._n_scalar
+        elif start_i == 1:
+            if lower[i - 2] == "never" and lower[i - 1] in ("so", "this"):
+                valence *= 1.25
+            elif lower[i - 2] == "without" and lower[i - 1] == "doubt":
+                pass
+            elif self._negated(lower[i - 2]):
+                valence *= self._n_scalar
+        else:
+            if (lower[i - 3] == "never" and lower[i - 2] in ("so", "this")) or lower[i - 1] in ("so", "this"):
+                valence *= 1.25
+            elif lower[i - 3] == "without" and "doubt" in (lower[i - 2], lower[i - 1]):
+                pass
+            elif self._negated(lower[i - 3]):
+                valence *= self._n_scalar
+        return valence
+
+    def _idioms(self, valence: float, lower: list[str], i: int) -> float:
+        special = self._special
+        w3, w2, w1, w0 = lower[i - 3], lower[i - 2], lower[i - 1], lower[i]
+        for seq in (f"{w1} {w0}", f"{w2} {w1} {w0}", f"{w2} {w1}", f"{w3} {w2} {w1}", f"{w3} {w2}"):
+            if seq in special:
+                valence = special[seq]
+                break
+        if len(lower) - 1 > i:
+            seq = f"{w0} {lower[i + 1]}"
+            if seq in special:
+                valence = special[seq]
+        if len(lower) - 1 > i + 1:
+            seq = f"{w0} {lower[i + 1]} {lower[i + 2]}"
+            if seq in special:
+                valence = special[seq]
+        for seq in (f"{w3} {w2} {w1}", f"{w3} {w2}", f"{w2} {w1}"):
+            if seq in self._boosters:
+                valence += self._boosters[seq]
+        return valence
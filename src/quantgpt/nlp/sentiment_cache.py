@@ -0,0 +1,147 @@
+"""Memoized sentiment scores.
+
+The same headlines are scored over and over (every research query on a
+symbol re-scores its news; real feeds repeat syndicated stories). This
+module keeps a bounded, process-wide LRU of scores keyed by a BLAKE2b hash
+of the whitespace-normalized text, so repeats cost a hash and a dict lookup.
+
+Case is kept in the key: VADER boosts ALL-CAPS words, so "GREAT" and
+"great" score differently. Only digests and floats are stored, never text.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+_DIGEST_SIZE = 16
+
+# Approximate resident size of one entry: digest bytes object, float, and the
+# OrderedDict slot plus its linked-list node.
+ENTRY_BYTES = sys.getsizeof(b"\0" * _DIGEST_SIZE) + sys.getsizeof(0.0) + 104
+
+
+def sentiment_key(text: str, backend: str = "vader") -> bytes:
+    """Return the cache key for text: BLAKE2b of its whitespace-normalized form.
+
+    Parameters
+    ----------
+    text : str
+        Input text. Runs of whitespace are collapsed; case is preserved.
+    backend : str
+        Scoring backend, so engines never share entries.
+
+    Returns
+    -------
+    bytes
+        16-byte digest.
+    """
+    normalized = " ".join(text.split())
+    h = hashlib.blake2b(normalized.encode("utf-8"), digest_size=_DIGEST_SIZE, person=backend.encode("ascii"))
+    return h.digest()
+
+
+class SentimentCacheStats(NamedTuple):
+    """Hit/miss counters and current size of a sentiment cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 when there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SentimentCache:
+    """Thread-safe LRU of sentiment scores bounded by entries and bytes."""
+
+    def __init__(self, max_entries: int = 65_536, max_bytes: int = 16 * 1024 * 1024) -> None:
+        """Initialize cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum entries kept; least recently used are evicted first.
+            0 disables the cache.
+        max_bytes : int
+            Approximate memory budget in bytes (ENTRY_BYTES per entry).
+        """
+        self._capacity = max(0, min(max_entries, max_bytes // ENTRY_BYTES))
+        self._data: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum entries after applying both limits."""
+        return self._capacity
+
+    def get(self, key: bytes) -> float | None:
+        """Return the cached score for key, or None on miss."""
+        with self._lock:
+            score = self._data.get(key)
+            if score is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return score
+
+    def set(self, key: bytes, score: float) -> None:
+        """Store a score, evicting least recently used entries as needed."""
+        if not self._capacity:
+            return
+        with self._lock:
+            self._data[key] = score
+            self._data.move_to_end(key)
+            while len(self._data) > self._capacity:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+    def stats(self) -> SentimentCacheStats:
+        """Snapshot of counters and size."""
+        with self._lock:
+            n = len(self._data)
+            return SentimentCacheStats(self._hits, self._misses, n, n * ENTRY_BYTES)
+
+
+_cache = SentimentCache()
+
+
+def get_sentiment_cache() -> SentimentCache:
+    """Return the process-wide sentiment cache."""
+    return _cache
+
+
+def configure_sentiment_cache(max_entries: int, max_bytes: int) -> SentimentCache:
+    """Replace the process-wide cache with one of the given limits.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum entries. 0 disables memoization.
+    max_bytes : int
+        Approximate memory budget in bytes.
+
+    Returns
+    -------
+    SentimentCache
+        The new process-wide cache.
+    """
+    global _cache
+    _cache = SentimentCache(max_entries=max_entries, max_bytes=max_bytes)
+    return _cache
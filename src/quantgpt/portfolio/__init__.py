@@ -1,4 +1,42 @@
 """Portfolio optimization tools."""
+from .covariance import (
+    CovarianceCache,
+    CovarianceCacheStats,
+    EWMACovariance,
+    RollingCovariance,
+    constant_correlation,
+    estimate_covariance,
+    ewma_covariance,
+    get_covariance_cache,
+    ledoit_wolf,
+    sample_covariance,
+)
+from .mean_variance import (
+    EfficientFrontier,
+    MeanVarianceOptimizer,
+    Portfolio,
+    estimate_moments,
+    optimize,
+    project_capped_simplex,
+)
 from .optimizer import optimize_portfolio
 
-__all__ = ["optimize_portfolio"]
+__all__ = [
+    "CovarianceCache",
+    "CovarianceCacheStats",
+    "EWMACovariance",
+    "EfficientFrontier",
+    "MeanVarianceOptimizer",
+    "Portfolio",
+    "RollingCovariance",
+    "constant_correlation",
+    "estimate_covariance",
+    "estimate_moments",
+    "ewma_covariance",
+    "get_covariance_cache",
+    "ledoit_wolf",
+    "optimize",
+    "optimize_portfolio",
+    "project_capped_simplex",
+    "sample_covariance",
+]
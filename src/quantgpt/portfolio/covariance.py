@@ -0,0 +1,424 @@
+"""Covariance estimators.
+
+Sample covariance of a short window is noisy and, with more assets than
+periods, singular. This module provides:
+
+- Shrinkage estimators: Ledoit-Wolf (towards a scaled identity) and
+  constant correlation (towards equal pairwise correlation). Both compute
+  the optimal shrinkage intensity in closed form, with a few matrix
+  products.
+- EWMA (RiskMetrics) covariance, batch or one observation at a time.
+- RollingCovariance, which maintains a window's covariance with rank-one
+  add/drop updates, O(n^2) per step instead of O(n^2 * T).
+- CovarianceCache, an LRU keyed by (universe, window end, estimator). It
+  lets every optimization and risk calculation in a cycle share one
+  matrix. Cached matrices are read-only.
+
+Return matrices are (n_periods, n_assets), oldest row first.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, NamedTuple
+
+import numpy as np
+
+
+def _returns(returns: Any, min_periods: int = 2) -> np.ndarray:
+    r = np.asarray(returns, dtype=np.float64)
+    if r.ndim != 2 or r.shape[0] < min_periods:
+        raise ValueError(f"returns must be a (n_periods, n_assets) matrix with at least {min_periods} periods")
+    if not np.isfinite(r).all():
+        raise ValueError("returns contain NaN or infinite values")
+    return r
+
+
+def sample_covariance(returns: Any) -> np.ndarray:
+    """Unbiased sample covariance (divides by n_periods - 1)."""
+    r = _returns(returns)
+    centered = r - r.mean(axis=0)
+    return centered.T @ centered / (r.shape[0] - 1)
+
+
+def ledoit_wolf(returns: Any) -> tuple[np.ndarray, float]:
+    """Ledoit-Wolf (2004) shrinkage towards a scaled identity.
+
+    Parameters
+    ----------
+    returns : array_like
+        Shape (n_periods, n_assets).
+
+    Returns
+    -------
+    tuple[np.ndarray, float]
+        Shrunk covariance and the shrinkage intensity in [0, 1]. As in
+        the paper, the sample covariance divides by n_periods.
+    """
+    x = _returns(returns)
+    t, n = x.shape
+    x = x - x.mean(axis=0)
+    s = x.T @ x / t
+    mu = np.trace(s) / n
+    target_dist = np.sum(s * s) - 2 * mu * np.trace(s) + n * mu * mu  # ||S - mu I||^2
+    # sum_t ||x_t x_t' - S||^2 = sum_t ||x_t||^4 - T ||S||^2
+    row_norms = np.einsum("ti,ti->t", x, x)
+    spread = (row_norms @ row_norms - t * np.sum(s * s)) / (t * t)
+    shrinkage = float(min(spread, target_dist) / target_dist) if target_dist > 0 else 1.0
+    cov = (1 - shrinkage) * s
+    cov[np.diag_indices(n)] += shrinkage * mu
+    return cov, shrinkage
+
+
+def constant_correlation(returns: Any) -> tuple[np.ndarray, float]:
+    """Ledoit-Wolf (2003) shrinkage towards a constant-correlation target.
+
+    The target keeps each asset's variance and sets every correlation to
+    the average sample correlation.
+
+    Parameters
+    ----------
+    returns : array_like
+        Shape (n_periods, n_assets), at least 2 assets.
+
+    Returns
+    -------
+    tuple[np.ndarray, float]
+        Shrunk covariance and the shrinkage intensity in [0, 1] (sample
+        covariance divides by n_periods).
+    """
+    x = _returns(returns)
+    t, n = x.shape
+    if n < 2:
+        raise ValueError("constant_correlation needs at least 2 assets")
+    x = x - x.mean(axis=0)
+    s = x.T @ x / t
+    var = np.diag(s).copy()
+    std = np.sqrt(var)
+    outer_std = np.outer(std, std)
+    corr = np.divide(s, outer_std, out=np.zeros_like(s), where=outer_std > 0)
+    r_bar = (corr.sum() - np.trace(corr)) / (n * (n - 1))
+    target = r_bar * outer_std
+    target[np.diag_indices(n)] = var
+
+    x2 = x * x
+    # pi_ij: variance of the (i, j) cross-product estimate.
+    pi_mat = x2.T @ x2 / t - s * s
+    pi_hat = pi_mat.sum()
+    # theta[i, j] = mean_t (x_ti^2 - s_ii)(x_ti x_tj - s_ij)
+    theta = (x2 * x).T @ x / t - var[:, np.newaxis] * s
+    ratio = np.divide(std[np.newaxis, :], std[:, np.newaxis], out=np.zeros_like(s), where=std[:, np.newaxis] > 0)
+    off = ratio * theta
+    rho_hat = np.trace(pi_mat) + r_bar * (off.sum() - np.trace(off))
+    gamma_hat = np.sum((target - s) ** 2)
+    kappa = (pi_hat - rho_hat) / gamma_hat if gamma_hat > 0 else 0.0
+    shrinkage = float(np.clip(kappa / t, 0.0, 1.0))
+    return shrinkage * target + (1 - shrinkage) * s, shrinkage
+
+
+def ewma_covariance(returns: Any, decay: float = 0.94, demean: bool = False) -> np.ndarray:
+    """Exponentially weighted covariance (RiskMetrics).
+
+    Equivalent to running cov = decay * cov + (1 - decay) * r r' over the
+    rows, started from the first row's outer product, but computed as one
+    weighted matrix product.
+
+    Parameters
+    ----------
+    returns : array_like
+        Shape (n_periods, n_assets).
+    decay : float
+        Weight kept per period, in (0, 1). RiskMetrics uses 0.94 for daily data.
+    demean : bool
+        Subtract the weighted mean first. RiskMetrics assumes zero mean.
+
+    Returns
+    -------
+    np.ndarray
+        Covariance (n_assets, n_assets).
+    """
+    if not 0 < decay < 1:
+        raise ValueError("decay must be in (0, 1)")
+    r = _returns(returns, min_periods=1)
+    t = r.shape[0]
+    weights = (1 - decay) * decay ** np.arange(t - 1, -1, -1, dtype=np.float64)
+    weights[0] = decay ** (t - 1)  # the seed row carries the weight of the (empty) prior
+    if demean:
+        r = r - weights @ r
+    return (r * weights[:, np.newaxis]).T @ r
+
+
+class EWMACovariance:
+    """EWMA covariance updated one observation at a time (O(n^2) per update)."""
+
+    __slots__ = ("decay", "cov", "count")
+
+    def __init__(self, n_assets: int, decay: float = 0.94) -> None:
+        """Initialize state.
+
+        Parameters
+        ----------
+        n_assets : int
+            Number of assets.
+        decay : float
+            Weight kept per period, in (0, 1).
+        """
+        if not 0 < decay < 1:
+            raise ValueError("decay must be in (0, 1)")
+        self.decay = decay
+        self.cov = np.zeros((n_assets, n_assets))
+        self.count = 0
+
+    def update(self, r: Any) -> np.ndarray:
+        """Absorb one return vector and return the current covariance (a view)."""
+        r = np.asarray(r, dtype=np.float64)
+        if self.count == 0:
+            np.outer(r, r, out=self.cov)
+        else:
+            self.cov *= self.decay
+            self.cov += (1 - self.decay) * np.outer(r, r)
+        self.count += 1
+        return self.cov
+
+
+class RollingCovariance:
+    """Sample covariance of the last `window` observations, updated in O(n^2).
+
+    Each step adds the new row and drops the oldest with centered
+    (Welford-style) rank-one updates, applied as a single rank-two product.
+    Those are numerically stable where raw sums of cross-products are not.
+    The window's rows are kept in a ring buffer, so there is no need to
+    re-read history.
+    """
+
+    __slots__ = ("window", "mean", "_m2", "_rows", "_start", "count")
+
+    def __init__(self, n_assets: int, window: int) -> None:
+        """Initialize state.
+
+        Parameters
+        ----------
+        n_assets : int
+            Number of assets.
+        window : int
+            Observations in the window, at least 2.
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.mean = np.zeros(n_assets)
+        self._m2 = np.zeros((n_assets, n_assets))
+        self._rows = np.empty((window, n_assets))
+        self._start = 0
+        self.count = 0
+
+    def _add(self, r: np.ndarray) -> tuple[np.ndarray, float]:
+        # With mean' = mean + delta / n, (r - mean') = delta * (n - 1) / n, so
+        # the Welford update of M2 is c * delta delta' for the c returned here.
+        self.count += 1
+        delta = r - self.mean
+        self.mean += delta / self.count
+        return delta, (self.count - 1) / self.count
+
+    def _drop(self, r: np.ndarray) -> tuple[np.ndarray, float]:
+        self.count -= 1
+        delta = r - self.mean
+        self.mean -= delta / self.count
+        return delta, -(self.count + 1) / self.count
+
+    def update(self, r: Any) -> "RollingCovariance":
+        """Add one observation (n_assets,), dropping the oldest once the window is full."""
+        r = np.array(r, dtype=np.float64)
+        if self.count == self.window:
+            dropped, c_drop = self._drop(self._rows[self._start])
+            self._rows[self._start] = r
+            self._start = (self._start + 1) % self.window
+            added, c_add = self._add(r)
+            # One symmetric rank-two product instead of two outer products.
+            self._m2 += np.stack([dropped * c_drop, added * c_add], axis=1) @ np.stack([dropped, added])
+        else:
+            self._rows[(self._start + self.count) % self.window] = r
+            added, c_add = self._add(r)
+            self._m2 += np.outer(added * c_add, added)
+        return self
+
+    def update_many(self, returns: Any) -> "RollingCovariance":
+        """Add rows of a (k, n_assets) matrix in order."""
+        for row in np.asarray(returns, dtype=np.float64):
+            self.update(row)
+        return self
+
+    def window_returns(self) -> np.ndarray:
+        """The window's rows, oldest first (a copy)."""
+        idx = (self._start + np.arange(self.count)) % self.window
+        return self._rows[idx]
+
+    def covariance(self) -> np.ndarray:
+        """Unbiased covariance of the current window (a new array)."""
+        if self.count < 2:
+            raise ValueError("RollingCovariance needs at least 2 observations")
+        return self._m2 / (self.count - 1)
+
+
+ESTIMATORS: dict[str, Callable[..., np.ndarray]] = {
+    "sample": sample_covariance,
+    "ledoit_wolf": lambda returns: ledoit_wolf(returns)[0],
+    "constant_correlation": lambda returns: constant_correlation(returns)[0],
+    "ewma": ewma_covariance,
+}
+
+
+class CovarianceCacheStats(NamedTuple):
+    """Hit/miss counters and current size of a covariance cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 when there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CovarianceCache:
+    """Thread-safe LRU of covariance matrices bounded by entries and bytes.
+
+    Keys are (universe, window_end, returns shape, estimator, params). Two
+    lookups in the same cycle for the same universe and window hit the same
+    entry; windows of different lengths ending on the same date do not.
+    Stored matrices are made read-only, because every caller shares them.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """Initialize cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum matrices kept; least recently used are evicted first.
+            0 disables the cache.
+        max_bytes : int
+            Memory budget for stored matrices.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def key(
+        universe: Iterable[Hashable],
+        window_end: Hashable,
+        estimator: str = "sample",
+        *,
+        shape: tuple[int, ...] = (),
+        **params: Any,
+    ) -> tuple[Hashable, ...]:
+        """Cache key for a universe (asset ids, in matrix order), window end, returns shape and estimator."""
+        return (tuple(universe), window_end, tuple(shape), estimator, tuple(sorted(params.items())))
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """Return the cached matrix for key, or None on miss."""
+        with self._lock:
+            cov = self._data.get(key)
+            if cov is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return cov
+
+    def set(self, key: Hashable, cov: np.ndarray) -> np.ndarray:
+        """Store a read-only copy of cov (unless it exceeds the byte budget) and return it."""
+        cov = np.array(cov, dtype=np.float64)
+        cov.setflags(write=False)
+        if not self.max_entries or cov.nbytes > self.max_bytes:
+            return cov
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._data[key] = cov
+            self._bytes += cov.nbytes
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= evicted.nbytes
+        return cov
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the cached matrix for key, computing and storing it on a miss."""
+        cov = self.get(key)
+        if cov is None:
+            cov = self.set(key, compute())
+        return cov
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._hits = self._misses = 0
+
+    def stats(self) -> CovarianceCacheStats:
+        """Snapshot of counters and size."""
+        with self._lock:
+            return CovarianceCacheStats(self._hits, self._misses, len(self._data), self._bytes)
+
+
+_cache = CovarianceCache()
+
+
+def get_covariance_cache() -> CovarianceCache:
+    """Return the process-wide covariance cache."""
+    return _cache
+
+
+def estimate_covariance(
+    returns: Any,
+    estimator: str = "sample",
+    universe: Iterable[Hashable] | None = None,
+    window_end: Hashable | None = None,
+    cache: CovarianceCache | None = None,
+    **params: Any,
+) -> np.ndarray:
+    """Estimate a covariance matrix, reusing a cached one for the same window.
+
+    Parameters
+    ----------
+    returns : array_like
+        Shape (n_periods, n_assets); rows end at window_end.
+    estimator : str
+        One of ESTIMATORS: "sample", "ledoit_wolf", "constant_correlation", "ewma".
+    universe : Iterable[Hashable] | None
+        Asset ids in column order. With window_end, enables caching.
+    window_end : Hashable | None
+        Identifies the window, e.g. its last date. The key also holds the
+        returns shape, so lookbacks of different lengths never share a matrix.
+    cache : CovarianceCache | None
+        Cache to use. None uses the process-wide cache.
+    **params : Any
+        Estimator parameters (e.g. decay for "ewma"); part of the key.
+
+    Returns
+    -------
+    np.ndarray
+        Covariance (n_assets, n_assets); read-only when it came through the cache.
+    """
+    try:
+        fn = ESTIMATORS[estimator]
+    except KeyError:
+        raise ValueError(f"Unknown covariance estimator {estimator!r}; expected one of {tuple(ESTIMATORS)}") from None
+    if universe is None or window_end is None:
+        return fn(returns, **params)
+    cache = cache if cache is not None else get_covariance_cache()
+    key = CovarianceCache.key(universe, window_end, estimator, shape=np.shape(returns), **params)
+    return cache.get_or_compute(key, lambda: fn(returns, **params))
@@ -0,0 +1,404 @@
+"""Mean-variance portfolio optimization.
+
+Solves long-only, budget- and box-constrained portfolio problems with
+NumPy alone:
+
+    minimize   risk_aversion / 2 * w' C w - mu' w
+    subject to sum(w) = budget,  lower <= w <= upper
+
+The solver is accelerated projected gradient (FISTA with adaptive restart).
+The projection onto the capped simplex is a safeguarded Newton/secant
+search for the shift tau in w = clip(v - tau, lower, upper). Each solver
+iteration warm-starts that search from the previous tau, so a projection
+usually takes two or three vector passes. Every routine works on a batch
+of problems that differ only in risk aversion. A whole efficient frontier
+is one matrix-matrix product per iteration, and rows drop out as they
+converge.
+"""
+
+from collections.abc import Hashable, Iterable
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from .covariance import CovarianceCache, estimate_covariance
+
+
+class Portfolio(NamedTuple):
+    """Optimal weights and their per-period statistics."""
+
+    weights: np.ndarray
+    expected_return: float
+    volatility: float
+    sharpe: float
+
+
+class EfficientFrontier(NamedTuple):
+    """Frontier portfolios, one row per risk aversion, ordered by volatility."""
+
+    risk_aversion: np.ndarray
+    weights: np.ndarray
+    expected_return: np.ndarray
+    volatility: np.ndarray
+    sharpe: np.ndarray
+
+
+def estimate_moments(returns: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Sample mean and covariance of a returns matrix.
+
+    Parameters
+    ----------
+    returns : array_like
+        Shape (n_periods, n_assets), one row per period.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Expected returns (n_assets,) and covariance (n_assets, n_assets).
+    """
+    r = np.asarray(returns, dtype=np.float64)
+    if r.ndim != 2 or r.shape[0] < 2:
+        raise ValueError("returns must be a (n_periods, n_assets) matrix with at least 2 periods")
+    if not np.isfinite(r).all():
+        raise ValueError("returns contain NaN or infinite values")
+    mu = r.mean(axis=0)
+    centered = r - mu
+    cov = centered.T @ centered / (r.shape[0] - 1)
+    return mu, cov
+
+
+def project_capped_simplex(
+    v: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    budget: float = 1.0,
+    tau: np.ndarray | None = None,
+    max_iter: int = 100,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Euclidean projection of each row of v onto {w : sum(w) = budget, lower <= w <= upper}.
+
+    Parameters
+    ----------
+    v : np.ndarray
+        Points to project, shape (k, n).
+    lower, upper : np.ndarray
+        Bounds, shape (n,); sum(lower) <= budget <= sum(upper).
+    budget : float
+        Required sum of each row.
+    tau : np.ndarray | None
+        Starting shifts (k,), e.g. from projecting nearby points.
+    max_iter : int
+        Root-finding iterations cap.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Projected rows (k, n) and the shifts tau (k,) that produced them.
+    """
+    k = v.shape[0]
+    # sum(clip(v - tau)) falls from sum(upper) at lo to sum(lower) at hi.
+    lo = (v - upper).min(axis=1)
+    hi = (v - lower).max(axis=1)
+    g_lo = np.full(k, upper.sum())
+    g_hi = np.full(k, lower.sum())
+    if tau is None:
+        tau = (v.sum(axis=1) - budget) / v.shape[1]
+    tau = np.clip(tau, lo, hi)
+    tol = 1e-13 * max(1.0, abs(budget))
+    for _ in range(max_iter):
+        w = np.clip(v - tau[:, np.newaxis], lower, upper)
+        g = w.sum(axis=1)
+        r = g - budget
+        if np.abs(r).max() <= tol:
+            break
+        above = r > 0
+        lo = np.where(above, tau, lo)
+        g_lo = np.where(above, g, g_lo)
+        hi = np.where(above, hi, tau)
+        g_hi = np.where(above, g_hi, g)
+        # Newton on the piecewise-linear sum; regula falsi when it leaves the bracket.
+        free = ((w > lower) & (w < upper)).sum(axis=1)
+        newton = tau + r / np.maximum(free, 1)
+        span = g_lo - g_hi
+        secant = lo + (g_lo - budget) * (hi - lo) / np.where(span > 0, span, 1.0)
+        tau = np.where((free > 0) & (newton > lo) & (newton < hi), newton, secant)
+    return w, tau
+
+
+def _bounds(value: Any, n: int, name: str) -> np.ndarray:
+    b = np.broadcast_to(np.asarray(value, dtype=np.float64), (n,)).copy()
+    if not np.isfinite(b).all():
+        raise ValueError(f"{name} bounds must be finite")
+    return b
+
+
+class MeanVarianceOptimizer:
+    """Long-only, budget- and box-constrained mean-variance optimizer."""
+
+    def __init__(
+        self,
+        expected_returns: Any,
+        covariance: Any,
+        lower: Any = 0.0,
+        upper: Any = 1.0,
+        budget: float = 1.0,
+        risk_free: float = 0.0,
+        tol: float = 1e-9,
+        max_iter: int = 20_000,
+    ) -> None:
+        """Initialize optimizer.
+
+        Parameters
+        ----------
+        expected_returns : array_like
+            Per-period expected returns (n_assets,).
+        covariance : array_like
+            Per-period covariance (n_assets, n_assets), symmetric PSD.
+        lower, upper : array_like
+            Per-asset weight bounds, scalars or (n_assets,). The default
+            (0, 1) is long-only with no cap.
+        budget : float
+            Sum of weights (1 = fully invested).
+        risk_free : float
+            Per-period risk-free rate for Sharpe ratios.
+        tol : float
+            Stop when no weight moves more than tol in an iteration.
+        max_iter : int
+            Iteration cap per solve.
+        """
+        self.mu = np.asarray(expected_returns, dtype=np.float64)
+        self.cov = np.asarray(covariance, dtype=np.float64)
+        n = self.mu.shape[0]
+        if self.mu.ndim != 1 or self.cov.shape != (n, n):
+            raise ValueError(f"Expected returns {self.mu.shape} and covariance {self.cov.shape} do not match")
+        self.lower = _bounds(lower, n, "lower")
+        self.upper = _bounds(upper, n, "upper")
+        if (self.lower > self.upper).any() or not self.lower.sum() <= budget <= self.upper.sum():
+            raise ValueError("Infeasible constraints: need lower <= upper and sum(lower) <= budget <= sum(upper)")
+        self.budget = budget
+        self.risk_free = risk_free
+        self.tol = tol
+        self.max_iter = max_iter
+        self._lipschitz = self._max_eigenvalue() * 1.05
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns: Any,
+        estimator: str = "sample",
+        universe: Iterable[Hashable] | None = None,
+        window_end: Hashable | None = None,
+        cache: CovarianceCache | None = None,
+        **kwargs: Any,
+    ) -> "MeanVarianceOptimizer":
+        """Build from a (n_periods, n_assets) returns matrix.
+
+        Expected returns are sample means; the covariance comes from
+        estimator (see covariance.ESTIMATORS), e.g. "ledoit_wolf" when
+        periods are few relative to assets. With universe and window_end it
+        goes through the covariance cache (see estimate_covariance), shared
+        with other optimizations and risk calculations on the same window.
+        """
+        mu, cov = estimate_moments(returns)
+        if estimator != "sample" or (universe is not None and window_end is not None):
+            cov = estimate_covariance(returns, estimator, universe, window_end, cache)
+        return cls(mu, cov, **kwargs)
+
+    def _max_eigenvalue(self, iterations: int = 50) -> float:
+        """Largest covariance eigenvalue by power iteration (sets the step size)."""
+        x = np.full(self.mu.shape[0], 1.0)
+        for _ in range(iterations):
+            y = self.cov @ x
+            norm = np.linalg.norm(y)
+            if norm == 0:
+                return 1.0
+            x = y / norm
+        return max(float(x @ self.cov @ x), 1e-12)
+
+    def solve(
+        self,
+        risk_aversion: Any,
+        mu: np.ndarray | None = None,
+        start: np.ndarray | None = None,
+        tol: float | None = None,
+    ) -> np.ndarray:
+        """Solve one problem per risk aversion, all at once.
+
+        Parameters
+        ----------
+        risk_aversion : array_like
+            Positive risk aversions (k,) (or a scalar).
+        mu : np.ndarray | None
+            Expected returns to use instead of the optimizer's (zeros give
+            minimum variance).
+        start : np.ndarray | None
+            Initial weights (k, n_assets) for warm starts.
+        tol : float | None
+            Convergence tolerance instead of the optimizer's.
+
+        Returns
+        -------
+        np.ndarray
+            Optimal weights, shape (k, n_assets).
+        """
+        lam = np.atleast_1d(np.asarray(risk_aversion, dtype=np.float64))
+        if (lam <= 0).any():
+            raise ValueError("risk_aversion must be positive")
+        mu = self.mu if mu is None else mu
+        k, n = lam.shape[0], self.mu.shape[0]
+        lower, upper, budget = self.lower, self.upper, self.budget
+
+        x0 = np.full((k, n), budget / n) if start is None else np.array(start, dtype=np.float64)
+        w, tau = project_capped_simplex(x0, lower, upper, budget)
+        out = np.empty((k, n))
+        active = np.arange(k)
+        y = w.copy()
+        t = np.ones(k)
+        step = 1.0 / (lam * self._lipschitz)
+        tol = self.tol if tol is None else tol
+        for _ in range(self.max_iter):
+            grad = lam[active, np.newaxis] * (y @ self.cov) - mu
+            w_new, tau = project_capped_simplex(y - step[active, np.newaxis] * grad, lower, upper, budget, tau)
+            diff = w_new - w
+            # Restart momentum when it points uphill (O'Donoghue & Candes).
+            restart = np.einsum("kn,kn->k", y - w_new, diff) > 0
+            t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+            momentum = np.where(restart, 0.0, (t - 1) / t_next)
+            t = np.where(restart, 1.0, t_next)
+            y = w_new + momentum[:, np.newaxis] * diff
+            w = w_new
+            done = np.abs(diff).max(axis=1) < tol
+            if done.any():
+                out[active[done]] = w[done]
+                keep = ~done
+                active, w, y, t, tau = active[keep], w[keep], y[keep], t[keep], tau[keep]
+                if not active.size:
+                    break
+        out[active] = w
+        return out
+
+    def _stats(self, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        ret = weights @ self.mu
+        vol = np.sqrt(np.maximum(np.einsum("kn,kn->k", weights @ self.cov, weights), 0.0))
+        excess = ret - self.risk_free * self.budget
+        sharpe = np.divide(excess, vol, out=np.zeros_like(vol), where=vol > 0)
+        return ret, vol, sharpe
+
+    def _portfolio(self, weights: np.ndarray) -> Portfolio:
+        ret, vol, sharpe = self._stats(weights[np.newaxis, :])
+        return Portfolio(weights, float(ret[0]), float(vol[0]), float(sharpe[0]))
+
+    def min_variance(self) -> Portfolio:
+        """Minimum-variance portfolio (expected returns ignored)."""
+        return self._portfolio(self.solve(1.0, mu=np.zeros_like(self.mu))[0])
+
+    def mean_variance(self, risk_aversion: float) -> Portfolio:
+        """Portfolio maximizing mu'w - risk_aversion / 2 * w'Cw."""
+        return self._portfolio(self.solve(risk_aversion)[0])
+
+    def default_risk_aversions(self, n_points: int = 50) -> np.ndarray:
+        """Log-spaced risk aversions spanning max-return to min-variance portfolios.
+
+        Scaled so that the return and risk terms balance in the middle of
+        the range for a typical asset.
+        """
+        spread = max(float(np.abs(self.mu - self.mu.mean()).max()), 1e-12)
+        scale = spread / max(float(np.mean(np.diag(self.cov))), 1e-12)
+        return scale * np.geomspace(1e-2, 1e4, n_points)
+
+    def frontier(self, risk_aversions: Any = None, n_points: int = 50) -> EfficientFrontier:
+        """Compute many efficient portfolios in one batched solve.
+
+        Parameters
+        ----------
+        risk_aversions : array_like | None
+            Risk aversions to solve for. None uses default_risk_aversions(n_points).
+        n_points : int
+            Frontier size when risk_aversions is None.
+
+        Returns
+        -------
+        EfficientFrontier
+            Rows ordered by increasing volatility.
+        """
+        lam = self.default_risk_aversions(n_points) if risk_aversions is None else np.atleast_1d(risk_aversions)
+        lam = np.sort(np.asarray(lam, dtype=np.float64))[::-1]
+        weights = self.solve(lam)
+        ret, vol, sharpe = self._stats(weights)
+        order = np.argsort(vol, kind="stable")
+        return EfficientFrontier(lam[order], weights[order], ret[order], vol[order], sharpe[order])
+
+    def _sharpe_fixed_point(self, weights: np.ndarray) -> float:
+        """excess_return / variance of weights: the risk aversion they would be optimal for."""
+        ret, vol, _ = self._stats(weights[np.newaxis, :])
+        return float((ret[0] - self.risk_free * self.budget) / max(vol[0] ** 2, 1e-300))
+
+    def max_sharpe(self, n_points: int = 10, refine_iter: int = 30, rtol: float = 1e-6) -> Portfolio:
+        """Portfolio with the highest Sharpe ratio under the constraints.
+
+        The best point of a coarse, loosely solved frontier is refined by solving
+        risk_aversion = excess_return / variance (by secant steps, with
+        warm starts). At that point the mean-variance and max-Sharpe
+        optimality conditions coincide.
+
+        Raises
+        ------
+        ValueError
+            If no feasible portfolio earns more than the risk-free rate.
+        """
+        # A loose coarse frontier is enough to pick the starting point.
+        grid = self.default_risk_aversions(n_points)
+        coarse = self.solve(grid, tol=1e-6)
+        ret, _, sharpe = self._stats(coarse)
+        best = int(np.argmax(sharpe))
+        if ret[best] - self.risk_free * self.budget <= 0:
+            raise ValueError("No feasible portfolio has a positive excess return")
+        weights = coarse[best]
+        lam = float(grid[best])
+        resid = self._sharpe_fixed_point(weights) - lam
+        prev: tuple[float, float] | None = None
+        for _ in range(refine_iter):
+            nxt = lam + resid
+            if prev is not None and resid != prev[1]:
+                secant = lam - resid * (lam - prev[0]) / (resid - prev[1])
+                nxt = secant if secant > 0 and np.isfinite(secant) else nxt
+            if nxt <= 0 or abs(nxt - lam) <= rtol * lam:
+                break
+            prev = (lam, resid)
+            weights = self.solve(nxt, start=weights[np.newaxis, :], tol=max(self.tol, 1e-7))[0]
+            lam = nxt
+            resid = self._sharpe_fixed_point(weights) - lam
+        return self._portfolio(self.solve(lam, start=weights[np.newaxis, :])[0])
+
+
+OBJECTIVES = ("min_variance", "mean_variance", "max_sharpe")
+
+
+def optimize(returns: Any, objective: str = "max_sharpe", risk_aversion: float = 1.0, **kwargs: Any) -> Portfolio:
+    """Optimize weights for a returns matrix.
+
+    Parameters
+    ----------
+    returns : array_like
+        Shape (n_periods, n_assets).
+    objective : str
+        "min_variance", "mean_variance" or "max_sharpe".
+    risk_aversion : float
+        Used by "mean_variance".
+    **kwargs : Any
+        MeanVarianceOptimizer.from_returns options (estimator, universe,
+        window_end, cache, lower, upper, budget, risk_free, ...).
+
+    Returns
+    -------
+    Portfolio
+        Weights with expected return, volatility and Sharpe ratio.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}; expected one of {OBJECTIVES}")
+    optimizer = MeanVarianceOptimizer.from_returns(returns, **kwargs)
+    if objective == "min_variance":
+        return optimizer.min_variance()
+    if objective == "mean_variance":
+        return optimizer.mean_variance(risk_aversion)
+    return optimizer.max_sharpe()
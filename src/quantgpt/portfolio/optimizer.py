@@ -1,11 +1,33 @@
 """Portfolio optimizer."""
-from typing import Sequence
+from typing import Any
 
+import numpy as np
 
-def optimize_portfolio(prices: Sequence[float]) -> Sequence[float]:
-    """Return naive equal-weight allocation."""
-    n = len(prices)
-    if n == 0:
-        raise ValueError("No price data provided")
-    weight = 1.0 / n
-    return [weight] * n
+from .mean_variance import optimize
+
+
+def optimize_portfolio(returns: Any, objective: str = "max_sharpe", **kwargs: Any) -> list[float]:
+    """Optimal weights for a returns matrix.
+
+    Parameters
+    ----------
+    returns : array_like
+        Asset returns (n_periods, n_assets), optimized with portfolio.optimize.
+        A 1-D sequence (one value per asset, as older callers passed prices)
+        carries no return history and gets the equal-weight allocation.
+    objective : str
+        "min_variance", "mean_variance" or "max_sharpe".
+    **kwargs : Any
+        portfolio.optimize options (estimator, lower, upper, risk_aversion, ...).
+
+    Returns
+    -------
+    list[float]
+        One weight per asset.
+    """
+    r = np.asarray(returns, dtype=np.float64)
+    if r.ndim == 1:
+        if r.size == 0:
+            raise ValueError("No price data provided")
+        return [1.0 / r.size] * r.size
+    return optimize(r, objective=objective, **kwargs).weights.tolist()
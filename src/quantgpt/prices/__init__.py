@@ -0,0 +1,4 @@
+"""Local price history storage."""
+from .store import PriceStore, open_price_store
+
+__all__ = ["PriceStore", "open_price_store"]
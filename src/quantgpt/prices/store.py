@@ -0,0 +1,309 @@
+"""Memory-mapped columnar price history.
+
+A store is a directory holding one raw little-endian float64 file per
+field (close, volume, ...) and an int64 file of dates (days since
+1970-01-01), plus meta.json. Each field file is a time-major matrix of
+shape (capacity, n_symbols). A day's ingestion appends one contiguous
+row per field, and a date range of every symbol is one contiguous block.
+Missing values are NaN.
+
+Readers map the files read-only with np.memmap, so every process that
+opens the store shares the OS page cache and reads only the pages a
+query touches. window() and panel() return views into the mapping, not
+copies, whenever the requested symbols are contiguous columns. These
+arrays feed forecasting.forecast, backtest.simulate and
+portfolio.optimize directly.
+
+Ingestion is append-only and single-writer. Rows are written first and
+meta.json, which records the visible length, is replaced atomically
+afterwards, so readers never see a partial day. Files grow by doubling
+capacity in place (a mapping of the shorter file stays valid), and
+readers pick up new days with refresh().
+"""
+
+import datetime
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+_FORMAT_VERSION = 1
+META = "meta.json"
+DATES = "dates.i8"
+# Rows NaN-filled per write when a field file grows.
+_FILL_ROWS = 4096
+
+
+def _day(value: Any) -> np.datetime64:
+    """A date, datetime, ISO string or datetime64 as datetime64[D]."""
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+class PriceStore:
+    """Append-only, memory-mapped (date x symbol) price matrices, one per field."""
+
+    def __init__(self, path: str | os.PathLike[str], writable: bool = False) -> None:
+        """Open an existing store; use create() for a new one.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Store directory.
+        writable : bool
+            Map for ingestion (one writer at a time). Readers use the default.
+        """
+        self.path = os.fspath(path)
+        self.writable = writable
+        self._maps: dict[str, np.memmap] = {}
+        self._capacity = 0
+        self.refresh()
+
+    @classmethod
+    def create(
+        cls,
+        path: str | os.PathLike[str],
+        symbols: Sequence[str],
+        fields: Sequence[str] = ("close",),
+        capacity: int = 1024,
+    ) -> "PriceStore":
+        """Create an empty store and return it open for writing.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Directory to create; must not already hold a store.
+        symbols : Sequence[str]
+            Column order. Keep symbols queried together adjacent so their
+            slices are views.
+        fields : Sequence[str]
+            Price fields, one file each.
+        capacity : int
+            Days allocated up front; doubled as needed.
+
+        Returns
+        -------
+        PriceStore
+            The new store, writable.
+        """
+        if not symbols or not fields:
+            raise ValueError("A price store needs at least one symbol and one field")
+        if len(set(symbols)) != len(symbols) or len(set(fields)) != len(fields):
+            raise ValueError("Duplicate symbols or fields")
+        if os.path.exists(os.path.join(path, META)):
+            raise ValueError(f"A price store already exists at {os.fspath(path)}")
+        os.makedirs(path, exist_ok=True)
+        meta = {
+            "version": _FORMAT_VERSION,
+            "symbols": list(symbols),
+            "fields": list(fields),
+            "length": 0,
+            "capacity": max(capacity, 1),
+        }
+        for name in (DATES, *(f"{field}.f8" for field in fields)):
+            with open(os.path.join(path, name), "wb"):
+                pass
+        cls._grow_files(os.fspath(path), meta, 0)
+        cls._write_meta(os.fspath(path), meta)
+        return cls(path, writable=True)
+
+    @staticmethod
+    def _write_meta(path: str, meta: Mapping[str, Any]) -> None:
+        tmp = os.path.join(path, META + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(path, META))
+
+    @staticmethod
+    def _grow_files(path: str, meta: Mapping[str, Any], old_capacity: int) -> None:
+        """Extend every file to meta's capacity, NaN-filling new field rows."""
+        capacity, n_symbols = meta["capacity"], len(meta["symbols"])
+        os.truncate(os.path.join(path, DATES), capacity * 8)
+        for field in meta["fields"]:
+            name = os.path.join(path, f"{field}.f8")
+            with open(name, "r+b") as f:
+                f.seek(old_capacity * n_symbols * 8)
+                for lo in range(old_capacity, capacity, _FILL_ROWS):
+                    f.write(np.full((min(_FILL_ROWS, capacity - lo), n_symbols), np.nan, dtype="<f8").tobytes())
+
+    def refresh(self) -> "PriceStore":
+        """Re-read meta.json, remapping the files if they have grown."""
+        with open(os.path.join(self.path, META), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported price store version {meta.get('version')!r}")
+        self.symbols: list[str] = meta["symbols"]
+        self.fields: list[str] = meta["fields"]
+        self._columns = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._length = meta["length"]
+        if meta["capacity"] != self._capacity:
+            self._map(meta["capacity"])
+        return self
+
+    def _map(self, capacity: int) -> None:
+        mode = "r+" if self.writable else "r"
+        self._maps.clear()
+        self._capacity = capacity
+        self._maps[DATES] = np.memmap(os.path.join(self.path, DATES), dtype="<i8", mode=mode, shape=(capacity,))
+        for field in self.fields:
+            self._maps[field] = np.memmap(
+                os.path.join(self.path, f"{field}.f8"), dtype="<f8", mode=mode, shape=(capacity, len(self.symbols))
+            )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "PriceStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush pending writes and drop the mappings."""
+        if self.writable:
+            self.flush()
+        self._maps.clear()
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Stored dates as datetime64[D] (a read-only view)."""
+        dates = np.asarray(self._maps[DATES][: self._length]).view("datetime64[D]")
+        dates.flags.writeable = False
+        return dates
+
+    def append(self, date: Any, values: Any) -> None:
+        """Append one day. values is an array over symbols, or a {field: array} mapping.
+
+        Fields missing from the mapping are NaN for the day. The day is
+        published to readers on return.
+        """
+        self.append_many([date], {k: [v] for k, v in values.items()} if isinstance(values, Mapping) else [values])
+
+    def append_many(self, dates: Iterable[Any], values: Any) -> None:
+        """Append days in order and publish them.
+
+        Parameters
+        ----------
+        dates : Iterable[Any]
+            New dates, strictly increasing and after the last stored date.
+        values : array_like or Mapping[str, array_like]
+            (n_days, n_symbols) rows, for the only field or per field name.
+        """
+        if not self.writable:
+            raise ValueError("Price store is open read-only")
+        days = np.array([_day(d) for d in dates], dtype="datetime64[D]")
+        if isinstance(values, Mapping):
+            rows = values
+        elif len(self.fields) == 1:
+            rows = {self.fields[0]: values}
+        else:
+            raise ValueError(f"Store has fields {self.fields}; pass values as a mapping")
+        unknown = set(rows) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown fields {sorted(unknown)}; store has {self.fields}")
+        arrays = {field: np.asarray(block, dtype=np.float64) for field, block in rows.items()}
+        for field, block in arrays.items():
+            if block.shape != (days.size, len(self.symbols)):
+                raise ValueError(f"{field} must have shape ({days.size}, {len(self.symbols)}), got {block.shape}")
+        if days.size == 0:
+            return
+        last = self.dates[-1] if self._length else None
+        if (np.diff(days) <= np.timedelta64(0, "D")).any() or (last is not None and days[0] <= last):
+            raise ValueError("Dates must be strictly increasing and after the last stored date")
+
+        lo, hi = self._length, self._length + days.size
+        if hi > self._capacity:
+            self._resize(max(hi, 2 * self._capacity))
+        self._maps[DATES][lo:hi] = days.view("<i8")
+        for field in self.fields:
+            self._maps[field][lo:hi] = arrays.get(field, np.nan)
+        self._length = hi
+        self.flush()
+
+    def _resize(self, capacity: int) -> None:
+        meta = {"symbols": self.symbols, "fields": self.fields, "capacity": capacity}
+        for m in self._maps.values():
+            m.flush()
+        self._maps.clear()
+        self._grow_files(self.path, meta, self._capacity)
+        self._map(capacity)
+
+    def flush(self) -> None:
+        """Write mapped rows to disk, then publish the new length in meta.json."""
+        if not self.writable:
+            return
+        for m in self._maps.values():
+            m.flush()
+        self._write_meta(
+            self.path,
+            {
+                "version": _FORMAT_VERSION,
+                "symbols": self.symbols,
+                "fields": self.fields,
+                "length": self._length,
+                "capacity": self._capacity,
+            },
+        )
+
+    def _columns_for(self, symbols: Sequence[str] | None) -> slice | np.ndarray:
+        if symbols is None:
+            return slice(None)
+        try:
+            cols = np.array([self._columns[s] for s in symbols], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Unknown symbol {e.args[0]!r}") from None
+        if cols.size and (np.diff(cols) == 1).all():
+            return slice(int(cols[0]), int(cols[-1]) + 1)
+        return cols
+
+    def _rows_for(self, start: Any, end: Any) -> slice:
+        dates = self.dates
+        lo = 0 if start is None else int(np.searchsorted(dates, _day(start), side="left"))
+        hi = self._length if end is None else int(np.searchsorted(dates, _day(end), side="right"))
+        return slice(lo, hi)
+
+    def window(
+        self, field: str = "close", symbols: Sequence[str] | None = None, start: Any = None, end: Any = None
+    ) -> np.ndarray:
+        """Values of field for dates in [start, end], shape (n_dates, n_symbols).
+
+        Parameters
+        ----------
+        field : str
+            Stored field.
+        symbols : Sequence[str] | None
+            Columns in order; None for all. Contiguous columns in store
+            order give a zero-copy view, others a copy.
+        start, end : date-like | None
+            Inclusive bounds; None for the first or last stored date.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only view (or copy) into the store.
+        """
+        if field not in self.fields:
+            raise ValueError(f"Unknown field {field!r}; store has {self.fields}")
+        block = np.asarray(self._maps[field][self._rows_for(start, end), self._columns_for(symbols)])
+        block.flags.writeable = False
+        return block
+
+    def panel(
+        self, field: str = "close", symbols: Sequence[str] | None = None, start: Any = None, end: Any = None
+    ) -> np.ndarray:
+        """Like window() but shaped (n_symbols, n_dates), the forecasting and backtest layout."""
+        return self.window(field, symbols, start, end).T
+
+    def returns(self, symbols: Sequence[str] | None = None, start: Any = None, end: Any = None) -> np.ndarray:
+        """Simple returns of close prices, (n_dates - 1, n_symbols), for portfolio and risk."""
+        prices = self.window("close", symbols, start, end)
+        return prices[1:] / prices[:-1] - 1
+
+
+def open_price_store(path: str | os.PathLike[str]) -> PriceStore:
+    """Open a store read-only (what API workers and analytics use)."""
+    return PriceStore(path)
@@ -0,0 +1,18 @@
+"""Portfolio risk: VaR and CVaR."""
+from .engine import (
+    RiskEstimate,
+    cholesky_factor,
+    historical_var,
+    monte_carlo_var,
+    parametric_var,
+    portfolio_risk,
+)
+
+__all__ = [
+    "RiskEstimate",
+    "cholesky_factor",
+    "historical_var",
+    "monte_carlo_var",
+    "parametric_var",
+    "portfolio_risk",
+]
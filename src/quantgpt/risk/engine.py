@@ -0,0 +1,390 @@
+"""Value at Risk and Expected Shortfall for linear portfolios.
+
+Losses are positive numbers: a VaR of 0.02 at 95% means the portfolio
+loses more than 2% of its value in 5% of periods. CVaR (expected
+shortfall) is the mean loss in that tail. Three methods are available:
+
+- parametric: closed form under a normal or Student-t distribution of
+  returns. Student t is scaled to the given covariance.
+- historical: the empirical tail of the portfolio returns.
+- monte_carlo: multivariate normal or t draws, correlated through the
+  Cholesky factor of the covariance.
+
+Monte Carlo works in chunks of paths. Each chunk has its own random
+stream, spawned from one SeedSequence, so results do not depend on how
+chunks are split across worker processes. After each chunk only its
+worst ceil((1 - confidence) * n_paths) losses are kept, so memory is
+bounded by the chunk size whatever the number of paths. With simple
+returns the portfolio return is linear in the draws: each chunk of
+standard normals is projected on L'w and the (paths, assets) matrix of
+correlated returns is never formed. With log returns every asset is
+revalued with exp(r) - 1, so each chunk is correlated in full.
+"""
+
+import math
+from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from ..portfolio import CovarianceCache, estimate_covariance, estimate_moments
+
+DISTRIBUTIONS = ("normal", "t")
+METHODS = ("parametric", "historical", "monte_carlo")
+
+
+class RiskEstimate(NamedTuple):
+    """VaR and CVaR of one portfolio at one confidence level, as positive losses."""
+
+    var: float
+    cvar: float
+    confidence: float
+    method: str
+
+
+def _weights(weights: Any) -> np.ndarray:
+    # Accept a Portfolio (anything with .weights) as well as a plain sequence.
+    w = np.asarray(getattr(weights, "weights", weights), dtype=np.float64)
+    if w.ndim != 1 or w.size == 0:
+        raise ValueError("weights must be a non-empty vector")
+    return w
+
+
+def _moments(weights: Any, mu: Any, cov: Any) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    w = _weights(weights)
+    mu = np.asarray(mu, dtype=np.float64)
+    cov = np.asarray(cov, dtype=np.float64)
+    if mu.shape != w.shape or cov.shape != (w.size, w.size):
+        raise ValueError(f"weights {w.shape}, expected returns {mu.shape} and covariance {cov.shape} do not match")
+    return w, mu, cov
+
+
+def _check(confidence: float, distribution: str, dof: float) -> None:
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}; expected one of {DISTRIBUTIONS}")
+    if distribution == "t" and dof <= 2:
+        raise ValueError("dof must be greater than 2 for a finite variance")
+
+
+def _tail_size(n: int, confidence: float) -> int:
+    # Rounding guards against 1000 * (1 - 0.95) = 50.000000000000004.
+    return max(1, math.ceil(round(n * (1 - confidence), 9)))
+
+
+def _worst(losses: np.ndarray, k: int) -> np.ndarray:
+    """The k largest losses, unordered."""
+    if losses.size <= k:
+        return losses
+    return np.partition(losses, losses.size - k)[losses.size - k :]
+
+
+def _tail_risk(tail: np.ndarray, confidence: float, method: str) -> RiskEstimate:
+    """VaR is the smallest loss in the tail, CVaR the tail mean."""
+    tail = np.sort(tail)  # fixed summation order, however the tail was merged
+    return RiskEstimate(float(tail[0]), float(tail.mean()), confidence, method)
+
+
+def _t_pdf(x: float, dof: float) -> float:
+    log_norm = math.lgamma((dof + 1) / 2) - math.lgamma(dof / 2) - 0.5 * math.log(dof * math.pi)
+    return math.exp(log_norm - (dof + 1) / 2 * math.log1p(x * x / dof))
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta I_x(a, b) by Lentz's continued fraction."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _betainc(b, a, 1.0 - x)
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)) / a
+    tiny = 1e-300
+    c, d, f = 1.0, 0.0, 1.0
+    for i in range(400):
+        m = i // 2
+        if i == 0:
+            num = 1.0
+        elif i % 2:
+            num = -((a + m) * (a + b + m) * x) / ((a + 2 * m) * (a + 2 * m + 1))
+        else:
+            num = (m * (b - m) * x) / ((a + 2 * m - 1) * (a + 2 * m))
+        d = 1.0 + num * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + num / c
+        c = c if abs(c) > tiny else tiny
+        f *= c * d
+        if abs(1.0 - c * d) < 1e-15:
+            break
+    return front * (f - 1.0)
+
+
+def _t_cdf(x: float, dof: float) -> float:
+    tail = 0.5 * _betainc(dof / 2, 0.5, dof / (dof + x * x))
+    return 1.0 - tail if x > 0 else tail
+
+
+def _t_ppf(q: float, dof: float) -> float:
+    """Student-t quantile by Newton's method from the normal quantile."""
+    x = NormalDist().inv_cdf(q)
+    for _ in range(50):
+        step = (_t_cdf(x, dof) - q) / _t_pdf(x, dof)
+        x -= step
+        if abs(step) < 1e-12 * max(1.0, abs(x)):
+            break
+    return x
+
+
+def parametric_var(
+    weights: Any,
+    mu: Any,
+    cov: Any,
+    confidence: float = 0.95,
+    horizon: float = 1.0,
+    distribution: str = "normal",
+    dof: float = 5.0,
+) -> RiskEstimate:
+    """Closed-form VaR and CVaR of portfolio returns.
+
+    Parameters
+    ----------
+    weights : array_like or Portfolio
+        Portfolio weights (n_assets,).
+    mu : array_like
+        Expected per-period asset returns (n_assets,).
+    cov : array_like
+        Per-period covariance (n_assets, n_assets).
+    confidence : float
+        VaR confidence level, e.g. 0.95 or 0.99.
+    horizon : float
+        Periods; mean scales with horizon, volatility with its square root.
+    distribution : str
+        "normal" or "t" (Student t with dof degrees of freedom, scaled to
+        the given covariance).
+    dof : float
+        Degrees of freedom for "t", greater than 2.
+
+    Returns
+    -------
+    RiskEstimate
+        VaR and CVaR as positive losses.
+    """
+    _check(confidence, distribution, dof)
+    w, mu, cov = _moments(weights, mu, cov)
+    mean = float(w @ mu) * horizon
+    sigma = math.sqrt(max(float(w @ cov @ w), 0.0) * horizon)
+    if distribution == "normal":
+        z = NormalDist().inv_cdf(confidence)
+        var, tail = z, NormalDist().pdf(z) / (1 - confidence)
+    else:
+        scale = math.sqrt((dof - 2) / dof)
+        t = _t_ppf(confidence, dof)
+        var = scale * t
+        tail = scale * _t_pdf(t, dof) / (1 - confidence) * (dof + t * t) / (dof - 1)
+    return RiskEstimate(sigma * var - mean, sigma * tail - mean, confidence, "parametric")
+
+
+def historical_var(returns: Any, weights: Any, confidence: float = 0.95) -> RiskEstimate:
+    """VaR and CVaR from the empirical distribution of past portfolio returns.
+
+    Parameters
+    ----------
+    returns : array_like
+        Asset returns (n_periods, n_assets).
+    weights : array_like or Portfolio
+        Portfolio weights (n_assets,).
+    confidence : float
+        VaR confidence level.
+
+    Returns
+    -------
+    RiskEstimate
+        VaR and CVaR as positive losses.
+    """
+    _check(confidence, "normal", 0.0)
+    w = _weights(weights)
+    r = np.asarray(returns, dtype=np.float64)
+    if r.ndim != 2 or r.shape[1] != w.size or r.shape[0] == 0:
+        raise ValueError(f"returns must be (n_periods, {w.size}), got shape {r.shape}")
+    losses = -(r @ w)
+    return _tail_risk(_worst(losses, _tail_size(losses.size, confidence)), confidence, "historical")
+
+
+def cholesky_factor(cov: np.ndarray) -> np.ndarray:
+    """Lower-triangular L with L L' = cov; falls back to an eigendecomposition for singular cov."""
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        values, vectors = np.linalg.eigh(cov)
+        if values.min() < -1e-10 * max(values.max(), 1.0):
+            raise ValueError("Covariance is not positive semi-definite") from None
+        return vectors * np.sqrt(np.clip(values, 0.0, None))
+
+
+def _simulate_tail(
+    seeds: Sequence[np.random.SeedSequence],
+    sizes: Sequence[int],
+    w: np.ndarray,
+    mean: np.ndarray,
+    factor: np.ndarray,
+    distribution: str,
+    dof: float,
+    log_returns: bool,
+    keep: int,
+) -> np.ndarray:
+    """Simulate the given chunks and return their `keep` worst losses."""
+    # For simple returns only the projection of the draws on L'w matters.
+    loading = factor.T @ w
+    base = float(w @ mean)
+    tail = np.empty(0)
+    for seed, size in zip(seeds, sizes):
+        rng = np.random.default_rng(seed)
+        z = rng.standard_normal((size, w.size))
+        if distribution == "t":
+            # Multivariate t: one chi-square mixing draw per path, rescaled to unit variance.
+            mix = np.sqrt((dof - 2) / rng.chisquare(dof, size))
+        if log_returns:
+            r = z @ factor.T
+            if distribution == "t":
+                r *= mix[:, np.newaxis]
+            r += mean
+            np.expm1(r, out=r)
+            losses = -(r @ w)
+        else:
+            shock = z @ loading
+            if distribution == "t":
+                shock *= mix
+            losses = -(shock + base)
+        tail = _worst(np.concatenate([tail, _worst(losses, keep)]), keep)
+    return tail
+
+
+def monte_carlo_var(
+    weights: Any,
+    mu: Any,
+    cov: Any,
+    confidence: float = 0.95,
+    horizon: float = 1.0,
+    n_paths: int = 100_000,
+    distribution: str = "normal",
+    dof: float = 5.0,
+    log_returns: bool = False,
+    chunk_size: int = 20_000,
+    seed: int | None = None,
+    workers: int = 1,
+) -> RiskEstimate:
+    """VaR and CVaR by simulating correlated asset returns.
+
+    Parameters
+    ----------
+    weights : array_like or Portfolio
+        Portfolio weights (n_assets,).
+    mu : array_like
+        Expected per-period asset returns (n_assets,).
+    cov : array_like
+        Per-period covariance (n_assets, n_assets).
+    confidence : float
+        VaR confidence level.
+    horizon : float
+        Periods; draws have mean mu * horizon and covariance cov * horizon.
+    n_paths : int
+        Number of simulated scenarios.
+    distribution : str
+        "normal" or "t" (multivariate Student t scaled to cov).
+    dof : float
+        Degrees of freedom for "t", greater than 2.
+    log_returns : bool
+        Treat mu and cov as log-return moments and revalue each asset with
+        exp(r) - 1. This forms each chunk's correlated return matrix, so it
+        costs an extra matrix product per chunk.
+    chunk_size : int
+        Paths per chunk; peak memory is about chunk_size * n_assets * 16 bytes
+        per worker.
+    seed : int | None
+        Root seed. The same seed gives the same result for any workers.
+    workers : int
+        Processes to spread chunks over (1 runs in this process).
+
+    Returns
+    -------
+    RiskEstimate
+        VaR and CVaR as positive losses.
+    """
+    _check(confidence, distribution, dof)
+    if n_paths < 1 or chunk_size < 1 or workers < 1:
+        raise ValueError("n_paths, chunk_size and workers must be positive")
+    w, mu, cov = _moments(weights, mu, cov)
+    factor = cholesky_factor(cov * horizon)
+    mean = mu * horizon
+    keep = _tail_size(n_paths, confidence)
+
+    n_chunks = -(-n_paths // chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    sizes = [chunk_size] * (n_chunks - 1) + [n_paths - chunk_size * (n_chunks - 1)]
+    args = (w, mean, factor, distribution, dof, log_returns, keep)
+    workers = min(workers, n_chunks)
+    if workers == 1:
+        tail = _simulate_tail(seeds, sizes, *args)
+    else:
+        # Contiguous runs of chunks per worker; each chunk keeps its own stream.
+        bounds = np.linspace(0, n_chunks, workers + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_simulate_tail, seeds[lo:hi], sizes[lo:hi], *args)
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+            tail = _worst(np.concatenate([f.result() for f in futures]), keep)
+    return _tail_risk(tail, confidence, "monte_carlo")
+
+
+def portfolio_risk(
+    returns: Any,
+    weights: Any,
+    method: str = "historical",
+    confidence: float = 0.95,
+    estimator: str = "sample",
+    universe: Iterable[Hashable] | None = None,
+    window_end: Hashable | None = None,
+    cache: CovarianceCache | None = None,
+    **kwargs: Any,
+) -> RiskEstimate:
+    """VaR and CVaR of a portfolio from a history of asset returns.
+
+    Parameters
+    ----------
+    returns : array_like
+        Asset returns (n_periods, n_assets).
+    weights : array_like or Portfolio
+        Portfolio weights, e.g. from optimize_portfolio or portfolio.optimize.
+    method : str
+        "parametric", "historical" or "monte_carlo".
+    confidence : float
+        VaR confidence level.
+    estimator : str
+        Covariance estimator for the parametric and Monte Carlo methods
+        (see portfolio.covariance.ESTIMATORS).
+    universe, window_end, cache
+        Covariance cache key and cache, as in portfolio.estimate_covariance;
+        an optimization of the same window reuses the same matrix.
+    **kwargs : Any
+        Passed to parametric_var or monte_carlo_var (horizon, distribution,
+        n_paths, seed, workers, ...).
+
+    Returns
+    -------
+    RiskEstimate
+        VaR and CVaR as positive losses.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown risk method {method!r}; expected one of {METHODS}")
+    if method == "historical":
+        return historical_var(returns, weights, confidence, **kwargs)
+    mu, cov = estimate_moments(returns)
+    if estimator != "sample" or (universe is not None and window_end is not None):
+        cov = estimate_covariance(returns, estimator, universe, window_end, cache)
+    if method == "parametric":
+        return parametric_var(weights, mu, cov, confidence, **kwargs)
+    return monte_carlo_var(weights, mu, cov, confidence, **kwargs)
@@ -1,35 +1,59 @@
 """Fetch market news tool.
 
-Mock implementation for Phase 3. Returns sample news for a given
-symbol or topic. Later: integrate NewsAPI, Finnhub, or Alpha Vantage.
+Reads articles lazily from a NewsSource (the built-in mock feed by
+default, or e.g. a JSONLNewsSource for large local feeds) and renders
+them until an item/byte budget is reached, so memory stays flat however
+many articles a symbol has.
 """
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing, closing
+
 from quantgpt.agents.base import BaseTool
+from quantgpt.news import (
+    Article,
+    NewsSource,
+    aselect_within_budget,
+    mock_news_source,
+    render_article,
+    select_within_budget,
+)
 
 
-# Mock news data for Phase 3
-_MOCK_NEWS: dict[str, list[str]] = {
-    "aapl": [
-        "Apple Inc. reports strong Q4 earnings, beats analyst expectations.",
-        "iPhone 16 sales exceed projections in key markets.",
-        "Apple announces new AI features for upcoming devices.",
-    ],
-    "msft": [
-        "Microsoft Azure expands cloud services in Asia-Pacific.",
-        "Microsoft and OpenAI deepen partnership for AI development.",
-        "Windows 11 adoption continues to grow.",
-    ],
-    "market": [
-        "Fed signals potential rate cuts in 2025.",
-        "Global markets show mixed signals amid economic data.",
-        "Tech sector leads gains as broader market consolidates.",
-    ],
-}
+def _lookup_terms(symbol: str | None, topic: str | None, fallback: bool = True) -> list[str]:
+    """Terms to try in order: the key, then (with fallback) its first word and "market"."""
+    key = (symbol or topic or "market").strip().lower() or "market"
+    return list(dict.fromkeys([key, key.split()[0], "market"])) if fallback else [key]
 
 
 class FetchMarketNewsTool(BaseTool):
     """Fetches market news for a given symbol or topic."""
 
+    def __init__(
+        self,
+        source: NewsSource | None = None,
+        max_items: int | None = 50,
+        max_bytes: int | None = 64 * 1024,
+        include_body: bool = False,
+    ) -> None:
+        """Initialize tool.
+
+        Parameters
+        ----------
+        source : NewsSource | None
+            Where articles come from. Defaults to the built-in mock feed.
+        max_items : int | None
+            Maximum articles returned per call. None means unlimited.
+        max_bytes : int | None
+            Maximum UTF-8 bytes of rendered news per call. None means unlimited.
+        include_body : bool
+            Append article bodies to headlines.
+        """
+        self._source = source if source is not None else mock_news_source()
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._include_body = include_body
+
     @property
     def name(self) -> str:
         return "fetch_market_news"
@@ -38,6 +62,63 @@ class FetchMarketNewsTool(BaseTool):
     def description(self) -> str:
         return "Fetches market news for a stock symbol or topic. Use symbol or topic."
 
+    def iter_articles(self, symbol: str | None = None, topic: str | None = None) -> Iterator[Article]:
+        """Yield matching articles lazily, falling back to general market news.
+
+        Remote sources (NewsSource.remote) get only the key itself, since
+        every fallback lookup would be another metered request.
+
+        Parameters
+        ----------
+        symbol : str | None
+            Stock ticker symbol (e.g. AAPL, MSFT).
+        topic : str | None
+            News topic (e.g. market, economy).
+
+        Yields
+        ------
+        Article
+            Articles for the first lookup term that has any.
+        """
+        for term in _lookup_terms(symbol, topic, not self._source.remote):
+            found = False
+            with closing(self._source.iter_articles(term)) as articles:
+                for article in articles:
+                    found = True
+                    yield article
+            if found:
+                return
+
+    async def aiter_articles(self, symbol: str | None = None, topic: str | None = None) -> AsyncIterator[Article]:
+        """Async variant of iter_articles."""
+        for term in _lookup_terms(symbol, topic, not self._source.remote):
+            found = False
+            async with aclosing(self._source.aiter_articles(term)) as articles:
+                async for article in articles:
+                    found = True
+                    yield article
+            if found:
+                return
+
+    def fetch(self, symbol: str | None = None, topic: str | None = None) -> list[Article]:
+        """Matching articles within the item/byte budget, in source order (what execute renders)."""
+        return select_within_budget(
+            self.iter_articles(symbol, topic), self._max_items, self._max_bytes, self._include_body
+        )
+
+    async def afetch(self, symbol: str | None = None, topic: str | None = None) -> list[Article]:
+        """Async variant of fetch; blocking source reads run off the event loop."""
+        articles = self.aiter_articles(symbol, topic)
+        return await aselect_within_budget(articles, self._max_items, self._max_bytes, self._include_body)
+
+    def render_lines(self, articles: list[Article]) -> list[str]:
+        """One line of prompt text per article."""
+        return [render_article(article, self._include_body) for article in articles]
+
+    def render(self, articles: list[Article]) -> str:
+        """Articles as prompt text, one line each."""
+        return "\n".join(self.render_lines(articles))
+
     def execute(
         self,
         symbol: str | None = None,
@@ -58,18 +139,15 @@ class FetchMarketNewsTool(BaseTool):
         Returns
         -------
         str
-            News headlines/snippets as concatenated string.
+            News headlines/snippets as concatenated string, within the budget.
         """
-        key = (symbol or topic or "market").strip().lower()
-        if not key:
-            key = "market"
-
-        # Try exact match first, then fallback to first word of topic
-        if key in _MOCK_NEWS:
-            news_items = _MOCK_NEWS[key]
-        else:
-            # Use first word as symbol for generic lookup, or default
-            first_word = key.split()[0] if key else "market"
-            news_items = _MOCK_NEWS.get(first_word, _MOCK_NEWS["market"])
-
-        return "\n".join(news_items)
+        return self.render(self.fetch(symbol, topic))
+
+    async def aexecute(
+        self,
+        symbol: str | None = None,
+        topic: str | None = None,
+        **kwargs: object,
+    ) -> str:
+        """Async variant of execute; blocking source reads run off the event loop."""
+        return self.render(await self.afetch(symbol, topic))
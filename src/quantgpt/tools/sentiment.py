@@ -1,15 +1,33 @@
 """Sentiment analysis tool.
 
 Wraps quantgpt.nlp.analyze_sentiment for use in agent workflows.
+In per-item mode, each headline is scored separately (across worker
+processes for large feeds) and averaged.
 """
 
+from typing import Any
+
 from quantgpt.agents.base import BaseTool
-from quantgpt.nlp import analyze_sentiment
+from quantgpt.nlp import SentimentBackend, analyze_sentiment, analyze_sentiment_batch
 
 
 class SentimentTool(BaseTool):
     """Analyzes sentiment of text; returns score between -1 and 1."""
 
+    def __init__(self, workers: int | None = 1, backend: SentimentBackend = "vader") -> None:
+        """Initialize tool.
+
+        Parameters
+        ----------
+        workers : int | None
+            Worker processes for per-item scoring. 1 scores in-process;
+            None uses every core.
+        backend : {"vader", "fast"}
+            Scoring engine passed to quantgpt.nlp.
+        """
+        self._workers = workers
+        self._backend = backend
+
     @property
     def name(self) -> str:
         return "analyze_sentiment"
@@ -18,19 +36,36 @@ class SentimentTool(BaseTool):
     def description(self) -> str:
         return "Analyzes sentiment of text; returns score -1 to 1 (negative to positive)."
 
-    def execute(self, text: str, **kwargs: object) -> float:
+    def execute(
+        self,
+        text: str = "",
+        items: list[str] | None = None,
+        per_item: bool = False,
+        **kwargs: object,
+    ) -> float | dict[str, Any]:
         """Analyze sentiment of given text.
 
         Parameters
         ----------
         text : str
-            Input text to analyze.
+            Input text to analyze. In per-item mode, one item per line.
+        items : list[str] | None
+            Pre-split items (e.g. headlines); implies per-item mode.
+        per_item : bool
+            Score each item separately instead of the whole text.
         **kwargs : object
             Ignored for future extensibility.
 
         Returns
         -------
-        float
-            Sentiment score between -1 and 1.
+        float | dict[str, Any]
+            Sentiment score between -1 and 1; in per-item mode a dict with
+            "scores" (one per item) and "aggregate" (their mean).
         """
-        return analyze_sentiment(text)
+        if items is None and not per_item:
+            return analyze_sentiment(text, backend=self._backend)
+        if items is None:
+            items = [line for line in text.splitlines() if line.strip()]
+        scores = analyze_sentiment_batch(items, workers=self._workers, backend=self._backend)
+        aggregate = sum(scores) / len(scores) if scores else 0.0
+        return {"scores": scores.tolist(), "aggregate": aggregate}
@@ -74,3 +74,26 @@ class TestOpenAPI:
         response = client.get("/openapi.json")
         spec = response.json()
         assert "/api/v1/models" in spec["paths"]
+
+
+class TestSentimentCache:
+    """The process-wide sentiment memo is sized at startup, not by create_app()."""
+
+    def test_create_app_keeps_sentiment_cache(self) -> None:
+        from quantgpt.nlp import get_sentiment_cache
+
+        before = get_sentiment_cache()
+        create_app()
+        assert get_sentiment_cache() is before
+
+    def test_startup_configures_sentiment_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from quantgpt.nlp import configure_sentiment_cache, get_sentiment_cache
+
+        app = create_app()
+        monkeypatch.setattr(app.state.agent_registry, "get_research_agent", lambda *args: None)
+        before = get_sentiment_cache()
+        try:
+            with TestClient(app):
+                assert get_sentiment_cache() is not before
+        finally:
+            configure_sentiment_cache(max_entries=65_536, max_bytes=16 * 1024 * 1024)
@@ -0,0 +1,139 @@
+"""Tests for quantgpt.backtest."""
+
+import numpy as np
+import pytest
+
+from quantgpt.backtest import (
+    backtest,
+    equal_weight,
+    forecast_strategy,
+    long_only,
+    optimizer_strategy,
+    rebalance_schedule,
+    simulate,
+)
+
+
+def _prices(n_assets: int = 5, n_obs: int = 300, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.standard_normal((n_assets, n_obs)) * 0.01, axis=1))
+
+
+def _reference(prices: np.ndarray, targets: np.ndarray, rebalance: np.ndarray, cost: float, cap: float) -> np.ndarray:
+    """Per-bar loop: drift holdings in currency, trade at rebalance closes."""
+    n_assets, n_obs = prices.shape
+    units, cash = np.zeros(n_assets), 1.0
+    equity = np.ones(n_obs)
+    plan = dict(zip(rebalance.tolist(), targets))
+    for t in range(n_obs):
+        value = cash + units @ prices[:, t]
+        if t in plan:
+            current = units * prices[:, t] / value
+            trade = plan[t] - current
+            traded = np.abs(trade).sum()
+            if traded > cap:
+                trade *= cap / traded
+                traded = cap
+            value *= 1 - cost * traded
+            units = (current + trade) * value / prices[:, t]
+            cash = value - units @ prices[:, t]
+        equity[t] = value
+    return equity
+
+
+class TestSimulate:
+    def test_buy_and_hold_tracks_price(self) -> None:
+        prices = _prices(1)
+        result = simulate(prices, [[1.0]], [0])
+        np.testing.assert_allclose(result.equity[0], prices[0] / prices[0, 0])
+        assert result.metrics.total_return[0] == pytest.approx(prices[0, -1] / prices[0, 0] - 1)
+
+    def test_matches_per_bar_reference_with_costs_and_cap(self) -> None:
+        prices = _prices()
+        rebalance = rebalance_schedule(prices.shape[1], every=7, start=10)
+        targets = np.random.default_rng(1).dirichlet(np.ones(5), size=rebalance.size) * 0.9
+        result = simulate(prices, targets, rebalance, cost_bps=25, max_turnover=0.4)
+        expected = _reference(prices, targets, rebalance, 25e-4, 0.4)
+        np.testing.assert_allclose(result.equity[0], expected, rtol=1e-12)
+        assert result.turnover.max() <= 0.4 + 1e-12
+        np.testing.assert_allclose(result.costs, result.turnover * 25e-4)
+
+    def test_batch_equals_separate_runs(self) -> None:
+        prices = _prices()
+        rebalance = rebalance_schedule(prices.shape[1], every=21)
+        rng = np.random.default_rng(2)
+        targets = rng.dirichlet(np.ones(5), size=(3, rebalance.size))
+        costs, caps = [0, 10, 20], [0.5, 2.0, 1.0]
+        batch = simulate(prices, targets, rebalance, cost_bps=costs, max_turnover=caps)
+        for i in range(3):
+            single = simulate(prices, targets[i], rebalance, cost_bps=costs[i], max_turnover=caps[i])
+            np.testing.assert_allclose(batch.equity[i], single.equity[0])
+            assert batch.metrics.sharpe[i] == pytest.approx(single.metrics.sharpe[0])
+
+    def test_metrics(self) -> None:
+        prices = np.array([[100.0, 120.0, 90.0, 99.0, 130.0]])
+        m = simulate(prices, [[1.0]], [0], periods_per_year=4).metrics
+        assert m.max_drawdown[0] == pytest.approx(0.25)
+        assert m.cagr[0] == pytest.approx(0.3)
+        assert m.turnover[0] == pytest.approx(1.0)
+
+    def test_invalid_inputs(self) -> None:
+        prices = _prices()
+        with pytest.raises(ValueError, match="strictly increasing"):
+            simulate(prices, np.zeros((2, 5)), [5, 5])
+        with pytest.raises(ValueError, match="targets must have shape"):
+            simulate(prices, np.zeros((2, 4)), [0, 5])
+        with pytest.raises(ValueError, match="positive"):
+            simulate(-prices, np.zeros((1, 5)), [0])
+
+
+class TestStrategies:
+    def test_long_only(self) -> None:
+        scores = np.array([[3.0, 1.0, -1.0, 0.0], [-1.0, -2.0, -3.0, -4.0]])
+        np.testing.assert_allclose(long_only(scores), [[0.75, 0.25, 0, 0], [0, 0, 0, 0]])
+        np.testing.assert_allclose(long_only(scores, top=1), [[1, 0, 0, 0], [0, 0, 0, 0]])
+
+    def test_forecast_strategy_has_no_look_ahead(self) -> None:
+        prices = _prices(n_obs=200)
+        rebalance = rebalance_schedule(200, every=20, start=40)
+        targets = forecast_strategy(prices, rebalance, model="ewma", lookback=40, top=2, alpha=0.3)
+        assert targets.shape == (rebalance.size, 5)
+        np.testing.assert_allclose(targets.sum(axis=1)[targets.sum(axis=1) > 0], 1.0)
+        shocked = prices.copy()
+        shocked[:, 101:] *= 3.0
+        again = forecast_strategy(shocked, rebalance, model="ewma", lookback=40, top=2, alpha=0.3)
+        early = rebalance <= 100
+        np.testing.assert_array_equal(again[early], targets[early])
+        with pytest.raises(ValueError, match="lookback"):
+            forecast_strategy(prices, [10], lookback=40)
+
+    def test_optimizer_and_equal_weight(self) -> None:
+        prices = _prices(n_obs=260)
+        rebalance = rebalance_schedule(260, every=63, start=120)
+        targets = optimizer_strategy(prices, rebalance, objective="min_variance", lookback=120, upper=0.5)
+        np.testing.assert_allclose(targets.sum(axis=1), 1.0)
+        assert targets.max() <= 0.5 + 1e-9
+        np.testing.assert_allclose(equal_weight(prices, rebalance), 0.2)
+
+    def test_optimizer_strategy_reuses_window_covariance(self) -> None:
+        from quantgpt.portfolio import CovarianceCache
+
+        prices = _prices(n_obs=260)
+        rebalance = rebalance_schedule(260, every=63, start=120)
+        cache = CovarianceCache()
+        options = dict(lookback=120, universe="ABCDE", dates=range(260), estimator="ledoit_wolf", cache=cache)
+        cached = optimizer_strategy(prices, rebalance, upper=0.5, **options)
+        optimizer_strategy(prices, rebalance, upper=0.4, **options)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (len(rebalance), len(rebalance))
+        plain = optimizer_strategy(prices, rebalance, lookback=120, estimator="ledoit_wolf", upper=0.5)
+        np.testing.assert_allclose(cached, plain)
+
+    def test_backtest_grid_in_process_pool(self) -> None:
+        prices = _prices(n_obs=250)
+        rebalance = rebalance_schedule(250, every=10, start=30)
+        grid = [{"lookback": 30, "top": k} for k in (1, 2, 3)]
+        serial = backtest(prices, forecast_strategy, rebalance, grid=grid, cost_bps=5)
+        pooled = backtest(prices, forecast_strategy, rebalance, grid=grid, workers=2, cost_bps=5)
+        assert serial.equity.shape == (3, 250)
+        np.testing.assert_array_equal(serial.equity, pooled.equity)
@@ -0,0 +1,54 @@
+"""Tests for the benchmark harness (fake Ollama, stats, regression check)."""
+
+import asyncio
+
+from benchmarks.fake_ollama import create_fake_ollama_app
+from benchmarks.load import compare, percentile
+from benchmarks.server import BackgroundServer
+from quantgpt.agents import ResearchAgent
+
+
+def _report(rps: float, p95: float, errors: int = 0) -> dict:
+    return {"results": [{"endpoint": "health", "concurrency": 8, "rps": rps, "p95_ms": p95, "errors": errors}]}
+
+
+class TestStats:
+    """Tests for percentile and compare."""
+
+    def test_percentile_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_compare_within_tolerance_passes(self) -> None:
+        assert compare(_report(95, 10.5), _report(100, 10), tolerance=0.2) == []
+
+    def test_compare_flags_throughput_latency_and_errors(self) -> None:
+        regressions = compare(_report(50, 20, errors=3), _report(100, 10), tolerance=0.2)
+        assert len(regressions) == 3
+
+    def test_compare_skips_pairs_missing_from_baseline(self) -> None:
+        assert compare(_report(1, 1000), {"results": []}) == []
+
+
+class TestFakeOllama:
+    """ResearchAgent talks to the fake Ollama over real HTTP."""
+
+    def test_sync_async_and_streaming_paths(self) -> None:
+        app = create_fake_ollama_app(tokens=4)
+        with BackgroundServer(app) as server:
+            agent = ResearchAgent(ollama_base_url=server.url)
+            assert agent.run("AAPL") == "tok0 tok1 tok2 tok3 "
+
+            # One loop for both async calls: the pooled async client is loop-bound.
+            async def run_async() -> tuple[str, list[str]]:
+                insight = await agent.arun("MSFT")
+                tokens = [data["text"] async for kind, data in agent.astream("market") if kind == "token"]
+                return insight, tokens
+
+            insight, tokens = asyncio.run(run_async())
+            assert insight == "tok0 tok1 tok2 tok3 "
+            assert len(tokens) == 4
+        assert app.state.chat_requests == 3
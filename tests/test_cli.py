@@ -0,0 +1,96 @@
+"""Tests for the quantgpt CLI and its streaming batch jobs."""
+
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+
+from quantgpt import batch, cli
+from quantgpt.forecasting import forecast
+from quantgpt.nlp import analyze_sentiment, analyze_sentiment_batch
+
+TEXTS = ["Strong profit growth and record gains.", "Terrible loss and awful decline.", "The report is out."]
+
+
+def _write_jsonl(path, records) -> str:
+    path.write_text("".join(r if isinstance(r, str) else json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return str(path)
+
+
+def test_sentiment_jsonl_keeps_order_and_reports_bad_records(tmp_path, capsys) -> None:
+    records = [{"id": i, "text": TEXTS[i % 3]} for i in range(50)]
+    records[7] = "not json\n"
+    records[11] = {"id": 11}
+    path = _write_jsonl(tmp_path / "in.jsonl", records)
+
+    code = cli.main(["sentiment", path, "--workers", "2", "--chunk-size", "4", "--max-in-flight", "2"])
+    out, err = capsys.readouterr()
+
+    assert code == 0 and "done sentiment: 50 records" in err and "2 errors" in err
+    rows = [json.loads(line) for line in out.splitlines()]
+    assert len(rows) == 50
+    assert "invalid JSON" in rows[7]["error"] and "KeyError" in rows[11]["error"]
+    good = [i for i in range(50) if i not in (7, 11)]
+    expected = analyze_sentiment_batch([TEXTS[i % 3] for i in good], workers=1)
+    assert [rows[i]["id"] for i in good] == good
+    assert [rows[i]["sentiment"] for i in good] == list(expected)
+    assert rows[0]["sentiment"] == analyze_sentiment(TEXTS[0])  # same default engine as --sentiment
+
+
+def test_forecast_csv_matches_engine(tmp_path, capsys) -> None:
+    rng = np.random.default_rng(0)
+    series = [list(100 + rng.random(n)) for n in (20, 30, 20, 25)]
+    path = tmp_path / "in.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["symbol", "prices"])
+        writer.writerows([f"S{i}", " ".join(map(str, s))] for i, s in enumerate(series))
+        writer.writerow(["BAD", "1 two 3"])
+
+    code = cli.main(["forecast", str(path), "--format", "csv", "--model", "drift", "--steps", "2", "--quiet"])
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+
+    assert code == 0 and [r["symbol"] for r in rows] == ["S0", "S1", "S2", "S3", "BAD"]
+    for row, s in zip(rows, series):
+        expected = forecast(np.array([s]), steps=2, model="drift").mean[0]
+        np.testing.assert_allclose([float(v) for v in row["forecast"].split()], expected)
+    assert rows[-1]["error"].startswith("ValueError") and rows[-1]["forecast"] == ""
+
+
+def test_forecast_group_isolates_bad_series() -> None:
+    job = batch.ForecastJob(steps=1, model="naive")
+    lines = [json.dumps({"prices": p}) + "\n" for p in ([1, 2, 3], [1, "nan", 3], [4, 5, 6])]
+    outputs, errors = job(lines)
+    rows = [json.loads(line) for line in outputs]
+    assert errors == 1 and "error" in rows[1]
+    assert rows[0]["forecast"] == [3.0] and rows[2]["forecast"] == [6.0]
+
+
+def test_bad_options_exit_nonzero(tmp_path, capsys) -> None:
+    path = _write_jsonl(tmp_path / "in.jsonl", [{"prices": [1, 2]}])
+    assert cli.main(["forecast", path, "--model", "nope", "--quiet"]) == 1
+    assert cli.main(["forecast", str(tmp_path / "missing.jsonl"), "--quiet"]) == 1
+    assert "quantgpt forecast:" in capsys.readouterr().err
+    for workers in ("1", "2"):
+        assert cli.main(["forecast", path, "--params", '{"bogus": 1}', "--workers", workers, "--quiet"]) == 1
+        assert "bogus" in capsys.readouterr().err
+    assert cli.main(["forecast", path, "--model", "ar", "--params", '{"p": "x"}', "--workers", "2", "--quiet"]) == 1
+    assert "quantgpt forecast:" in capsys.readouterr().err
+    for params in ("[1]", "{"):
+        with pytest.raises(SystemExit):
+            cli.main(["forecast", path, "--params", params, "--quiet"])
+    assert "--params" in capsys.readouterr().err
+
+
+def test_batch_job_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        batch.BatchJob("text")
+
+
+def test_legacy_flags(capsys) -> None:
+    assert cli.main(["--sentiment", "Strong profit growth"]) == 0
+    assert capsys.readouterr().out.startswith("Sentiment score:")
+    with pytest.raises(SystemExit):
+        cli.main(["sentiment", "--format", "xml"])
@@ -0,0 +1,111 @@
+"""Tests for quantgpt.agents.compaction and its use in ResearchAgent."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from quantgpt.agentops.metrics import PROMPT_TOKENS_SAVED
+from quantgpt.agents import ResearchAgent
+from quantgpt.agents.compaction import (
+    NewsItem,
+    compact_news,
+    dedupe,
+    estimate_tokens,
+    minhash_signatures,
+    rank_news,
+)
+from quantgpt.news import Article, InMemoryNewsSource
+
+HEADLINES = [
+    "Apple Inc. reports strong Q4 earnings, beats analyst expectations.",
+    "APPLE INC REPORTS STRONG Q4 EARNINGS - BEATS ANALYST EXPECTATIONS",
+    "iPhone 16 sales exceed projections in key markets.",
+    "Fed signals potential rate cuts in 2025.",
+]
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Fed cuts rates.") == 4
+    assert estimate_tokens("extraordinarily") == 3
+    assert estimate_tokens("Revenue rose 12,500%") == 7
+
+
+def test_minhash_estimates_similarity() -> None:
+    signatures = minhash_signatures(HEADLINES, num_perm=128)
+    assert signatures.shape == (4, 128)
+    assert (signatures[0] == signatures[1]).all()  # same text after normalization
+    assert (signatures[0] == signatures[3]).mean() < 0.2
+    assert (minhash_signatures(HEADLINES[:1], num_perm=128) == signatures[:1]).all()
+
+
+def test_dedupe_keeps_first_of_each_story() -> None:
+    texts = [HEADLINES[1], *HEADLINES, "Apple Inc reports strong Q4 earnings, beats analyst expectation"]
+    assert dedupe(texts) == [0, 3, 4]
+    assert dedupe([]) == []
+    with pytest.raises(ValueError):
+        dedupe(texts, threshold=0)
+
+
+def test_rank_by_recency_and_sentiment() -> None:
+    day = 86400.0
+    items = [NewsItem("old calm", 0.0, 0.0), NewsItem("new calm", 2 * day, 0.0), NewsItem("old crash", day, -0.9)]
+    assert [item.text for item in rank_news(items)] == ["old crash", "new calm", "old calm"]
+
+
+def test_compact_news_fits_budget_and_reports_savings() -> None:
+    items = [NewsItem(text, 100.0 - i) for i, text in enumerate(HEADLINES)]
+    result = compact_news(items, token_budget=25)
+    assert result.lines == [HEADLINES[0]]
+    stats = result.stats
+    assert (stats.items_in, stats.items_out, stats.duplicates) == (4, 1, 1)
+    assert stats.tokens_out <= 25 and stats.tokens_saved == stats.tokens_in - stats.tokens_out > 0
+    assert compact_news(items, token_budget=None).lines == [HEADLINES[0], HEADLINES[2], HEADLINES[3]]
+
+
+def test_agent_prompt_is_compacted() -> None:
+    start = datetime(2025, 1, 2, tzinfo=timezone.utc)
+    copies = [f"Apple reports strong Q4 earnings, beats expectations (wire {i})" for i in range(30)]
+    articles = [Article(start + timedelta(minutes=i), text, symbols=("AAPL",)) for i, text in enumerate(copies)]
+    articles.append(Article(start, "Apple recalls iPhone chargers after fire risk", symbols=("AAPL",)))
+    source = InMemoryNewsSource(articles)
+    saved_before = PROMPT_TOKENS_SAVED.value(agent="research_agent")
+
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content="ok")]))
+    final = ResearchAgent(llm=llm, news_source=source)._graph.invoke({"query": "AAPL"})
+    stats = final["compaction"]
+    assert stats.items_in == 31 and stats.items_out == 2 and stats.duplicates == 29
+    assert PROMPT_TOKENS_SAVED.value(agent="research_agent") - saved_before == stats.tokens_saved > 0
+
+    plain = ResearchAgent(
+        llm=GenericFakeChatModel(messages=iter([AIMessage(content="ok")])), news_source=source, news_token_budget=None
+    )
+    final = plain._graph.invoke({"query": "AAPL"})
+    assert "compaction" not in final and final["insight"] == "ok"
+
+
+def test_async_summarize_compacts_off_the_event_loop() -> None:
+    start = datetime(2025, 1, 2, tzinfo=timezone.utc)
+    articles = [Article(start + timedelta(minutes=i), text, symbols=("AAPL",)) for i, text in enumerate(HEADLINES)]
+    agent = ResearchAgent(
+        llm=GenericFakeChatModel(messages=iter([AIMessage(content="ok")])), news_source=InMemoryNewsSource(articles)
+    )
+    threads = []
+    prepare = agent._prepare_prompt
+
+    def recording(state):
+        threads.append(threading.get_ident())
+        return prepare(state)
+
+    agent._prepare_prompt = recording
+
+    async def main():
+        return threading.get_ident(), await agent._graph.ainvoke({"query": "AAPL"})
+
+    loop_thread, final = asyncio.run(main())
+    assert threads and threads[0] != loop_thread
+    assert final["compaction"].duplicates == 1 and final["insight"] == "ok"
@@ -0,0 +1,151 @@
+"""Tests for quantgpt.forecasting."""
+
+import numpy as np
+import pytest
+
+from quantgpt.forecasting import MODELS, PriceForecaster, forecast
+from quantgpt.forecasting.engine import fit_ar
+from quantgpt.forecasting.online import OnlineAR, OnlineEWMA, OnlineHolt, load_state
+
+
+def _random_walks(n: int, t: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.standard_normal((n, t)), axis=1)
+
+
+class TestEngine:
+    """Tests for the vectorized engine."""
+
+    @pytest.mark.parametrize("model", sorted(MODELS))
+    def test_shapes_and_interval_ordering(self, model: str) -> None:
+        panel = _random_walks(20, 60)
+        result = forecast(panel, steps=7, model=model)
+        for part in result:
+            assert part.shape == (20, 7)
+        assert (result.lower <= result.mean).all() and (result.mean <= result.upper).all()
+        widths = result.upper - result.lower
+        assert (np.diff(widths, axis=1) >= -1e-9).all()
+
+    @pytest.mark.parametrize("model", sorted(MODELS))
+    def test_panel_matches_per_series_calls(self, model: str) -> None:
+        panel = _random_walks(5, 40, seed=1)
+        batched = forecast(panel, steps=3, model=model)
+        for i, row in enumerate(panel):
+            single = forecast(row, steps=3, model=model)
+            np.testing.assert_allclose(single.mean[0], batched.mean[i])
+            np.testing.assert_allclose(single.upper[0], batched.upper[i])
+
+    @pytest.mark.parametrize("model", sorted(MODELS))
+    def test_intervals_cover_next_value(self, model: str) -> None:
+        panel = _random_walks(4000, 201, seed=2)
+        result = forecast(panel[:, :-1], model=model, level=0.9)
+        actual = panel[:, -1]
+        coverage = ((actual >= result.lower[:, 0]) & (actual <= result.upper[:, 0])).mean()
+        assert 0.86 < coverage < 0.94
+
+    def test_drift_extends_line(self) -> None:
+        result = forecast([[1.0, 2.0, 3.0, 4.0]], steps=2, model="drift")
+        np.testing.assert_allclose(result.mean, [[5.0, 6.0]])
+
+    def test_ar_recovers_coefficients(self) -> None:
+        rng = np.random.default_rng(3)
+        x = np.zeros((30, 3000))
+        noise = rng.standard_normal(x.shape)
+        for t in range(2, x.shape[1]):
+            x[:, t] = 0.2 + 0.5 * x[:, t - 1] - 0.3 * x[:, t - 2] + noise[:, t]
+        coef, sigma2 = fit_ar(x, 2)
+        np.testing.assert_allclose(coef.mean(axis=0), [0.2, 0.5, -0.3], atol=0.02)
+        assert abs(sigma2.mean() - 1.0) < 0.05
+
+    def test_holt_winters_tracks_seasonal_trend(self) -> None:
+        t = np.arange(80)
+        series = 50 + 0.5 * t + np.tile([3.0, -1.0, -2.0, 0.0], 20)
+        result = forecast(series, steps=4, model="holt_winters", period=4, alpha=0.5, beta=0.3, gamma=0.3)
+        future = 50 + 0.5 * np.arange(80, 84) + np.array([3.0, -1.0, -2.0, 0.0])
+        np.testing.assert_allclose(result.mean[0], future, atol=0.5)
+
+    def test_invalid_input(self) -> None:
+        with pytest.raises(ValueError, match="Unknown forecasting model"):
+            forecast([1.0, 2.0], model="prophet")
+        with pytest.raises(ValueError, match="NaN"):
+            forecast([1.0, float("nan")])
+        with pytest.raises(ValueError, match="observations"):
+            forecast([1.0, 2.0], model="ar", p=2)
+
+
+class TestPriceForecaster:
+    """Tests for the single-series facade."""
+
+    def test_naive_default(self) -> None:
+        assert PriceForecaster([1.0, 2.0, 3.0]).forecast(2) == [3.0, 3.0]
+
+    def test_empty_prices_raise(self) -> None:
+        with pytest.raises(ValueError, match="No price data"):
+            PriceForecaster([]).forecast()
+
+    def test_model_and_interval(self) -> None:
+        model = PriceForecaster([1.0, 2.0, 3.0, 4.0], model="drift")
+        assert model.forecast(1) == [5.0]
+        lower, upper = model.forecast_interval(2)
+        assert lower[0] <= 5.0 <= upper[0] and len(upper) == 2
+
+
+class TestOnlineForecasters:
+    """Tests for incremental forecaster state."""
+
+    CASES = [
+        (OnlineEWMA, {"alpha": 0.4}, "ewma", {"alpha": 0.4}),
+        (OnlineHolt, {"alpha": 0.3, "beta": 0.2}, "holt_winters", {"alpha": 0.3, "beta": 0.2}),
+        (OnlineAR, {"p": 2}, "ar", {"p": 2}),
+        (OnlineAR, {"p": 1, "difference": False}, "ar", {"p": 1, "difference": False}),
+    ]
+
+    @pytest.mark.parametrize(("cls", "params", "model", "engine_params"), CASES)
+    def test_matches_batch_engine(self, cls, params, model, engine_params) -> None:
+        panel = _random_walks(6, 80, seed=4)
+        state = cls(n_series=6, **params).update_many(panel[:, :50])
+        for t in range(50, 80):
+            state.update(panel[:, t])
+        online = state.forecast(steps=5, level=0.9)
+        batch = forecast(panel, steps=5, model=model, level=0.9, **engine_params)
+        for got, want in zip(online, batch):
+            np.testing.assert_allclose(got, want, rtol=1e-6)
+
+    @pytest.mark.parametrize(("cls", "params", "model", "engine_params"), CASES)
+    def test_bytes_round_trip(self, cls, params, model, engine_params) -> None:
+        panel = _random_walks(3, 40, seed=5)
+        state = cls(n_series=3, **params).update_many(panel[:, :30])
+        restored = load_state(state.to_bytes())
+        assert type(restored) is cls and restored.count == 30
+        for t in range(30, 40):
+            state.update(panel[:, t])
+            restored.update(panel[:, t])
+        np.testing.assert_array_equal(restored.forecast(3).mean, state.forecast(3).mean)
+        assert cls.from_bytes(state.to_bytes()).count == 40
+
+    def test_state_size_is_independent_of_history(self) -> None:
+        state = OnlineAR(p=3, n_series=10)
+        state.update_many(_random_walks(10, 50))
+        size = len(state.to_bytes())
+        state.update_many(_random_walks(10, 5000))
+        assert len(state.to_bytes()) <= size + 8  # only the count's digits grow
+        assert not hasattr(state, "__dict__")
+
+    def test_single_series_scalars(self) -> None:
+        state = OnlineEWMA(alpha=0.5)
+        for price in [10.0, 12.0, 13.0]:
+            state.update(price)
+        assert state.forecast(2).mean.tolist() == [[12.0, 12.0]]
+
+    def test_errors(self) -> None:
+        with pytest.raises(ValueError, match="at least"):
+            OnlineHolt().forecast()
+        with pytest.raises(ValueError, match="observations"):
+            OnlineEWMA(n_series=2).update([1.0, 2.0, 3.0])
+        with pytest.raises(ValueError, match="not 'ewma'"):
+            OnlineEWMA.from_bytes(OnlineHolt().update(1.0).to_bytes())
+        with pytest.raises(ValueError, match="Not a serialized"):
+            load_state(b"garbage")
+        for alpha, beta in ((1.5, 0.1), (0.3, -0.1)):
+            with pytest.raises(ValueError, match="alpha and beta"):
+                OnlineHolt(alpha=alpha, beta=beta)
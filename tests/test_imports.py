@@ -18,3 +18,37 @@ def test_imports() -> None:
     assert hasattr(quantgpt, "agents")
     assert hasattr(quantgpt, "tools")
     assert hasattr(quantgpt, "api")
+
+
+def _fresh_modules_after(module: str) -> set[str]:
+    """Import module in a fresh interpreter and return its sys.modules keys."""
+    import json
+    import subprocess
+    import sys
+
+    code = f"import json, sys\nimport {module}\nprint(json.dumps(list(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(json.loads(proc.stdout))
+
+
+def test_cli_import_is_lazy() -> None:
+    loaded = _fresh_modules_after("quantgpt.cli")
+    assert not loaded & {"langgraph", "langchain_ollama", "vaderSentiment", "quantgpt.nlp.sentiment"}
+
+
+def test_tools_import_does_not_load_agent_frameworks() -> None:
+    loaded = _fresh_modules_after("quantgpt.tools")
+    assert not loaded & {"langgraph", "langchain_ollama", "vaderSentiment"}
+
+
+def test_api_import_defers_langgraph() -> None:
+    loaded = _fresh_modules_after("quantgpt.api.main")
+    assert not loaded & {"langgraph", "langchain_ollama", "vaderSentiment"}
+
+
+def test_lazy_agent_exports_resolve() -> None:
+    from quantgpt.agents import AgentRegistry, MathAgent, ResearchAgent
+
+    assert AgentRegistry.__name__ == "AgentRegistry"
+    assert MathAgent.__name__ == "MathAgent"
+    assert ResearchAgent.__name__ == "ResearchAgent"
@@ -0,0 +1,145 @@
+"""Tests for the LLM completion cache."""
+
+import asyncio
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from quantgpt.agents import ResearchAgent
+from quantgpt.agents.llm_cache import (
+    LRUCompletionCache,
+    SQLiteCompletionCache,
+    TieredCompletionCache,
+    build_completion_cache,
+    make_cache_key,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_depends_on_model_url_and_prompt(self) -> None:
+        base = make_cache_key("llama3.2", "http://a", "prompt")
+        assert base == make_cache_key("llama3.2", "http://a", "prompt")
+        assert base != make_cache_key("mistral", "http://a", "prompt")
+        assert base != make_cache_key("llama3.2", "http://b", "prompt")
+        assert base != make_cache_key("llama3.2", "http://a", "other")
+
+
+class TestLRUCompletionCache:
+    """Tests for LRUCompletionCache."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        cache = LRUCompletionCache(max_entries=2)
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LRUCompletionCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self) -> None:
+        clock = FakeClock()
+        cache = LRUCompletionCache(max_entries=10, ttl_seconds=5, clock=clock)
+        cache.set("k", "v")
+        clock.now = 4
+        assert cache.get("k") == "v"
+        clock.now = 6
+        assert cache.get("k") is None
+
+
+class TestSQLiteCompletionCache:
+    """Tests for SQLiteCompletionCache."""
+
+    def test_survives_reopen(self, tmp_path) -> None:
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteCompletionCache(path)
+        cache.set("k", "v")
+        cache.close()
+        reopened = SQLiteCompletionCache(path)
+        assert reopened.get("k") == "v"
+        reopened.close()
+
+    def test_evicts_beyond_max_entries(self, tmp_path) -> None:
+        clock = FakeClock()
+        cache = SQLiteCompletionCache(str(tmp_path / "cache.db"), max_entries=2, clock=clock)
+        for i, key in enumerate(["a", "b", "c"]):
+            clock.now = float(i)
+            cache.set(key, key)
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        cache.close()
+
+    def test_ttl_expiry(self, tmp_path) -> None:
+        clock = FakeClock()
+        cache = SQLiteCompletionCache(str(tmp_path / "cache.db"), ttl_seconds=5, clock=clock)
+        cache.set("k", "v")
+        clock.now = 6
+        assert cache.get("k") is None
+        cache.close()
+
+
+class TestTieredCompletionCache:
+    """Tests for TieredCompletionCache."""
+
+    def test_disk_hit_is_promoted_to_memory(self, tmp_path) -> None:
+        disk = SQLiteCompletionCache(str(tmp_path / "cache.db"))
+        disk.set("k", "v")
+        cache = TieredCompletionCache(LRUCompletionCache(), disk)
+        assert cache.get("k") == "v"
+        assert cache.memory.get("k") == "v"
+        assert cache.stats.hits == 1
+        cache.close()
+
+    def test_promoted_entry_keeps_its_age(self, tmp_path) -> None:
+        wall, mono = FakeClock(), FakeClock()
+        disk = SQLiteCompletionCache(str(tmp_path / "cache.db"), ttl_seconds=5, clock=wall)
+        disk.set("k", "v")
+        wall.now = 4
+        cache = TieredCompletionCache(LRUCompletionCache(ttl_seconds=5, clock=mono), disk)
+        assert cache.get("k") == "v"
+        mono.now = 2  # 6 seconds after creation
+        assert cache.memory.get("k") is None
+        cache.close()
+
+    def test_build_disabled_when_zero_entries(self) -> None:
+        assert build_completion_cache(max_entries=0) is None
+
+    def test_build_tiered_with_path(self, tmp_path) -> None:
+        cache = build_completion_cache(max_entries=8, path=str(tmp_path / "cache.db"), disk_max_entries=3)
+        assert isinstance(cache, TieredCompletionCache) and cache.disk._max_entries == 3
+        cache.close()
+
+
+class TestResearchAgentCaching:
+    """ResearchAgent consults the cache before calling the LLM."""
+
+    def test_repeat_query_skips_llm(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Only once")]))
+        cache = LRUCompletionCache()
+        agent = ResearchAgent(llm=llm, cache=cache)
+        assert agent.run("AAPL") == "Only once"
+        # The fake model has no second message; a second LLM call would fail.
+        assert agent.run("AAPL") == "Only once"
+        assert asyncio.run(agent.arun("AAPL")) == "Only once"
+        assert cache.stats.hits == 2
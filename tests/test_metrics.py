@@ -0,0 +1,111 @@
+"""Tests for in-process metrics and GET /metrics."""
+
+import pytest
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from quantgpt.agentops.metrics import (
+    NODE_LATENCY,
+    TOOL_ERRORS,
+    TOOL_LATENCY,
+    MetricsRegistry,
+    track,
+)
+from quantgpt.agents import MathAgent, ResearchAgent
+from quantgpt.api.main import create_app
+
+
+class TestMetricsRegistry:
+    """Tests for counters, gauges, histograms and text rendering."""
+
+    def test_counter_renders_with_labels(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs.", ["kind"])
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a"} 3.0' in text
+
+    def test_counter_rejects_negative(self) -> None:
+        counter = MetricsRegistry().counter("c_total", "C.")
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+    def test_wrong_labels_raise(self) -> None:
+        counter = MetricsRegistry().counter("c_total", "C.", ["a"])
+        with pytest.raises(ValueError):
+            counter.inc(b="x")
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        registry = MetricsRegistry()
+        hist = registry.histogram("lat_seconds", "Latency.", buckets=(0.1, 1.0))
+        hist.observe(0.05)
+        hist.observe(0.5)
+        hist.observe(5.0)
+        text = registry.render()
+        assert 'lat_seconds_bucket{le="0.1"} 1' in text
+        assert 'lat_seconds_bucket{le="1.0"} 2' in text
+        assert 'lat_seconds_bucket{le="+Inf"} 3' in text
+        assert "lat_seconds_count 3" in text
+        assert "lat_seconds_sum 5.55" in text
+
+    def test_label_values_are_escaped(self) -> None:
+        registry = MetricsRegistry()
+        registry.gauge("g", "G.", ["q"]).set(1, q='say "hi"\n')
+        assert 'g{q="say \\"hi\\"\\n"} 1.0' in registry.render()
+
+    def test_track_counts_errors_and_restores_gauge(self) -> None:
+        registry = MetricsRegistry()
+        hist = registry.histogram("op_seconds", "Op.", ["op"])
+        gauge = registry.gauge("op_in_progress", "Op.", ["op"])
+        errors = registry.counter("op_errors_total", "Op.", ["op"])
+        with pytest.raises(RuntimeError):
+            with track(hist, gauge, errors, op="x"):
+                assert gauge.value(op="x") == 1
+                raise RuntimeError("boom")
+        assert gauge.value(op="x") == 0
+        assert errors.value(op="x") == 1
+        assert hist.count(op="x") == 1
+
+
+class TestAgentInstrumentation:
+    """Agents record node and tool metrics."""
+
+    def test_call_tool_records_latency_and_errors(self) -> None:
+        agent = MathAgent()
+        before = TOOL_LATENCY.count(agent="math_agent", tool="calculator")
+        errors_before = TOOL_ERRORS.value(agent="math_agent", tool="calculator")
+        agent.run("add 1 2")
+        with pytest.raises(ValueError):
+            agent.run("divide 1 0")
+        assert TOOL_LATENCY.count(agent="math_agent", tool="calculator") == before + 2
+        assert TOOL_ERRORS.value(agent="math_agent", tool="calculator") == errors_before + 1
+
+    def test_research_nodes_record_latency(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="ok")]))
+        before = NODE_LATENCY.count(agent="research_agent", node="llm_summarize")
+        ResearchAgent(llm=llm).run("market")
+        assert NODE_LATENCY.count(agent="research_agent", node="llm_summarize") == before + 1
+        assert NODE_LATENCY.count(agent="research_agent", node="fetch_news") >= 1
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_metrics_exposes_route_metrics(self) -> None:
+        client = TestClient(create_app())
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_requests_total{method="GET",route="/health",status="200"}' in response.text
+        assert 'http_request_duration_seconds_count{method="GET",route="/health"}' in response.text
+
+    def test_unmatched_paths_share_one_label(self) -> None:
+        client = TestClient(create_app())
+        client.get("/no/such/path")
+        text = client.get("/metrics").text
+        assert 'route="unmatched",status="404"' in text
+        assert "/no/such/path" not in text
@@ -0,0 +1,331 @@
+"""Tests for quantgpt.news sources and budgets."""
+
+import asyncio
+import bz2
+import gzip
+import json
+import lzma
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from quantgpt.news import (
+    Article,
+    InMemoryNewsSource,
+    JSONLNewsSource,
+    NewsIndex,
+    NewsSource,
+    build_news_index,
+    mock_news_source,
+    take_within_budget,
+)
+from quantgpt.news.index import extract_symbols
+from quantgpt.tools import FetchMarketNewsTool
+
+TS = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def _records(n: int) -> list[dict]:
+    return [
+        {
+            "timestamp": 1735776000 + i,
+            "symbols": ["AAPL" if i % 2 else "MSFT"],
+            "headline": f"Headline {i}",
+            "body": f"Body {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _write(path: Path, records: list[dict], opener=open) -> Path:
+    with opener(path, "wt", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+class CountingSource(NewsSource):
+    """Endless source that counts how many articles were pulled."""
+
+    def __init__(self) -> None:
+        self.pulled = 0
+
+    def iter_articles(self, term: str | None = None) -> Iterator[Article]:
+        while True:
+            self.pulled += 1
+            yield Article(TS, f"AAPL story {self.pulled}", symbols=("AAPL",))
+
+
+class TestJSONLNewsSource:
+    """Tests for JSONLNewsSource."""
+
+    @pytest.mark.parametrize(
+        ("suffix", "opener"),
+        [(".jsonl", open), (".jsonl.gz", gzip.open), (".jsonl.bz2", bz2.open), (".jsonl.xz", lzma.open)],
+    )
+    def test_streams_plain_and_compressed(self, tmp_path: Path, suffix: str, opener) -> None:
+        path = _write(tmp_path / f"news{suffix}", _records(10), opener)
+        articles = list(JSONLNewsSource(path).iter_articles("aapl"))
+        assert [a.headline for a in articles] == [f"Headline {i}" for i in range(1, 10, 2)]
+        assert articles[0].symbols == ("AAPL",)
+        assert articles[0].timestamp == datetime.fromtimestamp(1735776001, tz=timezone.utc)
+
+    def test_all_articles_when_no_term(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "news.jsonl", _records(4))
+        assert len(list(JSONLNewsSource(path).iter_articles())) == 4
+
+    def test_aliases_iso_timestamps_and_invalid_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "news.jsonl"
+        path.write_text(
+            '{"timestamp": "2025-01-02T00:00:00Z", "symbol": "tsla", "title": "T", "summary": "S"}\n'
+            "not json\n"
+            '{"symbols": ["TSLA"], "headline": "no timestamp"}\n'
+            "\n"
+        )
+        source = JSONLNewsSource(path)
+        articles = list(source.iter_articles("TSLA"))
+        assert [(a.headline, a.body, a.timestamp) for a in articles] == [("T", "S", TS)]
+        assert source.invalid_lines == 1  # "not json" never mentions tsla; it is skipped unparsed
+        with pytest.raises(ValueError, match="invalid news record"):
+            list(JSONLNewsSource(path, skip_invalid=False).iter_articles())
+
+    def test_async_iteration(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "news.jsonl.gz", _records(200), gzip.open)
+
+        async def collect() -> list[Article]:
+            return [a async for a in JSONLNewsSource(path).aiter_articles("MSFT")]
+
+        assert len(asyncio.run(collect())) == 100
+
+
+class TestBudget:
+    """Item and byte budgets stop consumption early."""
+
+    def test_item_budget_pulls_only_what_it_needs(self) -> None:
+        source = CountingSource()
+        lines = take_within_budget(source.iter_articles(), max_items=3)
+        assert len(lines) == 3
+        assert source.pulled == 4  # one look-ahead article is rejected
+
+    def test_byte_budget(self) -> None:
+        articles = [Article(TS, "x" * 10) for _ in range(5)]
+        assert len(take_within_budget(articles, max_bytes=31)) == 2  # a third line would need 32 bytes
+        assert take_within_budget(articles, max_bytes=5) == []
+
+
+class TestFetchMarketNewsToolSources:
+    """FetchMarketNewsTool over pluggable sources."""
+
+    def test_mock_source_matches_legacy_lookup(self) -> None:
+        tool = FetchMarketNewsTool(source=mock_news_source())
+        assert tool.execute(symbol="AAPL").startswith("Apple Inc.")
+        assert tool.execute(topic="msft outlook").startswith("Microsoft Azure")
+        assert tool.execute(symbol="XYZ123") == tool.execute(topic="market")
+
+    def test_budgeted_streaming_from_endless_source(self) -> None:
+        source = CountingSource()
+        tool = FetchMarketNewsTool(source=source, max_items=5)
+        assert len(tool.execute(symbol="AAPL").splitlines()) == 5
+        assert source.pulled == 6
+
+    def test_aexecute_with_body_and_byte_budget(self) -> None:
+        articles = [Article(TS, f"H{i}", body="B", symbols=("AAPL",)) for i in range(10)]
+        # "H0 — B" is 8 UTF-8 bytes; two lines plus a newline fill 17.
+        tool = FetchMarketNewsTool(source=InMemoryNewsSource(articles), max_bytes=17, include_body=True)
+        assert asyncio.run(tool.aexecute(symbol="aapl")) == "H0 — B\nH1 — B"
+
+
+def _dated(hours: int, headline: str, symbols: tuple[str, ...] = ()) -> Article:
+    return Article(datetime.fromtimestamp(1735776000 + hours * 3600, tz=timezone.utc), headline, symbols=symbols)
+
+
+class TestNewsIndex:
+    """Tests for the inverted news index."""
+
+    def test_free_form_query_resolves_every_symbol(self) -> None:
+        index = NewsIndex.from_articles(mock_news_source().iter_articles())
+        assert index.resolve_symbols("what's going on with Apple and $msft on Monday?") == ["AAPL", "MSFT"]
+        for query in ("aapl vs MSFT", "goldman sachs and Microsoft"):
+            assert index.resolve_symbols(query) == extract_symbols(query, is_symbol=lambda s: s in {"AAPL", "MSFT"})
+        headlines = [a.headline for a in index.iter_articles("what's going on with Apple and Microsoft")]
+        assert len(headlines) == 6
+        assert "Fed signals potential rate cuts in 2025." not in headlines
+
+    def test_ranks_by_overlap_then_recency(self) -> None:
+        index = NewsIndex.from_articles(
+            [
+                _dated(0, "Nvidia earnings beat", ("NVDA",)),
+                _dated(5, "Chip demand rises", ("NVDA",)),
+                _dated(9, "Earnings season opens"),
+            ]
+        )
+        hits = [index.article(doc).headline for doc, _ in index.search("NVDA earnings")]
+        assert hits == ["Nvidia earnings beat", "Chip demand rises", "Earnings season opens"]
+
+    def test_probing_long_posting_lists_keeps_best_hits(self) -> None:
+        articles = [_dated(i, f"Markets update {i}", ("SPY",) if i % 3 == 0 else ()) for i in range(50)]
+        full = NewsIndex.from_articles(articles)
+        probed = NewsIndex.from_articles(articles, max_postings_per_term=4)
+        assert probed.search("SPY markets", limit=5) == full.search("SPY markets", limit=5)
+
+    def test_round_trip_through_memory_mapped_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "news.idx"
+        source = JSONLNewsSource(_write(tmp_path / "news.jsonl", _records(20)))
+        assert build_news_index(source.iter_articles(), path) == 20
+        with NewsIndex.open(path) as index:
+            assert len(index) == 20
+            newest = next(index.iter_articles())
+            assert newest.headline == "Headline 19"
+            assert all("AAPL" in a.symbols for a in index.iter_articles("AAPL"))
+            assert list(index.iter_articles("unknownterm")) == []
+
+    def test_fetch_tool_over_index(self) -> None:
+        index = NewsIndex.from_articles(mock_news_source().iter_articles())
+        tool = FetchMarketNewsTool(source=index)
+        news = tool.execute(topic="how are apple and microsoft doing")
+        assert "Apple" in news and "Microsoft" in news
+        assert tool.execute(symbol="XYZ123") == tool.execute(topic="market")
+
+
+@pytest.fixture(scope="module")
+def news_server() -> Iterator[tuple]:
+    from benchmarks.fake_news import create_fake_news_app
+    from benchmarks.server import BackgroundServer
+
+    app = create_fake_news_app()
+    with BackgroundServer(app) as server:
+        yield app, server.url
+
+
+class TestHTTPNewsSource:
+    """HTTP provider plumbing against the local stub news API."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, news_server: tuple) -> None:
+        app, _ = news_server
+        app.state.requests = app.state.not_modified = app.state.fail_next = 0
+        app.state.retry_after = None
+
+    def _source(self, url: str, **kwargs):
+        from quantgpt.news.http import JSONHTTPNewsSource
+
+        kwargs.setdefault("rate", 0)
+        return JSONHTTPNewsSource(url, backoff=0.01, **kwargs)
+
+    def test_fresh_responses_are_served_from_cache(self, news_server: tuple) -> None:
+        app, url = news_server
+        source = self._source(url)
+        first = list(source.iter_articles("AAPL"))
+        assert [a.headline for a in first] == ["Apple beats earnings estimates"]
+        assert list(source.iter_articles("AAPL")) == first
+        assert app.state.requests == 1
+        assert source.stats().cache_hits == 1
+
+    def test_expired_entries_are_revalidated_with_etag(self, news_server: tuple) -> None:
+        app, url = news_server
+        source = self._source(url, cache_ttl=0)
+        first = list(source.iter_articles("MSFT"))
+        assert list(source.iter_articles("MSFT")) == first
+        assert app.state.requests == 2
+        assert app.state.not_modified == 1
+        assert source.stats().not_modified == 1
+
+        app.state.articles = app.state.articles + [
+            {"timestamp": "2025-01-04T09:00:00Z", "symbols": ["MSFT"], "headline": "Microsoft raises dividend"}
+        ]
+        try:
+            assert len(list(source.iter_articles("MSFT"))) == 2
+        finally:
+            app.state.articles = app.state.articles[:-1]
+
+    def test_retryable_statuses_are_retried(self, news_server: tuple) -> None:
+        app, url = news_server
+        app.state.fail_next = 2
+        app.state.retry_after = 0
+        source = self._source(url, cache_ttl=0)
+        assert len(list(source.iter_articles())) == 3
+        assert app.state.requests == 3
+        assert source.stats().retries == 2
+
+    def test_exhausted_retries_raise_or_serve_stale(self, news_server: tuple) -> None:
+        from quantgpt.exceptions import NewsProviderError
+
+        app, url = news_server
+        source = self._source(url, cache_ttl=0, max_retries=1)
+        app.state.fail_next = 2
+        with pytest.raises(NewsProviderError):
+            list(source.iter_articles("market"))
+
+        cached = list(source.iter_articles("market"))
+        app.state.fail_next = 2
+        assert list(source.iter_articles("market")) == cached
+        assert source.stats().stale_served == 1
+
+    def test_fetch_tool_over_http_source(self, news_server: tuple) -> None:
+        app, url = news_server
+        tool = FetchMarketNewsTool(source=self._source(url))
+        assert tool.execute(symbol="AAPL") == "Apple beats earnings estimates"
+        # No fallback lookups ("unknown", then "market") against a metered provider.
+        assert asyncio.run(tool.aexecute(topic="unknown topic")) == ""
+        assert app.state.requests == 2
+
+    def test_cache_key_encodes_params(self, news_server: tuple) -> None:
+        app, url = news_server
+        source = self._source(url)
+        source.fetch("/news", {"q": "a&b=c"})
+        source.fetch("/news", {"q": "a", "b": "c"})
+        assert app.state.requests == 2 and source.stats().cache_hits == 0
+
+    def test_research_api_reports_provider_outage(self, news_server: tuple) -> None:
+        from fastapi.testclient import TestClient
+
+        from quantgpt.agents import ResearchAgent
+        from quantgpt.api.main import create_app
+        from quantgpt.api.routes.research import get_research_agent
+
+        app, url = news_server
+        app.state.fail_status = 502
+        app.state.fail_next = 10**6
+        api = create_app()
+        api.dependency_overrides[get_research_agent] = lambda: ResearchAgent(
+            news_source=self._source(url, cache_ttl=0, max_retries=0)
+        )
+        client = TestClient(api)
+        try:
+            response = client.post("/api/v1/research", json={"query": "market"})
+            assert response.status_code == 503 and "news provider" in response.json()["detail"]
+
+            stream = client.post("/api/v1/research/stream", json={"query": "market"})
+            assert stream.status_code == 200 and "event: error" in stream.text and "news provider" in stream.text
+
+            batch = client.post("/api/v1/research/batch", json={"queries": ["AAPL and MSFT", "market"]})
+            errors = [item["error"] for item in batch.json()["results"]]
+            assert all("news provider" in e and "/news" not in e for e in errors)
+        finally:
+            app.state.fail_status = 503
+            app.state.fail_next = 0
+
+    def test_providers_share_pool_and_rate_limit(self, news_server: tuple) -> None:
+        from quantgpt.news.http import get_http_client, rate_limiter
+
+        _, url = news_server
+        a = self._source(url, rate=1000, provider="test-shared")
+        b = self._source(url, rate=1, provider="test-shared")
+        assert a._bucket is b._bucket is rate_limiter("test-shared", 5)
+        assert a._bucket.rate == 1000
+        list(a.iter_articles("AAPL"))
+        list(b.iter_articles("AAPL"))
+        assert get_http_client() is get_http_client()
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self) -> None:
+        from quantgpt.news.http import TokenBucket
+
+        bucket = TokenBucket(rate=100, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert 0.005 < bucket.reserve() <= 0.01
+        assert 0.015 < bucket.reserve() <= 0.02
@@ -0,0 +1,231 @@
+"""Tests for quantgpt.portfolio."""
+
+import numpy as np
+import pytest
+
+from quantgpt.portfolio import (
+    CovarianceCache,
+    EWMACovariance,
+    MeanVarianceOptimizer,
+    RollingCovariance,
+    constant_correlation,
+    estimate_covariance,
+    estimate_moments,
+    ewma_covariance,
+    ledoit_wolf,
+    optimize,
+    optimize_portfolio,
+    project_capped_simplex,
+)
+
+
+def _returns(n_assets: int, n_periods: int = 500, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    factors = rng.standard_normal((n_periods, 3)) @ rng.standard_normal((3, n_assets)) * 0.01
+    drift = rng.uniform(-0.0005, 0.001, n_assets)
+    return factors + rng.standard_normal((n_periods, n_assets)) * 0.02 + drift
+
+
+def _simplex_grid(step: float = 0.01) -> np.ndarray:
+    a, b = np.meshgrid(np.arange(0, 1 + step / 2, step), np.arange(0, 1 + step / 2, step))
+    w = np.stack([a.ravel(), b.ravel(), 1 - a.ravel() - b.ravel()], axis=1)
+    return w[w[:, 2] >= -1e-12]
+
+
+def _assert_kkt(opt: MeanVarianceOptimizer, w: np.ndarray, lam: float, mu: np.ndarray, atol: float = 1e-6) -> None:
+    """Gradient is equal on free assets, not lower on assets at their floor, not higher at their cap."""
+    grad = lam * (opt.cov @ w) - mu
+    at_lower = w <= opt.lower + 1e-9
+    at_upper = w >= opt.upper - 1e-9
+    free = ~(at_lower | at_upper)
+    nu = grad[free].mean()
+    assert np.ptp(grad[free]) < atol
+    assert (grad[at_lower] >= nu - atol).all()
+    assert (grad[at_upper] <= nu + atol).all()
+
+
+class TestProjection:
+    def test_projects_onto_capped_simplex(self) -> None:
+        rng = np.random.default_rng(1)
+        v = rng.standard_normal((20, 50))
+        lower, upper = np.zeros(50), np.full(50, 0.1)
+        w, tau = project_capped_simplex(v, lower, upper)
+        np.testing.assert_allclose(w.sum(axis=1), 1.0)
+        assert (w >= 0).all() and (w <= 0.1).all()
+        np.testing.assert_allclose(w, np.clip(v - tau[:, None], lower, upper))
+
+    def test_warm_start_gives_same_result(self) -> None:
+        rng = np.random.default_rng(2)
+        v = rng.standard_normal((5, 30))
+        lower, upper = np.full(30, -0.2), np.full(30, 0.3)
+        cold, tau = project_capped_simplex(v, lower, upper, budget=0.5)
+        warm, _ = project_capped_simplex(v + 1e-3, lower, upper, budget=0.5, tau=tau)
+        np.testing.assert_allclose(warm, project_capped_simplex(v + 1e-3, lower, upper, budget=0.5)[0], atol=1e-12)
+        np.testing.assert_allclose(cold.sum(axis=1), 0.5)
+
+
+class TestMeanVarianceOptimizer:
+    def test_three_assets_match_grid_search(self) -> None:
+        returns = _returns(3, seed=3)
+        opt = MeanVarianceOptimizer.from_returns(returns)
+        mu, cov = estimate_moments(returns)
+        grid = _simplex_grid()
+        variance = np.einsum("kn,nm,km->k", grid, cov, grid)
+        assert opt.min_variance().volatility ** 2 <= variance.min() + 1e-12
+        utility = grid @ mu - 20.0 / 2 * variance
+        best = opt.mean_variance(20.0).weights
+        assert best @ mu - 10.0 * best @ cov @ best >= utility.max() - 1e-12
+        sharpe = (grid @ mu) / np.sqrt(variance)
+        assert opt.max_sharpe().sharpe >= sharpe.max() - 1e-9
+
+    def test_solutions_satisfy_kkt_with_caps(self) -> None:
+        opt = MeanVarianceOptimizer.from_returns(_returns(60, seed=4), upper=0.08)
+        for lam in (5.0, 50.0, 500.0):
+            w = opt.solve(lam)[0]
+            assert abs(w.sum() - 1) < 1e-9 and (w >= -1e-12).all() and (w <= 0.08 + 1e-12).all()
+            _assert_kkt(opt, w, lam, opt.mu)
+        _assert_kkt(opt, opt.min_variance().weights, 1.0, np.zeros(60))
+
+    def test_frontier_is_batched_and_ordered(self) -> None:
+        opt = MeanVarianceOptimizer.from_returns(_returns(40, seed=5), upper=0.2)
+        front = opt.frontier(n_points=15)
+        assert front.weights.shape == (15, 40)
+        assert (np.diff(front.volatility) >= -1e-12).all()
+        assert (np.diff(front.expected_return) >= -1e-9).all()
+        single = opt.solve(front.risk_aversion[7])[0]
+        np.testing.assert_allclose(single, front.weights[7], atol=1e-6)
+        assert opt.min_variance().volatility <= front.volatility[0] + 1e-9
+        assert opt.max_sharpe().sharpe >= front.sharpe.max() - 1e-9
+
+    def test_optimize_objectives(self) -> None:
+        returns = _returns(10, seed=6)
+        for objective in ("min_variance", "mean_variance", "max_sharpe"):
+            p = optimize(returns, objective=objective, upper=0.3)
+            assert abs(p.weights.sum() - 1) < 1e-9 and p.weights.max() <= 0.3 + 1e-12
+        with pytest.raises(ValueError, match="Unknown objective"):
+            optimize(returns, objective="risk_parity")
+
+    def test_invalid_inputs(self) -> None:
+        returns = _returns(4)
+        with pytest.raises(ValueError, match="Infeasible"):
+            MeanVarianceOptimizer.from_returns(returns, upper=0.2)
+        with pytest.raises(ValueError, match="do not match"):
+            MeanVarianceOptimizer(np.zeros(3), np.eye(4))
+        with pytest.raises(ValueError, match="positive excess return"):
+            MeanVarianceOptimizer.from_returns(-np.abs(returns)).max_sharpe()
+
+
+class TestCovariance:
+    def test_ledoit_wolf_matches_reference(self) -> None:
+        x = _returns(8, n_periods=40, seed=7)
+        t, n = x.shape
+        c = x - x.mean(axis=0)
+        s = c.T @ c / t
+        mu = np.trace(s) / n
+        d2 = np.sum((s - mu * np.eye(n)) ** 2)
+        b2 = sum(np.sum((np.outer(row, row) - s) ** 2) for row in c) / t**2
+        delta = min(b2, d2) / d2
+        cov, shrinkage = ledoit_wolf(x)
+        assert shrinkage == pytest.approx(delta)
+        np.testing.assert_allclose(cov, delta * mu * np.eye(n) + (1 - delta) * s, atol=1e-15)
+
+    def test_constant_correlation_matches_reference(self) -> None:
+        x = _returns(5, n_periods=30, seed=8)
+        t, n = x.shape
+        c = x - x.mean(axis=0)
+        s = c.T @ c / t
+        sd = np.sqrt(np.diag(s))
+        r_bar = (np.sum(s / np.outer(sd, sd)) - n) / (n * (n - 1))
+        target = r_bar * np.outer(sd, sd)
+        np.fill_diagonal(target, sd**2)
+        pi = rho = 0.0
+        for i in range(n):
+            for j in range(n):
+                pi_ij = np.mean((c[:, i] * c[:, j] - s[i, j]) ** 2)
+                pi += pi_ij
+                if i == j:
+                    rho += pi_ij
+                else:
+                    theta_ii = np.mean((c[:, i] ** 2 - s[i, i]) * (c[:, i] * c[:, j] - s[i, j]))
+                    theta_jj = np.mean((c[:, j] ** 2 - s[j, j]) * (c[:, i] * c[:, j] - s[i, j]))
+                    rho += r_bar / 2 * (sd[j] / sd[i] * theta_ii + sd[i] / sd[j] * theta_jj)
+        delta = np.clip((pi - rho) / np.sum((target - s) ** 2) / t, 0, 1)
+        cov, shrinkage = constant_correlation(x)
+        assert shrinkage == pytest.approx(delta)
+        np.testing.assert_allclose(cov, delta * target + (1 - delta) * s, atol=1e-15)
+
+    def test_shrinkage_makes_short_window_invertible(self) -> None:
+        x = _returns(50, n_periods=20, seed=9)
+        assert np.linalg.matrix_rank(estimate_covariance(x)) < 50
+        for estimator in ("ledoit_wolf", "constant_correlation"):
+            assert np.linalg.eigvalsh(estimate_covariance(x, estimator)).min() > 0
+
+    def test_ewma_matches_recursion(self) -> None:
+        x = _returns(6, n_periods=100, seed=10)
+        online = EWMACovariance(6, decay=0.9)
+        for row in x:
+            online.update(row)
+        np.testing.assert_allclose(ewma_covariance(x, decay=0.9), online.cov, rtol=1e-12)
+        with pytest.raises(ValueError, match="decay"):
+            ewma_covariance(x, decay=1.0)
+
+    def test_rolling_matches_recomputation(self) -> None:
+        x = _returns(12, n_periods=3000, seed=11) + 5.0  # offset stresses cancellation
+        rolling = RollingCovariance(12, window=60)
+        rolling.update_many(x[:30])
+        np.testing.assert_allclose(rolling.covariance(), np.cov(x[:30], rowvar=False), rtol=1e-10)
+        rolling.update_many(x[30:])
+        np.testing.assert_array_equal(rolling.window_returns(), x[-60:])
+        np.testing.assert_allclose(rolling.mean, x[-60:].mean(axis=0), rtol=1e-10)
+        np.testing.assert_allclose(rolling.covariance(), np.cov(x[-60:], rowvar=False), rtol=1e-8, atol=1e-14)
+
+    def test_cache_reuses_by_universe_and_window(self) -> None:
+        x = _returns(4, n_periods=50, seed=12)
+        cache = CovarianceCache(max_entries=2)
+        universe = ("AAPL", "MSFT", "NVDA", "TSLA")
+        first = estimate_covariance(x, "ledoit_wolf", universe=universe, window_end="2024-01-31", cache=cache)
+        again = estimate_covariance(x * 2, "ledoit_wolf", universe=universe, window_end="2024-01-31", cache=cache)
+        assert again is first and not first.flags.writeable
+        estimate_covariance(x, "ewma", universe=universe, window_end="2024-01-31", cache=cache, decay=0.97)
+        estimate_covariance(x, "ewma", universe=universe, window_end="2024-01-31", cache=cache, decay=0.94)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 3, 2)
+        assert stats.bytes == 2 * 4 * 4 * 8
+        longer = _returns(4, n_periods=80, seed=12)
+        cov = estimate_covariance(longer, "sample", universe=universe, window_end="2024-01-31", cache=cache)
+        estimate_covariance(x, "sample", universe=universe, window_end="2024-01-31", cache=cache)
+        np.testing.assert_allclose(cov, np.cov(longer, rowvar=False))
+        assert cache.stats().misses == 5
+        with pytest.raises(ValueError, match="Unknown covariance estimator"):
+            estimate_covariance(x, "shrunk")
+
+    def test_optimizer_accepts_estimator(self) -> None:
+        returns = _returns(30, n_periods=25, seed=13)
+        p = optimize(returns, objective="min_variance", estimator="ledoit_wolf", upper=0.2)
+        assert abs(p.weights.sum() - 1) < 1e-9
+
+    def test_optimize_and_risk_share_cached_covariance(self) -> None:
+        from quantgpt.risk import portfolio_risk
+
+        returns = _returns(5, n_periods=60, seed=14)
+        cache = CovarianceCache()
+        window = dict(universe="ABCDE", window_end="2024-06-28", cache=cache)
+        p = optimize(returns, objective="min_variance", **window)
+        np.testing.assert_allclose(p.weights, optimize(returns, objective="min_variance").weights)
+        optimize(returns, objective="max_sharpe", upper=0.5, **window)
+        portfolio_risk(returns, p, method="parametric", **window)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_optimize_portfolio_equal_weights() -> None:
+    assert optimize_portfolio([10.0, 20.0, 30.0, 40.0]) == [0.25] * 4
+    with pytest.raises(ValueError):
+        optimize_portfolio([])
+
+
+def test_optimize_portfolio_delegates_to_optimize() -> None:
+    returns = _returns(6, n_periods=120, seed=15)
+    weights = optimize_portfolio(returns, objective="min_variance", upper=0.3)
+    assert isinstance(weights, list) and len(weights) == 6
+    np.testing.assert_allclose(weights, optimize(returns, objective="min_variance", upper=0.3).weights)
@@ -0,0 +1,79 @@
+"""Tests for quantgpt.prices."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from quantgpt.forecasting import forecast
+from quantgpt.portfolio import optimize
+from quantgpt.prices import PriceStore, open_price_store
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "TSLA"]
+
+
+def _days(n: int, start: str = "2024-01-01") -> np.ndarray:
+    return np.datetime64(start) + np.arange(n)
+
+
+def _prices(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.standard_normal((n, len(SYMBOLS))) * 0.01, axis=0))
+
+
+@pytest.fixture
+def store(tmp_path):
+    writer = PriceStore.create(tmp_path / "prices", SYMBOLS, fields=("close", "volume"), capacity=4)
+    writer.append_many(_days(30), {"close": _prices(30)})
+    yield writer
+    writer.close()
+
+
+def test_windows_are_read_only_views(store) -> None:
+    reader = open_price_store(store.path)
+    assert len(reader) == 30 and reader.symbols == SYMBOLS
+    block = reader.window(symbols=["MSFT", "NVDA"], start="2024-01-05", end=datetime.date(2024, 1, 10))
+    np.testing.assert_array_equal(block, _prices(30)[4:10, 1:3])
+    assert np.shares_memory(block, reader._maps["close"]) and not block.flags.writeable
+    assert reader.panel().shape == (4, 30)
+    scattered = reader.window(symbols=["TSLA", "AAPL"])
+    np.testing.assert_array_equal(scattered, _prices(30)[:, [3, 0]])
+    assert np.isnan(reader.window("volume")).all()
+    assert reader.dates[0] == np.datetime64("2024-01-01")
+
+
+def test_appends_are_published_to_readers(store) -> None:
+    reader = open_price_store(store.path)
+    prices = _prices(100, seed=1)
+    for day, row in zip(_days(70, "2024-01-31"), prices[:70]):
+        store.append(day, {"close": row, "volume": np.full(4, 1e6)})
+    assert len(reader) == 30
+    reader.refresh()
+    assert len(reader) == 100
+    np.testing.assert_array_equal(reader.window(start="2024-01-31")[:, 0], prices[:70, 0])
+    assert reader.window("volume", start="2024-01-31").min() == 1e6
+    with pytest.raises(ValueError, match="strictly increasing"):
+        store.append("2024-02-01", {"close": prices[0]})
+    with pytest.raises(ValueError, match="read-only"):
+        reader.append("2025-01-01", {"close": prices[0]})
+
+
+def test_views_feed_forecaster_and_optimizer(store) -> None:
+    reader = open_price_store(store.path)
+    fc = forecast(reader.panel(), steps=2, model="drift")
+    assert fc.mean.shape == (4, 2)
+    weights = optimize(reader.returns(), objective="min_variance").weights
+    assert weights.shape == (4,) and weights.sum() == pytest.approx(1.0)
+
+
+def test_invalid_requests(store, tmp_path) -> None:
+    with pytest.raises(ValueError, match="already exists"):
+        PriceStore.create(store.path, SYMBOLS)
+    with pytest.raises(ValueError, match="Unknown symbol"):
+        store.window(symbols=["IBM"])
+    with pytest.raises(ValueError, match="Unknown field"):
+        store.window("open")
+    with pytest.raises(ValueError, match="pass values as a mapping"):
+        store.append("2025-01-01", np.ones(4))
+    with pytest.raises(ValueError, match="shape"):
+        store.append("2025-01-01", {"close": np.ones(3)})
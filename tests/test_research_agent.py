@@ -1,11 +1,21 @@
 """Tests for ResearchAgent and POST /api/v1/research."""
 
+import asyncio
+import time
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
 
-from quantgpt.agents import ResearchAgent
+from quantgpt.agents import AgentRegistry, ResearchAgent
+from quantgpt.agents.concurrency import ConcurrencyLimiter
+from quantgpt.agents.research_agent import normalize_query
 from quantgpt.api.main import create_app
 from quantgpt.exceptions import OllamaUnavailableError
+from quantgpt.news import Article, InMemoryNewsSource
+from quantgpt.news.index import extract_symbols
 
 
 class TestResearchAgent:
@@ -20,6 +30,15 @@ class TestResearchAgent:
         with pytest.raises(OllamaUnavailableError):
             agent.run("AAPL")
 
+    def test_arun_raises_when_ollama_unavailable(self) -> None:
+        """Test that arun() raises OllamaUnavailableError when Ollama is unreachable."""
+        agent = ResearchAgent(
+            ollama_base_url="http://invalid:9999",
+            ollama_model="llama3.2",
+        )
+        with pytest.raises(OllamaUnavailableError):
+            asyncio.run(agent.arun("AAPL"))
+
     def test_run_returns_string_when_ollama_available(self) -> None:
         """Test that run() returns insight when Ollama works (may skip if Ollama not running)."""
         agent = ResearchAgent(
@@ -34,6 +53,224 @@ class TestResearchAgent:
             pytest.skip("Ollama not running")
 
 
+class TestResearchAgentStreaming:
+    """Tests for ResearchAgent.astream() with a fake chat model."""
+
+    def test_astream_emits_news_sentiment_tokens_then_insight(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Buy the dip")]))
+        agent = ResearchAgent(llm=llm)
+
+        async def collect() -> list[tuple[str, dict]]:
+            return [event async for event in agent.astream("AAPL")]
+
+        events = asyncio.run(collect())
+        kinds = [kind for kind, _ in events]
+        assert kinds[:2] == ["news", "sentiment"]
+        assert kinds[-1] == "insight"
+        assert "token" in kinds
+        tokens = "".join(data["text"] for kind, data in events if kind == "token")
+        assert tokens == "Buy the dip"
+        assert events[-1][1]["insight"] == "Buy the dip"
+
+    def test_news_comes_from_configured_source(self) -> None:
+        articles = [Article(datetime(2025, 1, 2, tzinfo=timezone.utc), "NVDA beats", symbols=("NVDA",))]
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="ok")]))
+        agent = ResearchAgent(llm=llm, news_source=InMemoryNewsSource(articles))
+
+        async def collect() -> list[tuple[str, dict]]:
+            return [event async for event in agent.astream("nvda")]
+
+        assert asyncio.run(collect())[0] == ("news", {"symbol": "NVDA", "news": "NVDA beats"})
+
+
+class SlowNewsSource(InMemoryNewsSource):
+    """In-memory feed whose reads take a fixed delay (sync and async)."""
+
+    delay = 0.2
+
+    def iter_articles(self, term: str | None = None):
+        time.sleep(self.delay)
+        yield from super().iter_articles(term)
+
+    async def aiter_articles(self, term: str | None = None):
+        await asyncio.sleep(self.delay)
+        for article in super().iter_articles(term):
+            yield article
+
+
+def _symbol_articles(*symbols: str) -> list[Article]:
+    when = datetime(2025, 1, 2, tzinfo=timezone.utc)
+    return [Article(when, f"{s} posts record profit", symbols=(s,)) for s in symbols]
+
+
+class RecordingChatModel(GenericFakeChatModel):
+    """Fake chat model that keeps every prompt it is sent."""
+
+    prompts: list = []
+
+    def _generate(self, messages, *args, **kwargs):
+        self.prompts.append(messages[0].content)
+        return super()._generate(messages, *args, **kwargs)
+
+
+class TestResearchAgentFanOut:
+    """Tests for the per-symbol Send fan-out."""
+
+    def test_extract_symbols(self) -> None:
+        query = "Compare AAPL, $nvda and Microsoft vs goldman sachs; what about the FED and AI?"
+        assert extract_symbols(query) == ["AAPL", "NVDA", "MSFT", "GS"]
+        assert extract_symbols("how are markets today") == []
+        assert extract_symbols("BRK.B or AAPL or AAPL") == ["BRK.B", "AAPL"]
+        assert extract_symbols("what about tsla") == ["TSLA"]
+        assert extract_symbols("I think US markets are OK") == []
+        assert extract_symbols("aapl and msft") == extract_symbols("AAPL and MSFT") == ["AAPL", "MSFT"]
+        assert extract_symbols("IBM or $ibm") == ["IBM"]
+        assert extract_symbols("IBM and ibm", is_symbol={"IBM"}.__contains__) == ["IBM"]
+
+    def test_agent_symbols_are_configurable(self) -> None:
+        assert ResearchAgent()._symbols("IBM vs AAPL") == ["AAPL"]
+        assert ResearchAgent(symbols=["ibm"])._symbols("IBM vs AAPL") == ["IBM"]
+
+    def test_branches_run_concurrently_into_one_summary(self) -> None:
+        llm = RecordingChatModel(messages=iter([AIMessage(content="A"), AIMessage(content="B")]), prompts=[])
+        agent = ResearchAgent(llm=llm, news_source=SlowNewsSource(_symbol_articles("AAPL", "MSFT", "NVDA")))
+
+        start = time.perf_counter()
+        assert agent.run("AAPL vs MSFT vs NVDA") == "A"
+        assert time.perf_counter() - start < 2.5 * SlowNewsSource.delay
+        start = time.perf_counter()
+        assert asyncio.run(agent.arun("NVDA and AAPL")) == "B"
+        assert time.perf_counter() - start < 1.5 * SlowNewsSource.delay
+
+        assert len(llm.prompts) == 2
+        first, second = llm.prompts
+        assert first.index("AAPL (sentiment") < first.index("MSFT (sentiment") < first.index("NVDA (sentiment")
+        assert "NVDA posts record profit" in second and "MSFT" not in second
+
+    def test_astream_emits_events_per_symbol(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="ok")]))
+        agent = ResearchAgent(llm=llm, news_source=InMemoryNewsSource(_symbol_articles("AAPL", "NVDA")))
+
+        async def collect() -> list[tuple[str, dict]]:
+            return [event async for event in agent.astream("AAPL and NVDA")]
+
+        events = asyncio.run(collect())
+        news = {data["symbol"]: data["news"] for kind, data in events if kind == "news"}
+        assert news == {"AAPL": "AAPL posts record profit", "NVDA": "NVDA posts record profit"}
+        assert sum(kind == "sentiment" for kind, _ in events) == 2
+        assert events[-1] == ("insight", {"insight": "ok"})
+
+    def test_batch_fans_out_multi_symbol_queries(self) -> None:
+        llm = RecordingChatModel(messages=iter([AIMessage(content="A"), AIMessage(content="B")]), prompts=[])
+        agent = ResearchAgent(llm=llm, news_source=InMemoryNewsSource(_symbol_articles("AAPL", "MSFT")))
+        for first, second in (("AAPL and MSFT", "aapl and msft"), ("aapl and msft", "AAPL and MSFT")):
+            llm.prompts.clear()
+            llm.messages = iter([AIMessage(content="A"), AIMessage(content="B")])
+            results = asyncio.run(agent.arun_batch([first, second, "market"]))
+            assert results[0] == results[1] and len(llm.prompts) == 2
+            assert any("AAPL (sentiment" in p and "MSFT (sentiment" in p for p in llm.prompts)
+
+    def test_batch_prepares_queries_concurrently(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content=c) for c in "ABCD"]))
+        agent = ResearchAgent(llm=llm, news_source=SlowNewsSource(_symbol_articles("AAPL", "MSFT", "NVDA")))
+        start = time.perf_counter()
+        asyncio.run(agent.arun_batch(["AAPL", "MSFT", "NVDA", "market"], max_concurrency=2))
+        elapsed = time.perf_counter() - start
+        assert 2 * SlowNewsSource.delay <= elapsed < 3.5 * SlowNewsSource.delay
+
+
+class TestResearchAgentBatch:
+    """Tests for ResearchAgent.arun_batch()."""
+
+    def test_normalize_query(self) -> None:
+        assert normalize_query("  AAPL   earnings ") == "aapl earnings"
+
+    def test_duplicates_share_one_llm_call(self) -> None:
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="A"), AIMessage(content="B")]))
+        agent = ResearchAgent(llm=llm)
+        results = asyncio.run(agent.arun_batch(["AAPL", " aapl ", "MSFT"], max_concurrency=1))
+        assert results[0] == results[1]
+        assert set(results) == {"A", "B"}
+
+    def test_errors_are_returned_per_item(self) -> None:
+        agent = ResearchAgent(ollama_base_url="http://invalid:9999")
+        results = asyncio.run(agent.arun_batch(["AAPL", "MSFT"]))
+        assert all(isinstance(r, OllamaUnavailableError) for r in results)
+
+
+class TestConcurrencyLimiter:
+    """Tests for ConcurrencyLimiter."""
+
+    def test_async_limit_caps_in_flight(self) -> None:
+        limiter = ConcurrencyLimiter(2)
+        in_flight = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        async def main() -> None:
+            await asyncio.gather(*(call() for _ in range(10)))
+
+        asyncio.run(main())
+        assert peak == 2
+
+    def test_unlimited_when_none(self) -> None:
+        limiter = ConcurrencyLimiter(None)
+        assert limiter.limit is None
+        with limiter:
+            pass
+
+    def test_registry_shares_limiter_per_base_url(self) -> None:
+        registry = AgentRegistry(max_concurrency=3)
+        a = registry.get_limiter("http://localhost:11434")
+        b = registry.get_limiter("http://localhost:11434")
+        assert a is b
+        assert a.limit == 3
+
+
+class TestAgentRegistry:
+    """Tests for the app-scoped AgentRegistry."""
+
+    def test_same_key_returns_same_agent(self) -> None:
+        registry = AgentRegistry()
+        a = registry.get_research_agent("http://localhost:11434", "llama3.2")
+        b = registry.get_research_agent("http://localhost:11434", "llama3.2")
+        assert a is b
+
+    def test_different_model_returns_different_agent(self) -> None:
+        registry = AgentRegistry()
+        a = registry.get_research_agent("http://localhost:11434", "llama3.2")
+        b = registry.get_research_agent("http://localhost:11434", "mistral")
+        assert a is not b
+
+    def test_agent_reuses_registry_llm(self) -> None:
+        registry = AgentRegistry()
+        agent = registry.get_research_agent("http://localhost:11434", "llama3.2")
+        assert agent._get_llm() is registry.get_llm("http://localhost:11434", "llama3.2")
+
+    def test_close_forgets_agents(self) -> None:
+        registry = AgentRegistry()
+        a = registry.get_research_agent("http://localhost:11434", "llama3.2")
+        registry.close()
+        assert registry.get_research_agent("http://localhost:11434", "llama3.2") is not a
+
+    def test_endpoint_dependency_reuses_agent(self) -> None:
+        from quantgpt.api.routes.research import get_research_agent
+
+        app = create_app()
+        with TestClient(app):
+            registry = app.state.agent_registry
+            first = get_research_agent(registry)
+            second = get_research_agent(registry)
+            assert first is second
+
+
 class TestResearchEndpoint:
     """Integration tests for POST /api/v1/research."""
 
@@ -43,6 +280,9 @@ class TestResearchEndpoint:
             def run(self, query: str, **kwargs: object) -> str:
                 return "Mock insight for testing."
 
+            async def arun(self, query: str, **kwargs: object) -> str:
+                return self.run(query)
+
         def mock_agent() -> MockResearchAgent:
             return MockResearchAgent()
 
@@ -90,3 +330,85 @@ class TestResearchEndpoint:
         spec = response.json()
         assert "/api/v1/research" in spec["paths"]
         assert "post" in spec["paths"]["/api/v1/research"]
+
+
+class TestResearchStreamEndpoint:
+    """Integration tests for POST /api/v1/research/stream."""
+
+    def test_stream_returns_sse_events(self) -> None:
+        def fake_agent() -> ResearchAgent:
+            llm = GenericFakeChatModel(messages=iter([AIMessage(content="Stay long")]))
+            return ResearchAgent(llm=llm)
+
+        app = create_app()
+        from quantgpt.api.routes.research import get_research_agent
+
+        app.dependency_overrides[get_research_agent] = fake_agent
+
+        client = TestClient(app)
+        response = client.post("/api/v1/research/stream", json={"query": "MSFT"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = response.text
+        assert body.index("event: news") < body.index("event: sentiment") < body.index("event: token")
+        assert 'event: insight\ndata: {"insight": "Stay long"}' in body
+
+    def test_stream_emits_error_event_when_ollama_unavailable(self) -> None:
+        def mock_agent() -> ResearchAgent:
+            return ResearchAgent(
+                ollama_base_url="http://invalid-ollama:9999",
+                ollama_model="llama3.2",
+            )
+
+        app = create_app()
+        from quantgpt.api.routes.research import get_research_agent
+
+        app.dependency_overrides[get_research_agent] = mock_agent
+
+        client = TestClient(app)
+        response = client.post("/api/v1/research/stream", json={"query": "AAPL"})
+        assert response.status_code == 200
+        assert "event: news" in response.text
+        assert "event: error" in response.text
+
+
+class TestResearchBatchEndpoint:
+    """Integration tests for POST /api/v1/research/batch."""
+
+    def test_batch_returns_results_in_order(self) -> None:
+        class MockResearchAgent:
+            async def arun_batch(self, queries: list[str], max_concurrency: int | None = None) -> list:
+                return [f"insight:{q}" if q != "bad" else ValueError("boom") for q in queries]
+
+        app = create_app()
+        from quantgpt.api.routes.research import get_research_agent
+
+        app.dependency_overrides[get_research_agent] = MockResearchAgent
+
+        client = TestClient(app)
+        response = client.post("/api/v1/research/batch", json={"queries": ["AAPL", "bad", "MSFT"]})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["query"] for r in results] == ["AAPL", "bad", "MSFT"]
+        assert results[0]["insight"] == "insight:AAPL"
+        assert results[1]["insight"] is None
+        assert results[1]["error"] == "Research failed"
+
+    def test_batch_reports_ollama_unavailable_per_item(self) -> None:
+        def mock_agent() -> ResearchAgent:
+            return ResearchAgent(ollama_base_url="http://invalid-ollama:9999")
+
+        app = create_app()
+        from quantgpt.api.routes.research import get_research_agent
+
+        app.dependency_overrides[get_research_agent] = mock_agent
+
+        client = TestClient(app)
+        response = client.post("/api/v1/research/batch", json={"queries": ["AAPL"]})
+        assert response.status_code == 200
+        assert "Ollama" in response.json()["results"][0]["error"]
+
+    def test_batch_rejects_empty_list(self) -> None:
+        client = TestClient(create_app())
+        response = client.post("/api/v1/research/batch", json={"queries": []})
+        assert response.status_code == 422
@@ -0,0 +1,88 @@
+"""Tests for quantgpt.risk."""
+
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from quantgpt.portfolio import optimize, optimize_portfolio
+from quantgpt.risk import historical_var, monte_carlo_var, parametric_var, portfolio_risk
+from quantgpt.risk.engine import _t_ppf
+
+
+def _market(n_assets: int = 8, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = rng.standard_normal((n_assets, n_assets)) * 0.01
+    cov = a @ a.T / n_assets + np.eye(n_assets) * 1e-4
+    mu = rng.uniform(0, 1e-3, n_assets)
+    return np.full(n_assets, 1 / n_assets), mu, cov
+
+
+def test_student_t_quantiles() -> None:
+    assert _t_ppf(0.975, 5) == pytest.approx(2.570581836, rel=1e-9)
+    assert _t_ppf(0.99, 3) == pytest.approx(4.540702858, rel=1e-9)
+    assert _t_ppf(0.05, 10) == pytest.approx(-1.812461123, rel=1e-9)
+
+
+def test_parametric_normal_matches_formula() -> None:
+    w, mu, cov = _market()
+    sigma = np.sqrt(w @ cov @ w * 10)
+    z = NormalDist().inv_cdf(0.99)
+    risk = parametric_var(w, mu, cov, confidence=0.99, horizon=10)
+    assert risk.var == pytest.approx(z * sigma - w @ mu * 10)
+    assert risk.cvar == pytest.approx(NormalDist().pdf(z) / 0.01 * sigma - w @ mu * 10)
+    t = parametric_var(w, mu, cov, confidence=0.99, distribution="t", dof=4)
+    assert t.cvar > t.var and t.cvar > parametric_var(w, mu, cov, confidence=0.99).cvar
+
+
+def test_historical_tail() -> None:
+    returns = np.linspace(-0.1, 0.09, 20)[:, np.newaxis] * np.ones((1, 2))
+    risk = historical_var(returns, [0.5, 0.5], confidence=0.9)
+    assert risk.var == pytest.approx(0.09)
+    assert risk.cvar == pytest.approx(0.095)
+
+
+@pytest.mark.parametrize("distribution", ["normal", "t"])
+def test_monte_carlo_converges_to_parametric(distribution: str) -> None:
+    w, mu, cov = _market()
+    exact = parametric_var(w, mu, cov, confidence=0.99, horizon=5, distribution=distribution)
+    sim = monte_carlo_var(
+        w, mu, cov, confidence=0.99, horizon=5, n_paths=400_000, distribution=distribution, chunk_size=30_000, seed=1
+    )
+    assert sim.var == pytest.approx(exact.var, rel=0.02)
+    assert sim.cvar == pytest.approx(exact.cvar, rel=0.03)
+
+
+def test_monte_carlo_is_reproducible_across_workers() -> None:
+    w, mu, cov = _market()
+    kwargs = dict(n_paths=50_000, chunk_size=4_000, seed=7, distribution="t")
+    single = monte_carlo_var(w, mu, cov, **kwargs)
+    assert monte_carlo_var(w, mu, cov, workers=3, **kwargs) == single
+    assert monte_carlo_var(w, mu, cov, **{**kwargs, "seed": 8}) != single
+
+
+def test_monte_carlo_log_returns_revalue_assets() -> None:
+    w, mu, cov = _market(n_assets=3)
+    sim = monte_carlo_var(w, mu, cov * 400, confidence=0.95, n_paths=50_000, log_returns=True, seed=2)
+    rng = np.random.default_rng(np.random.SeedSequence(2).spawn(3)[0])
+    draws = rng.standard_normal((20_000, 3)) @ np.linalg.cholesky(cov * 400).T + mu
+    reference = historical_var(np.expm1(draws), w, confidence=0.95)
+    assert sim.var == pytest.approx(reference.var, rel=0.05)
+    assert sim.var < parametric_var(w, mu, cov * 400, confidence=0.95).var  # exp() dampens losses
+
+
+def test_portfolio_risk_methods() -> None:
+    rng = np.random.default_rng(3)
+    returns = rng.standard_normal((500, 4)) * 0.01
+    weights = optimize_portfolio([100.0] * 4)
+    for method in ("parametric", "historical", "monte_carlo"):
+        risk = portfolio_risk(returns, weights, method=method, confidence=0.95)
+        assert 0 < risk.var < risk.cvar
+    best = optimize(returns, objective="min_variance")
+    assert portfolio_risk(returns, best, method="parametric", estimator="ledoit_wolf").var > 0
+    with pytest.raises(ValueError, match="Unknown risk method"):
+        portfolio_risk(returns, weights, method="delta_gamma")
+    with pytest.raises(ValueError, match="dof"):
+        parametric_var(weights, np.zeros(4), np.eye(4), distribution="t", dof=2)
+    with pytest.raises(ValueError, match="do not match"):
+        monte_carlo_var(weights, np.zeros(3), np.eye(4))
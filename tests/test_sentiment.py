@@ -0,0 +1,136 @@
+"""Tests for quantgpt.nlp sentiment scoring."""
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.sentiment import make_corpus
+from quantgpt.nlp import (
+    SentimentCache,
+    analyze_sentiment,
+    analyze_sentiment_batch,
+    configure_sentiment_cache,
+    get_sentiment_cache,
+)
+from quantgpt.nlp.sentiment import _score
+from quantgpt.nlp.sentiment_cache import ENTRY_BYTES, sentiment_key
+
+TEXTS = [
+    "Apple Inc. reports strong Q4 earnings, beats analyst expectations.",
+    "Terrible loss and awful decline.",
+    "",
+    "Global markets show mixed signals amid economic data.",
+] * 5
+
+
+class TestAnalyzeSentimentBatch:
+    """Tests for analyze_sentiment_batch."""
+
+    def test_in_process_matches_single_scoring(self) -> None:
+        scores = analyze_sentiment_batch(TEXTS, workers=1)
+        assert isinstance(scores, array)
+        assert scores.typecode == "d"
+        assert list(scores) == [analyze_sentiment(t) for t in TEXTS]
+
+    def test_process_pool_preserves_order(self) -> None:
+        texts = [f"Great gain {i}" if i % 2 else f"Awful loss {i}" for i in range(12)]
+        get_sentiment_cache().clear()
+        scores = analyze_sentiment_batch(texts, workers=2, chunk_size=3)
+        assert len(get_sentiment_cache()) == 12
+        assert list(scores) == pytest.approx([analyze_sentiment(t) for t in texts])
+
+    def test_reuses_given_executor(self) -> None:
+        with ThreadPoolExecutor(2) as pool:
+            scores = analyze_sentiment_batch(TEXTS, chunk_size=4, executor=pool)
+        assert list(scores) == [analyze_sentiment(t) for t in TEXTS]
+
+    def test_empty_input(self) -> None:
+        assert len(analyze_sentiment_batch([])) == 0
+
+
+class TestSentimentCache:
+    """Tests for the memoized sentiment layer."""
+
+    def setup_method(self) -> None:
+        self.cache = configure_sentiment_cache(max_entries=1024, max_bytes=1 << 20)
+
+    def teardown_method(self) -> None:
+        configure_sentiment_cache(max_entries=65_536, max_bytes=16 * 1024 * 1024)
+
+    def test_repeat_hits_cache(self) -> None:
+        first = analyze_sentiment("Stocks   rally on strong earnings")
+        second = analyze_sentiment("Stocks rally on strong earnings ")
+        assert first == second
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_key_keeps_case(self) -> None:
+        assert sentiment_key("GREAT results") != sentiment_key("great results")
+        assert sentiment_key("a  b") == sentiment_key(" a b")
+
+    def test_lru_eviction_and_byte_limit(self) -> None:
+        cache = SentimentCache(max_entries=2)
+        for i, key in enumerate((b"a", b"b", b"c")):
+            cache.set(key, float(i))
+        assert cache.get(b"a") is None
+        assert cache.get(b"c") == 2.0
+        assert SentimentCache(max_entries=100, max_bytes=3 * ENTRY_BYTES).capacity == 3
+        assert len(SentimentCache(max_entries=0)) == 0
+
+    def test_batch_consults_cache_and_dedupes(self) -> None:
+        analyze_sentiment(TEXTS[0])
+        scores = analyze_sentiment_batch(TEXTS, workers=1)
+        assert list(scores) == [analyze_sentiment(t) for t in TEXTS]
+        # One pre-scored text plus two new unique non-empty texts.
+        assert len(self.cache) == 3
+
+
+REFERENCE_CORPUS = [
+    "VADER is smart, handsome, and funny.",
+    "VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!",
+    "VADER is not smart, handsome, nor funny.",
+    "At least it isn't a horrible book.",
+    "The book was only kind of good.",
+    "The plot was good, but the characters are uncompelling and the dialog is not great.",
+    "Today SUX!",
+    "Make sure you :) or :D today!",
+    "Catch utf-8 emoji such as 💘 and 💋 and 😁",
+    "Sentiment analysis has never been this good!",
+    "With VADER, sentiment analysis is the shit!",
+    "Without a doubt, excellent idea.",
+    "Roger Dodger is one of the least compelling variations on this theme.",
+    "No good news: no growth or profit this quarter???",
+    "Good good good but bad bad",
+    "Tesla shares slump after weak deliveries; analysts cut targets.",
+    "Apple Inc. reports strong Q4 earnings, beats analyst expectations.",
+]
+
+
+class TestFastBackend:
+    """The compiled scorer must reproduce VADER's compound score."""
+
+    def test_matches_vader_on_reference_corpus(self) -> None:
+        for text in REFERENCE_CORPUS:
+            assert _score(text, "fast") == pytest.approx(_score(text, "vader"), abs=1e-4), text
+
+    def test_matches_vader_on_synthetic_news(self) -> None:
+        for text in make_corpus(500):
+            assert _score(text, "fast") == pytest.approx(_score(text, "vader"), abs=1e-4), text
+
+    def test_backend_option_and_separate_cache_entries(self) -> None:
+        cache = configure_sentiment_cache(max_entries=1024, max_bytes=1 << 20)
+        try:
+            text = REFERENCE_CORPUS[0]
+            assert analyze_sentiment(text, backend="fast") == analyze_sentiment(text)
+            assert len(cache) == 2
+            assert list(analyze_sentiment_batch(REFERENCE_CORPUS, backend="fast")) == pytest.approx(
+                [analyze_sentiment(t) for t in REFERENCE_CORPUS], abs=1e-4
+            )
+        finally:
+            configure_sentiment_cache(max_entries=65_536, max_bytes=16 * 1024 * 1024)
+
+    def test_unknown_backend_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown sentiment backend"):
+            analyze_sentiment("good", backend="textblob")  # type: ignore[arg-type]
@@ -0,0 +1,107 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from quantgpt.agents import ResearchAgent
+from quantgpt.agents.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main() -> list[str]:
+            return await asyncio.gather(*(flight.do("k", work) for _ in range(20)))
+
+        assert asyncio.run(main()) == ["result"] * 20
+        assert calls == 1
+
+    def test_distinct_keys_run_separately(self) -> None:
+        flight = SingleFlight()
+
+        async def main() -> list[str]:
+            async def work(value: str) -> str:
+                await asyncio.sleep(0)
+                return value
+
+            return await asyncio.gather(flight.do("a", lambda: work("a")), flight.do("b", lambda: work("b")))
+
+        assert asyncio.run(main()) == ["a", "b"]
+
+    def test_error_propagates_to_every_waiter(self) -> None:
+        flight = SingleFlight()
+
+        async def fail() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main() -> list:
+            return await asyncio.gather(*(flight.do("k", fail) for _ in range(5)), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        flight = SingleFlight()
+        release = None
+
+        async def work() -> str:
+            await release.wait()
+            return "done"
+
+        async def main() -> str:
+            nonlocal release
+            release = asyncio.Event()
+            first = asyncio.create_task(flight.do("k", work))
+            second = asyncio.create_task(flight.do("k", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == "done"
+
+    def test_key_is_released_after_completion(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        async def main() -> tuple[int, int, int]:
+            first = await flight.do("k", work)
+            second = await flight.do("k", work)
+            return first, second, flight.in_flight()
+
+        assert asyncio.run(main()) == (1, 2, 0)
+
+
+class TestResearchAgentCoalescing:
+    """ResearchAgent.arun coalesces identical concurrent queries."""
+
+    def test_burst_of_identical_queries_calls_llm_once(self) -> None:
+        # One scripted message: a second LLM call would raise.
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Shared insight")]))
+        agent = ResearchAgent(llm=llm)
+
+        async def main() -> list[str]:
+            return await asyncio.gather(*(agent.arun(q) for q in ["AAPL", "aapl", " AAPL "] * 5))
+
+        assert asyncio.run(main()) == ["Shared insight"] * 15
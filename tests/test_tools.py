@@ -57,3 +57,15 @@ class TestSentimentTool:
         tool = SentimentTool()
         result = tool.execute(text="")
         assert result == 0.0
+
+    def test_per_item_mode_scores_each_line(self) -> None:
+        tool = SentimentTool()
+        result = tool.execute(text="Great earnings beat!\n\nTerrible losses and awful outlook.", per_item=True)
+        assert len(result["scores"]) == 2
+        assert result["scores"][0] > 0 > result["scores"][1]
+        assert result["aggregate"] == pytest.approx(sum(result["scores"]) / 2)
+
+    def test_per_item_mode_accepts_items(self) -> None:
+        tool = SentimentTool()
+        result = tool.execute(items=[])
+        assert result == {"scores": [], "aggregate": 0.0}